@@ -0,0 +1,96 @@
+# benchmarks the memoized date parser against the check_date_format and create_date it replaced, run from the v1 directory with: python3 bench/bench_dates.py [dates] [distinct]
+# dates are drawn from a Zipf-like distribution over a few hundred distinct dates, the way offence and charging dates repeat across a corpus
+
+import os
+import sys
+import time
+import random
+import itertools
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import dates
+
+# ---
+
+# the previous validation and formatting, each splitting the date again
+def legacy_check_date_format(date:str) -> bool:
+    try:
+        day, month, year = map(int, date.split("/"))
+        return not (day < 1 or day > 31 or month < 1 or month > 12 or year < 1)
+    except (ValueError, IndexError):
+        return False
+
+def legacy_create_date(date:str) -> str | None:
+    day:str = date.split("/")[0]
+    year:str = date.split("/")[2]
+    match int(date.split("/")[1]):
+        case 1:
+            month:str = "January"
+        case 2:
+            month = "February"
+        case 3:
+            month = "March"
+        case 4:
+            month = "April"
+        case 5:
+            month = "May"
+        case 6:
+            month = "June"
+        case 7:
+            month = "July"
+        case 8:
+            month = "August"
+        case 9:
+            month = "September"
+        case 10:
+            month = "October"
+        case 11:
+            month = "November"
+        case 12:
+            month = "December"
+        case _:
+            return None
+    return f"{day} {month} {year}"
+
+def legacy(date:str) -> str | None:
+    return legacy_create_date(date) if legacy_check_date_format(date) else None
+
+def memoized(date:str) -> str | None:
+    parsed_date:dates.Date | None = dates.parse_date(date)
+    return parsed_date.text if parsed_date is not None else None
+
+def uncached(date:str) -> str | None:
+    parsed_date:dates.Date | None = dates.parse_date.__wrapped__(date)
+    return parsed_date.text if parsed_date is not None else None
+
+# ---
+
+def date_sample(count:int, distinct:int, seed:int = 0) -> list[str]:
+    rng:random.Random = random.Random(seed)
+    pool:list[str] = [f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2015, 2024)}" for _ in range(distinct)]
+    weights:list[float] = [1 / rank for rank in range(1, distinct + 1)]
+    return rng.choices(pool, weights=weights, k=count)
+
+def throughput(parse_fn, date_array:list[str]) -> float:
+    start:float = time.perf_counter()
+    for date in date_array:
+        parse_fn(date)
+    return len(date_array) / (time.perf_counter() - start)
+
+def main() -> None:
+    count:int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    distinct:int = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    date_array:list[str] = date_sample(count, distinct)
+    assert all(legacy(date) == memoized(date) for date in itertools.islice(date_array, 10000)), "outputs differ from the previous implementation"
+    dates.parse_date.cache_clear()
+    print(f"{count} dates, {distinct} distinct, Zipf-like")
+    legacy_rate:float = throughput(legacy, date_array)
+    print(f"legacy check + create   {legacy_rate:>12,.0f} dates/s")
+    uncached_rate:float = throughput(uncached, date_array)
+    print(f"parse_date, no cache    {uncached_rate:>12,.0f} dates/s  ({uncached_rate / legacy_rate:.2f}x)")
+    memoized_rate:float = throughput(memoized, date_array)
+    print(f"parse_date, memoized    {memoized_rate:>12,.0f} dates/s  ({memoized_rate / legacy_rate:.2f}x)")
+    print(f"cache                   {dates.parse_date.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks rendering from a .dcc file against lexing and interpreting the dc file again, run from the v1 directory with: python3 bench/bench_dcc.py [charges]
+# also compares rendering all six formats from one compile against compiling the file once per format, the way a backtick directive per run required
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import interpreter as inter
+import templates
+import compiled
+import source
+import corpus
+from records import DraftCharge
+
+# ---
+
+def compile_source(file_path:str) -> list[DraftCharge]:
+    vital_informations:list[DraftCharge] = []
+    with source.SourceFile(file_path) as source_file:
+        for draft_charge_count, (start, end) in enumerate(source_file.blocks(), start=1):
+            vital_informations.append(inter.compile_block("bench", source_file.buffer, draft_charge_count, None, start, end)[2])
+    return vital_informations
+
+def load_source(file_path:str) -> list[DraftCharge]:
+    with source.SourceFile(file_path) as source_file:
+        return compiled.load(file_path, compiled.source_key(source_file.buffer))
+
+def render_all(vital_informations:list[DraftCharge]) -> None:
+    for vital_information in vital_informations:
+        for output_format in templates.TEMPLATES:
+            templates.render(output_format, DraftCharge.from_tuple((output_format,) + vital_information.as_tuple()[1:]))
+
+def best_of(function, *args, runs:int = 3) -> float:
+    best:float = float("inf")
+    for _ in range(runs):
+        start:float = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as directory:
+        file_path:str = os.path.join(directory, "bench.dc")
+        corpus.write_corpus(file_path, charges)
+        vital_informations:list[DraftCharge] = compile_source(file_path)
+        with source.SourceFile(file_path) as source_file:
+            compiled.store(file_path, compiled.source_key(source_file.buffer), vital_informations)
+        assert load_source(file_path) == vital_informations
+        compile_seconds:float = best_of(compile_source, file_path)
+        load_seconds:float = best_of(load_source, file_path)
+        render_seconds:float = best_of(render_all, vital_informations)
+        print(f"{charges} charges, {os.path.getsize(file_path)} byte dc file, {os.path.getsize(compiled.dcc_path(file_path))} byte .dcc file")
+        print(f"{'lex and interpret':<32} {compile_seconds * 1e3:>9.1f} ms  {charges / compile_seconds:>10.0f} charges/s")
+        print(f"{'load .dcc':<32} {load_seconds * 1e3:>9.1f} ms  {charges / load_seconds:>10.0f} charges/s  {compile_seconds / load_seconds:>6.1f}x")
+        once_per_format:float = len(templates.TEMPLATES) * compile_seconds + render_seconds
+        print(f"{'six formats, compiled per format':<32} {once_per_format * 1e3:>9.1f} ms")
+        print(f"{'six formats, one compile':<32} {(compile_seconds + render_seconds) * 1e3:>9.1f} ms  {once_per_format / (compile_seconds + render_seconds):>17.1f}x")
+        print(f"{'six formats, from .dcc':<32} {(load_seconds + render_seconds) * 1e3:>9.1f} ms  {once_per_format / (load_seconds + render_seconds):>17.1f}x")
+
+if __name__ == "__main__":
+    main()
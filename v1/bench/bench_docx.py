@@ -0,0 +1,41 @@
+# benchmarks the native DOCX writer against TXT, one document per charge and every charge streamed into one, run from the v1 directory with: python3 bench/bench_docx.py [charges]
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import templates
+import docx_writer
+import corpus
+from bench_pdf import compile_corpus, render_each, timed
+from records import DraftCharge
+
+# ---
+
+def stream_into_one(vital_informations:list[DraftCharge], file_path:str) -> int:
+    with open(file_path, "wb") as fhand:
+        document:docx_writer.DocxDocument = docx_writer.DocxDocument(fhand)
+        for vital_information in vital_informations:
+            document.add_charge(vital_information)
+        document.close()
+    return os.path.getsize(file_path)
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if "DOCX" not in templates.NATIVE_WRITERS:
+        sys.exit("the native DOCX writer is disabled, unset DC4U_BACKEND")
+    with tempfile.TemporaryDirectory() as directory:
+        file_path:str = os.path.join(directory, "bench.dc")
+        corpus.write_corpus(file_path, charges)
+        vital_informations:list[DraftCharge] = compile_corpus(file_path)
+        print(f"{charges} charges")
+        for label, (seconds, size) in [
+            ("TXT template, one per charge", timed(render_each, "TXT", vital_informations)),
+            ("DOCX, one document per charge", timed(render_each, "DOCX", vital_informations)),
+            ("DOCX, streamed into one", timed(stream_into_one, vital_informations, os.path.join(directory, "bench.docx"))),
+        ]:
+            print(f"{label:<32} {seconds * 1e3:>9.1f} ms  {seconds / charges * 1e6:>8.1f} us/charge  {size / charges:>8.0f} bytes/charge")
+
+if __name__ == "__main__":
+    main()
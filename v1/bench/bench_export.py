@@ -0,0 +1,48 @@
+# benchmarks exporting charges to JSON Lines, CSV and columnar files against writing one TXT document per charge, run from the v1 directory with: python3 bench/bench_export.py [charges]
+
+import os
+import sys
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import export
+import output
+import templates
+import corpus
+from bench_pdf import compile_corpus, timed
+from records import DraftCharge
+
+# ---
+
+def write_documents(vital_informations:list[DraftCharge], directory:str) -> int:
+    writer:output.OutputWriter = output.OutputWriter(0, None, directory)
+    with contextlib.redirect_stdout(open(os.devnull, "w")): # one line is printed per file created
+        for number, vital_information in enumerate(vital_informations, start=1):
+            writer.write((f"bench-Draft-Charge-{number}.txt", templates.render("TXT", vital_information), vital_information))
+        writer.close()
+    return sum(os.path.getsize(os.path.join(directory, file_name)) for file_name in os.listdir(directory))
+
+def write_export(vital_informations:list[DraftCharge], export_path:str) -> int:
+    writer:export.ExportWriter = export.ExportWriter(export_path)
+    for number, vital_information in enumerate(vital_informations, start=1):
+        writer.write((f"bench-Draft-Charge-{number}.txt", "", vital_information))
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        writer.close()
+    return os.path.getsize(export_path)
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as directory:
+        file_path:str = os.path.join(directory, "bench.dc")
+        corpus.write_corpus(file_path, charges)
+        vital_informations:list[DraftCharge] = compile_corpus(file_path)
+        print(f"{charges} charges")
+        results:list[tuple[str, tuple[float, int]]] = [("TXT, one document per charge", timed(write_documents, vital_informations, os.path.join(directory, "documents")))]
+        for suffix in (".jsonl", ".csv", ".columns"):
+            results.append((f"export to {suffix}", timed(write_export, vital_informations, os.path.join(directory, f"bench{suffix}"))))
+        for label, (seconds, size) in results:
+            print(f"{label:<32} {seconds * 1e3:>9.1f} ms  {charges / seconds:>10.0f} charges/s  {size / charges:>8.0f} bytes/charge")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks building the SQLite index of compiled charges and looking charges up in it, run from the v1 directory with: python3 bench/bench_index.py [charges] [copies]
+# the compiled corpus is indexed under copies file names (default 10), so an index of millions of charges is built without compiling millions of blocks, 20000 50 builds one of a million
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import index
+import corpus
+from bench_pdf import compile_corpus
+from records import DraftCharge
+
+# ---
+
+def build_index(vital_informations:list[DraftCharge], copies:int, index_path:str) -> None:
+    writer:index.IndexWriter = index.IndexWriter(index_path)
+    for copy in range(copies):
+        for number, vital_information in enumerate(vital_informations, start=1):
+            writer.write((f"bench{copy}-Draft-Charge-{number}.txt", "", vital_information))
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        writer.close()
+
+def best_of(function, *args, runs:int = 5) -> tuple[float, object]:
+    best:float = float("inf")
+    for _ in range(runs):
+        start:float = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    copies:int = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as directory:
+        file_path:str = os.path.join(directory, "bench.dc")
+        corpus.write_corpus(file_path, charges)
+        vital_informations:list[DraftCharge] = compile_corpus(file_path)
+        index_path:str = os.path.join(directory, "bench.db")
+        start:float = time.perf_counter()
+        build_index(vital_informations, copies, index_path)
+        build_seconds:float = time.perf_counter() - start
+        start = time.perf_counter()
+        build_index(vital_informations, copies, index_path)
+        unchanged_seconds:float = time.perf_counter() - start
+        total:int = charges * copies
+        print(f"{total} charges, {os.path.getsize(index_path) / total:.0f} bytes/charge")
+        print(f"{'index':<32} {build_seconds * 1e3:>9.1f} ms  {total / build_seconds:>10.0f} charges/s")
+        print(f"{'index again, unchanged':<32} {unchanged_seconds * 1e3:>9.1f} ms  {total / unchanged_seconds:>10.0f} charges/s")
+        sample:DraftCharge = vital_informations[charges // 2]
+        connection = index.connect(index_path)
+        for label, lookup, options in [
+            ("nric", index.query, ["--nric", sample.suspect_nric]),
+            ("name prefix, limit 100", index.query, ["--name", sample.suspect_name.split()[0] + "*"]),
+            ("statute, count", index.count, ["--statute", sample.statute.strip()]),
+            ("offense date range, limit 100", index.query, ["--from", "1 January 2020", "--to", "31 January 2020"]),
+            ("officer and statute, limit 100", index.query, ["--officer", sample.charging_officer, "--statute", sample.statute.strip()]),
+            ("file and block", index.query, ["--file", f"bench{copies // 2}", "--block", str(charges // 2)]),
+        ]:
+            args:argparse.Namespace = index.parse_query_args([index_path] + options)
+            for option in ("date_from", "date_to"):
+                if getattr(args, option) is not None:
+                    setattr(args, option, index.query_ordinal(getattr(args, option)))
+            seconds, result = best_of(lookup, connection, args)
+            print(f"{label:<32} {seconds * 1e3:>9.2f} ms  {result if isinstance(result, int) else len(result):>10} charges")
+        connection.close()
+
+if __name__ == "__main__":
+    main()
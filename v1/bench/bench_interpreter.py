@@ -0,0 +1,49 @@
+# regression benchmark for interpreter.parser_interpreter on charges with thousands of delimiters, run from the v1 directory with: python3 bench/bench_interpreter.py
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import lexer as lx
+import interpreter as inter
+
+# --- 
+
+HEAD:str = "`TXT`<Tan Ah Kow;S1234567A;Chinese;35;M;Singaporean>"
+TAIL:str = "[Theft;12/02/2024;stole a handbag]@s379 Penal Code@{Sergeant Lim;IO, Bedok NPC;13/02/2024}"
+
+# pathological charges, each parameterised by the number of delimiters it contains
+def comment_heavy(count:int) -> str:
+    return HEAD + "#note#" * (count // 2) + TAIL
+
+def nested_suspect(count:int) -> str:
+    return "`TXT`" + "<" * count + "Tan Ah Kow;S1234567A;Chinese;35;M;Singaporean>" + TAIL
+
+def unmatched_officer(count:int) -> str:
+    return HEAD + "#x#" * (count // 2) + "[Theft;12/02/2024;stole]@s379@{Lim;IO;13/02/2024"
+
+def time_interpreter(charge:str, repeat:int=3) -> float:
+    token_array:list = lx.lexer(charge)
+    best:float = float("inf")
+    for _ in range(repeat):
+        start:float = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()): # diagnostics are expected for the unmatched cases
+            inter.parser_interpreter([("bench", token_array)])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# ---
+
+def main() -> None:
+    counts:list[int] = [1_000, 10_000, 100_000]
+    print(f"{'case':<20} {'delimiters':>12} {'time (s)':>10} {'us/delimiter':>14}")
+    for case in (comment_heavy, nested_suspect, unmatched_officer):
+        for count in counts:
+            elapsed:float = time_interpreter(case(count))
+            print(f"{case.__name__:<20} {count:>12} {elapsed:>10.4f} {elapsed / count * 1e6:>14.3f}")
+
+if __name__ == "__main__":
+    main()
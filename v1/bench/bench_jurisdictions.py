@@ -0,0 +1,94 @@
+# benchmarks the jurisdiction registry, run from the v1 directory with: python3 bench/bench_jurisdictions.py [charges]
+# starting for one jurisdiction is measured against loading and compiling every jurisdiction, each in a fresh process so nothing is cached yet
+# a batch cycling through every jurisdiction is measured rendering from the layouts compiled on first use against rebuilding them for every charge
+
+import os
+import sys
+import time
+import subprocess
+
+SOURCE_DIRECTORY:str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SOURCE_DIRECTORY)
+import interpreter as inter
+import templates
+import sections
+import layout
+import pdf_writer
+import docx_writer
+import jurisdictions
+from records import DraftCharge
+
+RENDERED_FORMATS:tuple[str, ...] = ("HTML", "TXT", "PDF", "DOCX")
+
+# jurisdiction --> a charge block written for it
+CHARGES:dict[str, str] = {
+    "singapore": "`HTML`\n<Tan Ah Kow;S1234567A;Chinese;35;M;Singaporean>\n[Theft;12/02/2024;stole a handbag]\n@s379 Penal Code@\n{Sergeant Lim;IO, Bedok NPC;13/02/2024}\n",
+    "malaysia": "`HTML`\n<Wong Mei Ling;880515145678;Chinese;36;F;Malaysian>\n[Theft;18/06/2024;committed theft of a handbag]\n@s379 Penal Code (Act 574)@\n{Inspektor Ahmad Razif;IO, IPD Dang Wangi;19/06/2024}\n",
+    "uk": "`HTML`\n<James Wilson;15/04/1990;42 Baker Street London>\n[Theft;12/06/2024;dishonestly appropriated a laptop;Oxford Street London]\n@s1 Theft Act 1968@\n{Detective Constable Brown;Metropolitan Police, CID;13/06/2024}\n",
+    "india": "`HTML`\n<Anil Mehta;30/01/1980;B204 Vasant Kunj New Delhi>\n[Cheating;12/02/2024;cheated the complainant;Connaught Place New Delhi]\n@s420 Indian Penal Code 1860@\n{Inspector Vikram Singh;Cyber Cell, Delhi Police;15/02/2024}\n",
+    "australia": "`HTML`\n<Michael Chen;28/03/1995;45 George Street Sydney>\n[Larceny;10/09/2024;stole a bicycle;Pitt Street Mall Sydney]\n@s117 Crimes Act 1900 (NSW)@\n{Senior Constable Davies;NSW Police, Sydney City LAC;11/09/2024}\n",
+}
+
+# loads and compiles the given jurisdictions in a fresh process, printing the seconds it took, the modules every jurisdiction shares are imported beforehand
+STARTUP:str = """
+import sys, time
+sys.path.insert(0, {source_directory!r})
+import templates, sections, pdf_writer, docx_writer
+start = time.perf_counter()
+for jurisdiction in {jurisdictions!r}:
+    sections.section_table(jurisdiction)
+    for output_format in ("HTML", "TXT"):
+        templates.compile_template(output_format, jurisdiction)
+    pdf_writer.compiled_layout(jurisdiction)
+    docx_writer.body_template(jurisdiction)
+print(time.perf_counter() - start, len([name for name in sys.modules if name.startswith("jurisdictions.")]))
+"""
+
+# ---
+
+def startup(jurisdiction_names:list[str], runs:int = 5) -> tuple[float, int]:
+    best:float = float("inf")
+    loaded:int = 0
+    for _ in range(runs):
+        seconds, loaded = subprocess.run([sys.executable, "-c", STARTUP.format(source_directory=SOURCE_DIRECTORY, jurisdictions=jurisdiction_names)], capture_output=True, text=True, check=True).stdout.split()
+        best = min(best, float(seconds))
+    return best, int(loaded)
+
+def clear_compiled() -> None:
+    templates.compiled_templates.clear()
+    for cached in (sections.section_table, layout.charge_layout, pdf_writer.compiled_layout, docx_writer.body_template):
+        cached.cache_clear()
+    return None
+
+def compile_and_render(blocks:list[tuple[str, str]], rebuild:bool) -> int:
+    size:int = 0
+    for draft_charge_count, (jurisdiction, dc) in enumerate(blocks, start=1):
+        if rebuild:
+            clear_compiled()
+        vital_information:DraftCharge = inter.compile_block("bench", dc, draft_charge_count, jurisdiction=jurisdiction)[2]
+        for output_format in RENDERED_FORMATS:
+            vital_information.output_format = output_format
+            size += len(templates.render(output_format, vital_information))
+    return size
+
+def timed(function, *args) -> float:
+    start:float = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"{'start for':<32} {'ms':>9}  {'modules':>10}")
+    for label, jurisdiction_names in [("one jurisdiction", ["uk"]), (f"all {len(jurisdictions.JURISDICTIONS)} jurisdictions", list(jurisdictions.JURISDICTIONS))]:
+        seconds, loaded = startup(jurisdiction_names)
+        print(f"{label:<32} {seconds * 1e3:>9.2f}  {loaded:>10}")
+    blocks:list[tuple[str, str]] = [(jurisdiction, CHARGES[jurisdiction]) for jurisdiction, _ in zip(list(CHARGES) * charges, range(charges))]
+    compile_and_render(blocks[:len(CHARGES)], False)
+    cached_seconds:float = timed(compile_and_render, blocks, False)
+    rebuilt_seconds:float = timed(compile_and_render, blocks, True)
+    print(f"{charges} charges cycling through {len(CHARGES)} jurisdictions, each rendered as {', '.join(RENDERED_FORMATS)}")
+    print(f"{'layouts rebuilt per charge':<32} {rebuilt_seconds * 1e3:>9.1f} ms  {charges / rebuilt_seconds:>10.0f} charges/s")
+    print(f"{'layouts compiled once':<32} {cached_seconds * 1e3:>9.1f} ms  {charges / cached_seconds:>10.0f} charges/s  {rebuilt_seconds / cached_seconds:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks lexer.lexer against input size, run from the v1 directory with: python3 bench/bench_lexer.py
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import lexer as lx
+
+# --- 
+
+# the previous lexer, which recompiled every pattern per token and re-sliced the remaining input, kept for comparison
+def legacy_lexer(input_string:str):
+    token_array:list = []
+    while input_string:
+        match_val = None
+        for data_type, regex_pattern in lx.grammer_pattern:
+            match_val = re.compile(regex_pattern).match(input_string)
+            if match_val:
+                matched_token = match_val.group(0)
+                token_array.append({"type": data_type, "value": matched_token})
+                input_string = input_string[len(matched_token):].lstrip()
+                break
+        if not match_val:
+            raise ValueError(f"Please follow the specified syntax: {input_string}")
+    return token_array
+
+# builds a single charge whose "to wit" paragraph is padded out to roughly size bytes
+def make_charge(size:int) -> str:
+    head:str = "`HTML`<Tan Ah Kow;S1234567A;Chinese;35;M;Singaporean>[Theft;12/02/2024;"
+    tail:str = "]@s379 Penal Code@{Sergeant Lim;IO, Bedok NPC;13/02/2024}"
+    filler:str = "stole a handbag containing cash and personal documents from the victim "
+    body:str = filler * max(1, (size - len(head) - len(tail)) // len(filler))
+    return head + body + tail
+
+def time_lexer(lexer_fn, input_string:str, repeat:int=3) -> float:
+    best:float = float("inf")
+    for _ in range(repeat):
+        start:float = time.perf_counter()
+        lexer_fn(input_string)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# ---
+
+def main() -> None:
+    sizes:list[int] = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+    legacy_limit:int = 100_000 # legacy lexer is quadratic, larger inputs take minutes
+    print(f"{'bytes':>12} {'tokens':>10} {'lexer (s)':>12} {'MB/s':>10} {'legacy (s)':>12}")
+    for size in sizes:
+        charge:str = make_charge(size)
+        token_count:int = len(lx.lexer(charge))
+        elapsed:float = time_lexer(lx.lexer, charge)
+        legacy:str = f"{time_lexer(legacy_lexer, charge, 1):>12.4f}" if size <= legacy_limit else f"{'-':>12}"
+        print(f"{len(charge):>12} {token_count:>10} {elapsed:>12.4f} {len(charge) / elapsed / 1e6:>10.2f} {legacy}")
+
+if __name__ == "__main__":
+    main()
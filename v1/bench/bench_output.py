@@ -0,0 +1,66 @@
+# benchmarks OutputWriter writing many small outputs with and without the write pool, run from the v1 directory with: python3 bench/bench_output.py [files] [directory] [latency ms]
+# point directory at a network mount, or give a latency added to every file write, to see the effect of overlapping high-latency writes
+
+import os
+import sys
+import time
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import atomic
+import output
+import templates
+from records import DraftCharge
+
+# ---
+
+def make_dc_array(count:int) -> list[tuple]:
+    draft_charge:DraftCharge = DraftCharge()
+    for field_name in ("suspect_name", "suspect_nric", "suspect_race", "suspect_gender", "suspect_nationality", "charge_title", "offense_date", "charge_explanation", "statute", "charging_officer", "role_div", "charging_date"):
+        setattr(draft_charge, field_name, field_name.replace("_", " ") + " ")
+    draft_charge.output_format, draft_charge.suspect_age = "TXT", 35
+    contents:str = templates.render("TXT", draft_charge)
+    return [(f"bench-Draft-Charge-{n}.txt", contents, draft_charge) for n in range(1, count + 1)]
+
+# the previous writer, a plain open/write/close per output on the calling thread
+def write_legacy(dc_array:list[tuple], directory:str, latency:float) -> None:
+    for dc_file_name, dc_file_contents, _ in dc_array:
+        time.sleep(latency)
+        fhand = open(os.path.join(directory, dc_file_name), "w")
+        fhand.write(dc_file_contents)
+        fhand.close()
+
+def write_with(dc_array:list[tuple], directory:str, write_workers:int) -> None:
+    writer = output.OutputWriter(1, None, directory, None, write_workers)
+    for dc in dc_array:
+        writer.write(dc)
+    writer.close()
+
+# ---
+
+def main() -> None:
+    count:int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    parent:str | None = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] else None
+    latency:float = float(sys.argv[3]) / 1e3 if len(sys.argv) > 3 else 0.0
+    dc_array:list[tuple] = make_dc_array(count)
+    if latency:
+        write_atomic = atomic.write_atomic
+        def slow_write_atomic(file_name:str, contents:str) -> None:
+            time.sleep(latency) # stands in for the round trip to a network share
+            write_atomic(file_name, contents)
+        atomic.write_atomic = slow_write_atomic
+    print(f"{'writer':<28} {'files':>8} {'seconds':>10} {'files/s':>12}")
+    runs:list[tuple[str, object]] = [("legacy open/write/close", lambda directory: write_legacy(dc_array, directory, latency))]
+    for write_workers in (0, 1, 4, 8, 16):
+        runs.append((f"atomic, {write_workers} write workers", lambda directory, write_workers=write_workers: write_with(dc_array, directory, write_workers)))
+    for label, run in runs:
+        with tempfile.TemporaryDirectory(dir=parent) as directory:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                start:float = time.perf_counter()
+                run(directory)
+                elapsed:float = time.perf_counter() - start
+        print(f"{label:<28} {count:>8} {elapsed:>10.4f} {count / elapsed:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks the native PDF writer, one document per charge and every charge streamed into one document, run from the v1 directory with: python3 bench/bench_pdf.py [charges]
+# TXT rendered from its template is measured alongside as the cost of the cheapest format
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import interpreter as inter
+import templates
+import pdf_writer
+import source
+import corpus
+from records import DraftCharge
+
+# ---
+
+def compile_corpus(file_path:str) -> list[DraftCharge]:
+    vital_informations:list[DraftCharge] = []
+    with source.SourceFile(file_path) as source_file:
+        for draft_charge_count, (start, end) in enumerate(source_file.blocks(), start=1):
+            vital_informations.append(inter.compile_block("bench", source_file.buffer, draft_charge_count, None, start, end)[2])
+    return vital_informations
+
+def render_each(output_format:str, vital_informations:list[DraftCharge]) -> int:
+    return sum(len(templates.render(output_format, vital_information)) for vital_information in vital_informations)
+
+def stream_into_one(vital_informations:list[DraftCharge], file_path:str) -> int:
+    with open(file_path, "wb") as fhand:
+        document:pdf_writer.PdfDocument = pdf_writer.PdfDocument(fhand)
+        for number, vital_information in enumerate(vital_informations, start=1):
+            document.add_charge(vital_information, f"{number}. {vital_information.suspect_name}")
+        document.close()
+    return os.path.getsize(file_path)
+
+def timed(function, *args) -> tuple[float, int]:
+    start:float = time.perf_counter()
+    size:int = function(*args)
+    return time.perf_counter() - start, size
+
+def main() -> None:
+    charges:int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if "PDF" not in templates.NATIVE_WRITERS:
+        sys.exit("the native PDF writer is disabled, unset DC4U_BACKEND")
+    with tempfile.TemporaryDirectory() as directory:
+        file_path:str = os.path.join(directory, "bench.dc")
+        corpus.write_corpus(file_path, charges)
+        vital_informations:list[DraftCharge] = compile_corpus(file_path)
+        print(f"{charges} charges")
+        for label, (seconds, size) in [
+            ("TXT template, one per charge", timed(render_each, "TXT", vital_informations)),
+            ("PDF, one document per charge", timed(render_each, "PDF", vital_informations)),
+            ("PDF, streamed into one", timed(stream_into_one, vital_informations, os.path.join(directory, "bench.pdf"))),
+        ]:
+            print(f"{label:<32} {seconds * 1e3:>9.1f} ms  {seconds / charges * 1e6:>8.1f} us/charge  {size / charges:>8.0f} bytes/charge")
+
+if __name__ == "__main__":
+    main()
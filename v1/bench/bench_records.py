@@ -0,0 +1,37 @@
+# measures per-charge CPU and peak memory of lexing and interpreting a 100k charge corpus, run from the v1 directory with: python3 bench/bench_records.py [charges]
+
+import os
+import sys
+import time
+import resource
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import lexer as lx
+import interpreter as inter
+
+CHARGE:str = "`TXT`<Tan Ah Kow;S1234567A;Chinese;35;M;Singaporean>[Theft;12/02/2024;stole a handbag containing cash and personal documents from the victim at Bedok]@s379 Penal Code@{Sergeant Lim;IO, Bedok NPC;13/02/2024}"
+
+# ---
+
+def main() -> None:
+    count:int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dc_array:list[str] = [CHARGE.replace("Tan Ah Kow", f"Suspect {n}") for n in range(count)]
+
+    baseline_rss:int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start:float = time.process_time()
+    overall_token_array:list[tuple] = [("bench", lx.lexer(dc)) for dc in dc_array]
+    lexed:float = time.process_time()
+    lex_rss:int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    dc_results:list[tuple] | None = inter.parser_interpreter(overall_token_array)
+    finished:float = time.process_time()
+    peak_rss:int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert dc_results is not None and len(dc_results) == count
+
+    print(f"charges                {count:>12}")
+    print(f"lex CPU per charge     {(lexed - start) / count * 1e6:>12.2f} us")
+    print(f"compile CPU per charge {(finished - lexed) / count * 1e6:>12.2f} us")
+    print(f"token arrays RSS       {(lex_rss - baseline_rss) / 1e3:>12.1f} MB") # ru_maxrss is in kilobytes on Linux
+    print(f"pipeline peak RSS      {(peak_rss - baseline_rss) / 1e3:>12.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks renderer.RendererPool against the stub renderer, run from the v1 directory with: python3 bench/bench_renderer.py
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import renderer
+
+STUB:str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_renderer.py")
+
+# --- 
+
+# the previous approach, one renderer process started per document
+def render_per_process(file_names:list[str], delay:float) -> None:
+    for file_name in file_names:
+        process = subprocess.Popen([sys.executable, STUB, str(delay)], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True)
+        process.communicate(f"{file_name}\n")
+
+def render_with_pool(file_names:list[str], delay:float, size:int) -> list[renderer.RenderResult]:
+    render_pool = renderer.RendererPool(size, [sys.executable, STUB, str(delay)])
+    for file_name in file_names:
+        render_pool.submit(file_name)
+    return render_pool.close()
+
+# ---
+
+def main() -> None:
+    count:int = 200
+    delay:float = 0.005 # simulated start up and per document render time
+    with tempfile.TemporaryDirectory() as directory:
+        file_names:list[str] = [os.path.join(directory, f"bench-Draft-Charge-{n}.rmd") for n in range(1, count + 1)]
+        for file_name in file_names:
+            open(file_name, "w").close()
+        start:float = time.perf_counter()
+        render_per_process(file_names, delay)
+        print(f"{'process per document':<24} {count / (time.perf_counter() - start):>10.1f} docs/s")
+        for size in (1, 2, 4, 8):
+            start = time.perf_counter()
+            results:list[renderer.RenderResult] = render_with_pool(file_names, delay, size)
+            elapsed:float = time.perf_counter() - start
+            failed:int = sum(result.exit_status != 0 for result in results)
+            print(f"{f'pool of {size}':<24} {count / elapsed:>10.1f} docs/s  ({failed} failed)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# load-tests the compile server against running main.py once per request, run from the v1 directory with: python3 bench/bench_server.py [--clients N] [--requests N] [--http]
+# each request is a single charge, the way a case-management app compiles charges one at a time
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import client
+import corpus
+
+MAIN:str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main.py")
+
+# ---
+
+def start_server(address:str) -> subprocess.Popen:
+    process = subprocess.Popen([sys.executable, MAIN, "--serve", address], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline:float = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            client.Client(address, timeout=1).close()
+            if not isinstance(client.parse_address(address), str):
+                client.Client(address, timeout=1).request({}) # an HTTP connection is only made by the first request
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"the compile server did not start on {address}")
+
+def percentile(latencies:list[float], fraction:float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+# every client thread keeps one connection open and sends its requests one after another
+def load_test(address:str, charges:list[str], clients:int, requests:int) -> tuple[list[float], float]:
+    latencies:list[float] = []
+    lock = threading.Lock()
+    def run_client(offset:int) -> None:
+        own_latencies:list[float] = []
+        with client.Client(address) as connection:
+            for n in range(requests):
+                start:float = time.perf_counter()
+                response:dict = connection.compile(charges[(offset + n) % len(charges)], f"load{offset}")
+                own_latencies.append(time.perf_counter() - start)
+                assert response.get("created") == 1, response
+        with lock:
+            latencies.extend(own_latencies)
+    threads:list[threading.Thread] = [threading.Thread(target=run_client, args=(offset,)) for offset in range(clients)]
+    start:float = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), time.perf_counter() - start
+
+# what each request costs without the server, a fresh interpreter compiling the charge to stdout
+def cold_start(charge:str, runs:int) -> list[float]:
+    latencies:list[float] = []
+    for _ in range(runs):
+        start:float = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, "--no-cache", "--stdout", "-"], input=charge.encode(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+def print_latencies(label:str, latencies:list[float]) -> None:
+    print(f"{label:<28} p50 {percentile(latencies, 0.5) * 1e3:>8.2f} ms  p95 {percentile(latencies, 0.95) * 1e3:>8.2f} ms  p99 {percentile(latencies, 0.99) * 1e3:>8.2f} ms")
+
+def parse_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the DC4U compile server.")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent client connections (default 8)")
+    parser.add_argument("--requests", type=int, default=250, help="requests sent by each client (default 250)")
+    parser.add_argument("--http", action="store_true", help="serve over localhost HTTP instead of a Unix domain socket")
+    parser.add_argument("--cold-runs", type=int, default=10, help="runs of main.py per request to compare against (default 10)")
+    return parser.parse_args(argv)
+
+def main() -> None:
+    args:argparse.Namespace = parse_args()
+    charges:list[str] = list(corpus.generate(200, formats=["HTML", "TXT", "MD"]))[::2] # generate yields each charge followed by its --- separator
+    with tempfile.TemporaryDirectory() as directory:
+        address:str = "127.0.0.1:18766" if args.http else os.path.join(directory, "dc4u.sock")
+        process:subprocess.Popen = start_server(address)
+        try:
+            latencies, seconds = load_test(address, charges, args.clients, args.requests)
+        finally:
+            process.terminate()
+            process.wait()
+    total:int = args.clients * args.requests
+    print(f"{total} single-charge requests from {args.clients} clients over {'HTTP' if args.http else 'a Unix domain socket'}")
+    print_latencies("server", latencies)
+    print(f"{'server throughput':<28} {total / seconds:>8.0f} requests/s")
+    print_latencies("main.py per request", cold_start(charges[0], args.cold_runs))
+
+if __name__ == "__main__":
+    main()
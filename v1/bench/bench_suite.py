@@ -0,0 +1,163 @@
+# per-stage and end-to-end benchmarks on a synthetic corpus, with JSON results that can be compared across commits
+# run from the v1 directory with: python3 bench/bench_suite.py [--charges N] [--words N] [--density D] [--output results.json] [--compare baseline.json]
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import lexer as lx
+import interpreter as inter
+import templates
+import output
+import source
+import corpus
+
+MAIN:str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main.py")
+RESULTS_VERSION:int = 1
+
+# ---
+
+def best_of(repeat:int, stage) -> tuple[float, object]:
+    best:float = float("inf")
+    result:object = None
+    for _ in range(repeat):
+        start:float = time.perf_counter()
+        result = stage()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def throughput(seconds:float, charges:int, size:int) -> dict:
+    return {"seconds": round(seconds, 6), "charges_per_s": round(charges / seconds, 1), "mb_per_s": round(size / seconds / 1e6, 3)}
+
+# times each stage of the pipeline in isolation, every stage is fed the output of the one before it
+def bench_stages(corpus_path:str, charges:int, size:int, repeat:int, output_directory:str) -> dict:
+    stages:dict = {}
+    with source.SourceFile(corpus_path) as source_file:
+        seconds, spans = best_of(repeat, lambda: list(source_file.blocks()))
+        stages["split"] = throughput(seconds, charges, size)
+        seconds, token_arrays = best_of(repeat, lambda: [lx.lexer(source_file.buffer, start, end) for start, end in spans])
+        stages["lex"] = throughput(seconds, charges, size)
+        stages["lex"]["tokens"] = sum(len(token_array) for token_array in token_arrays)
+    seconds, draft_charges = best_of(repeat, lambda: [inter.interpret_charge(("bench", token_array), n) for n, token_array in enumerate(token_arrays, start=1)])
+    stages["interpret"] = throughput(seconds, charges, size)
+    assert all(draft_charge is not None for draft_charge in draft_charges), "the generated corpus should be valid"
+    seconds, contents = best_of(repeat, lambda: [templates.render(draft_charge.output_format, draft_charge) for draft_charge in draft_charges])
+    stages["render"] = throughput(seconds, charges, size)
+    dc_array:list[tuple] = [inter.generate_charge("bench", n, draft_charge) + (draft_charge,) for n, draft_charge in enumerate(draft_charges, start=1)]
+    stages["write"] = throughput(best_of(repeat, lambda: write_all(dc_array, output_directory))[0], charges, size)
+    stages["write"]["bytes"] = sum(len(text) for text in contents)
+    return stages
+
+def write_all(dc_array:list[tuple], output_directory:str) -> None:
+    writer = output.OutputWriter(1, None, output_directory)
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull # silences the per-file messages
+        try:
+            for dc in dc_array:
+                writer.write(dc)
+            writer.close()
+        finally:
+            sys.stdout = stdout
+
+# runs main.py on the corpus as a user would, including interpreter startup, the best of repeat runs is kept
+# peak memory is the maximum resident set size of the main process, worker processes of --jobs are not included
+def bench_end_to_end(corpus_path:str, charges:int, size:int, output_directory:str, extra_args:list[str], repeat:int) -> dict:
+    best:float = float("inf")
+    peak_rss:int = 0
+    for _ in range(repeat):
+        start:float = time.perf_counter()
+        process = subprocess.Popen([sys.executable, MAIN, "--no-cache", "-o", output_directory, corpus_path] + extra_args, stdout=subprocess.DEVNULL)
+        _, status, rusage = os.wait4(process.pid, 0)
+        best = min(best, time.perf_counter() - start)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode != 0:
+            raise RuntimeError(f"main.py exited with status {process.returncode}")
+        peak_rss = max(peak_rss, rusage.ru_maxrss)
+    result:dict = throughput(best, charges, size)
+    result["peak_rss_mb"] = round(peak_rss / 1e3, 1) # ru_maxrss is in kilobytes on Linux
+    return result
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+# ---
+
+# seconds and peak memory are compared, lower is better, a change beyond threshold counts as a regression
+def compare(baseline:dict, results:dict, threshold:float) -> int:
+    regressions:int = 0
+    if baseline.get("corpus") != results["corpus"]:
+        print("warning: the baseline was measured on a different corpus")
+    print(f"\n{'metric':<28} {'baseline':>12} {'current':>12} {'change':>9}  (baseline {baseline.get('commit') or '?'})")
+    for group in ("stages", "end_to_end"):
+        for name, metrics in results[group].items():
+            for metric in ("seconds", "peak_rss_mb"):
+                if metric not in metrics or metric not in baseline.get(group, {}).get(name, {}):
+                    continue
+                before:float = baseline[group][name][metric]
+                after:float = metrics[metric]
+                change:float = (after - before) / before if before else 0.0
+                flag:str = "  REGRESSION" if change > threshold else ""
+                regressions += bool(flag)
+                print(f"{group + '.' + name + '.' + metric:<28} {before:>12.4f} {after:>12.4f} {change:>+8.1%}{flag}")
+    return regressions
+
+def print_results(results:dict) -> None:
+    print(f"corpus: {results['corpus']['charges']} charges, {results['corpus']['bytes'] / 1e6:.2f} MB, commit {results['commit'] or '?'}")
+    print(f"{'stage':<20} {'seconds':>10} {'charges/s':>12} {'MB/s':>10} {'peak RSS MB':>12}")
+    for group in ("stages", "end_to_end"):
+        for name, metrics in results[group].items():
+            peak:str = f"{metrics['peak_rss_mb']:>12.1f}" if "peak_rss_mb" in metrics else f"{'-':>12}"
+            print(f"{(name if group == 'stages' else 'e2e ' + name):<20} {metrics['seconds']:>10.4f} {metrics['charges_per_s']:>12.1f} {metrics['mb_per_s']:>10.3f} {peak}")
+
+def parse_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark each stage of DC4U and the whole pipeline on a synthetic corpus.")
+    parser.add_argument("--charges", type=int, default=20000, help="charges in the corpus (default 20000)")
+    parser.add_argument("--words", type=int, default=24, help="words in each charge's paragraph (default 24)")
+    parser.add_argument("--density", type=float, default=0.5, help="expected # comment # pairs per charge (default 0.5)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed (default 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best is kept (default 3)")
+    parser.add_argument("--output", metavar="FILE", help="write the results as JSON to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare against results previously written with --output, exits 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown counted as a regression by --compare (default 0.10)")
+    return parser.parse_args(argv)
+
+def main() -> None:
+    args:argparse.Namespace = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        corpus_path:str = os.path.join(directory, "corpus.dc")
+        size:int = corpus.write_corpus(corpus_path, args.charges, args.words, args.density, args.seed)
+        results:dict = {
+            "version": RESULTS_VERSION,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "corpus": {"charges": args.charges, "words": args.words, "density": args.density, "seed": args.seed, "bytes": size},
+            "stages": bench_stages(corpus_path, args.charges, size, args.repeat, os.path.join(directory, "stages")),
+            "end_to_end": {
+                "serial": bench_end_to_end(corpus_path, args.charges, size, os.path.join(directory, "serial"), [], args.repeat),
+                "batch": bench_end_to_end(corpus_path, args.charges, size, os.path.join(directory, "batch"), ["--jobs", "0"], args.repeat),
+            },
+        }
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as fhand:
+            json.dump(results, fhand, indent=2)
+            fhand.write("\n")
+    if args.compare:
+        with open(args.compare, "r") as fhand:
+            baseline:dict = json.load(fhand)
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
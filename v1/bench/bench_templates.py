@@ -0,0 +1,72 @@
+# benchmarks templates.render against the hand-written f-string generators it replaced, run from the v1 directory with: python3 bench/bench_templates.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import templates
+import jurisdictions
+from records import DraftCharge
+
+VITAL_INFORMATION:dict = {
+    "OUTPUT_FORMAT": "HTML", "SUSPECT_NAME": "Tan Ah Kow ", "SUSPECT_NRIC": "S1234567A ", "SUSPECT_RACE": "Chinese ", "SUSPECT_AGE": 35,
+    "SUSPECT_GENDER": "M ", "SUSPECT_NATIONALITY": "Singaporean ", "CHARGE_TITLE": "Theft ", "OFFENSE_DATE": "12 February 2024 ",
+    "CHARGE_EXPLANATION": "stole a handbag containing cash and personal documents from the victim ", "STATUTE": "s379 Penal Code ",
+    "CHARGING_OFFICER": "Sergeant Lim ", "ROLE_DIV": "IO, Bedok NPC ", "CHARGING_DATE": "13 February 2024 ",
+}
+
+# the same charge as the record the compiled templates render from
+DRAFT_CHARGE:DraftCharge = DraftCharge()
+for field_name, value in VITAL_INFORMATION.items():
+    setattr(DRAFT_CHARGE, field_name.lower(), value)
+
+# --- 
+
+# the previous generator, one f-string with a dict lookup per field, rebuilt on every call
+def legacy_txt_draft_charge_gen(vital_information_dict:dict) -> str:
+    final_charge_txt:str = f'''
+Criminal Procedure Code 2010
+(CHAPTER 68)
+REVISED EDITION 2012
+SECTIONS 123-125
+
+CHARGE
+
+You, 
+
+Name: {vital_information_dict["SUSPECT_NAME"]}
+NRIC: {vital_information_dict["SUSPECT_NRIC"]}
+RACE: {vital_information_dict["SUSPECT_RACE"]}
+AGE: {vital_information_dict["SUSPECT_AGE"]}
+SEX: {vital_information_dict["SUSPECT_GENDER"]}
+NATIONALITY: {vital_information_dict["SUSPECT_NATIONALITY"]}
+
+are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], to wit {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.
+
+{vital_information_dict["CHARGING_OFFICER"]}
+{vital_information_dict["ROLE_DIV"]}
+{vital_information_dict["CHARGING_DATE"]}
+                            '''
+    return final_charge_txt
+
+def throughput(render_fn, values, count:int) -> float:
+    start:float = time.perf_counter()
+    for _ in range(count):
+        render_fn(values)
+    return count / (time.perf_counter() - start)
+
+# ---
+
+def main() -> None:
+    count:int = 200_000
+    assert legacy_txt_draft_charge_gen(VITAL_INFORMATION) == templates.render("TXT", DRAFT_CHARGE)
+    print(f"{'renderer':<24} {'charges/s':>12}")
+    print(f"{'legacy f-string (TXT)':<24} {throughput(legacy_txt_draft_charge_gen, VITAL_INFORMATION, count):>12.0f}")
+    print(f"{'str.format_map (TXT)':<24} {throughput(templates.TEMPLATES['TXT'](jurisdictions.load(DRAFT_CHARGE.jurisdiction)).format_map, DRAFT_CHARGE.as_dict(), count):>12.0f}")
+    for output_format in templates.TEMPLATES:
+        compiled_template:templates.CompiledTemplate = templates.compile_template(output_format)
+        print(f"{f'compiled ({output_format})':<24} {throughput(compiled_template.render, DRAFT_CHARGE, count):>12.0f}")
+
+if __name__ == "__main__":
+    main()
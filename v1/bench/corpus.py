@@ -0,0 +1,93 @@
+# generates deterministic synthetic dc corpora patterned on samples/v2/*.dc, run from the v1 directory with: python3 bench/corpus.py out.dc [--charges N] [--words N] [--density D] [--seed S]
+# the same arguments always produce the same bytes, so benchmark results on different commits are measured on identical input
+
+import sys
+import random
+import argparse
+
+NAMES:list[str] = ["Tan Ah Kow", "Ahmad bin Hassan", "Wong Mei Ling", "Rajesh Kumar", "Lim Siew Hoon", "Muhammad Faizal", "Ng Boon Huat", "Priya d/o Suresh"]
+RACES:list[str] = ["Chinese", "Malay", "Indian", "Eurasian", "Others"]
+GENDERS:list[str] = ["M", "F"]
+NATIONALITIES:list[str] = ["Singaporean", "Malaysian", "Indian", "British", "Australian"]
+OFFENSES:list[tuple[str, str]] = [
+    ("Theft", "s379 Penal Code"),
+    ("Voluntarily Causing Hurt", "s323 Penal Code"),
+    ("Cheating", "s420 Penal Code"),
+    ("Criminal Breach of Trust", "s406 Penal Code"),
+    ("Mischief", "s426 Penal Code"),
+    ("Criminal Intimidation", "s506 Penal Code"),
+]
+OFFICERS:list[tuple[str, str]] = [
+    ("Sergeant Raj Kumar", "IO, Tampines NPC"),
+    ("Sergeant Lim", "IO, Bedok NPC"),
+    ("Inspector Tan Wei Ming", "IO, Central Division"),
+    ("Staff Sergeant Nur Aisyah", "IO, Jurong NPC"),
+]
+PARAGRAPH_WORDS:list[str] = [
+    "punched", "the", "victim", "in", "face", "causing", "a", "fracture", "to", "nasal", "bone", "at", "Block", "123", "Tampines", "Street", "11",
+    "stole", "handbag", "containing", "cash", "and", "personal", "documents", "from", "dishonestly", "induced", "complainant", "deliver", "SGD",
+    "5000", "on", "pretext", "of", "securing", "contract", "through", "fraudulent", "means", "near", "Orchard", "Road",
+]
+FORMATS:list[str] = ["HTML", "TXT", "MD", "RMD"] # PDF and DOCX need the render toolchain, so are left out of generated corpora by default
+
+# ---
+
+def random_date(rng:random.Random) -> str:
+    return f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2015, 2024)}"
+
+# a charge laid out one section per line like the samples, words is the length of its "to wit" paragraph
+# density is the expected number of # comment # pairs per charge, each placed before a random section
+def make_charge(rng:random.Random, words:int, density:float, formats:list[str]) -> str:
+    title, statute = rng.choice(OFFENSES)
+    officer, role_div = rng.choice(OFFICERS)
+    sections:list[str] = [
+        f"`{rng.choice(formats)}`",
+        f"<{rng.choice(NAMES)};S{rng.randint(1000000, 9999999)}{rng.choice('ABCDEFGHJ')};{rng.choice(RACES)};{rng.randint(16, 80)};{rng.choice(GENDERS)};{rng.choice(NATIONALITIES)}>",
+        f"[{title};{random_date(rng)};{' '.join(rng.choice(PARAGRAPH_WORDS) for _ in range(words))}]",
+        f"@{statute}@",
+        f"{{{officer};{role_div};{random_date(rng)}}}",
+    ]
+    comment_count:int = int(density) + (rng.random() < density - int(density))
+    for _ in range(comment_count):
+        sections.insert(rng.randint(0, len(sections)), f"# {title} under {statute} #")
+    return "\n".join(sections) + "\n"
+
+# yields the corpus in pieces so arbitrarily large corpora are written without being held in memory
+def generate(charges:int, words:int = 24, density:float = 0.5, seed:int = 0, formats:list[str] | None = None):
+    rng:random.Random = random.Random(seed)
+    for n in range(charges):
+        if n:
+            yield "---\n"
+        yield make_charge(rng, words, density, formats or FORMATS)
+
+def write_corpus(file_path:str, charges:int, words:int = 24, density:float = 0.5, seed:int = 0, formats:list[str] | None = None) -> int:
+    size:int = 0
+    with open(file_path, "w") as fhand:
+        for piece in generate(charges, words, density, seed, formats):
+            size += fhand.write(piece)
+    return size
+
+# ---
+
+def parse_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dc corpus.")
+    parser.add_argument("output", help="dc file to write, - for stdout")
+    parser.add_argument("--charges", type=int, default=1000, help="number of charges (default 1000)")
+    parser.add_argument("--words", type=int, default=24, help="words in each charge's paragraph (default 24)")
+    parser.add_argument("--density", type=float, default=0.5, help="expected # comment # pairs per charge (default 0.5)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument("--formats", default=",".join(FORMATS), help=f"comma separated output formats to draw from (default {','.join(FORMATS)})")
+    return parser.parse_args(argv)
+
+def main() -> None:
+    args:argparse.Namespace = parse_args()
+    formats:list[str] = args.formats.split(",")
+    if args.output == "-":
+        for piece in generate(args.charges, args.words, args.density, args.seed, formats):
+            sys.stdout.write(piece)
+        return None
+    size:int = write_corpus(args.output, args.charges, args.words, args.density, args.seed, formats)
+    print(f"wrote {args.charges} charges ({size / 1e6:.2f} MB) to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+# stand-in for render_worker.R speaking the same stdin/stdout protocol, used to exercise renderer.RendererPool without R
+# usage: DC4U_RENDERER="python3 bench/stub_renderer.py [seconds per document]" python3 src/main.py ...
+# writes <name>.pdf (or <name>.docx for officedown documents) next to each <name>.rmd it is given, and reports an error for any path that does not exist
+
+import os
+import sys
+import time
+
+def main() -> None:
+    delay:float = float(sys.argv[1]) if len(sys.argv) > 1 else 0.0
+    time.sleep(delay) # stands in for renderer start up
+    for line in sys.stdin:
+        file_name:str = line.strip()
+        time.sleep(delay)
+        if not os.path.exists(file_name):
+            print(f"DC4U-ERR cannot open file '{file_name}': No such file or directory", flush=True)
+            continue
+        with open(file_name) as fhand:
+            extension:str = ".docx" if "rdocx_document" in fhand.read() else ".pdf"
+        with open(os.path.splitext(file_name)[0] + extension, "w") as fhand:
+            fhand.write(f"rendered from {file_name}\n")
+        print("DC4U-OK", flush=True)
+
+if __name__ == "__main__":
+    main()
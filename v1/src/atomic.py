@@ -0,0 +1,38 @@
+# Atomic --> writes files through a temporary file in the same directory that is renamed over the destination, so a crash never leaves a half-written file behind
+
+import os
+import shutil
+import threading
+
+# ---
+
+# DONE ✅ 
+# unique to the process and thread writing it, so concurrent writers never share a temporary file
+def temporary_file_name(file_name:str) -> str:
+    directory, base_name = os.path.split(file_name)
+    return os.path.join(directory, f".{base_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+# DONE ✅ 
+def write_atomic(file_name:str, contents:str | bytes) -> None:
+    temporary:str = temporary_file_name(file_name)
+    try:
+        with open(temporary, "wb" if isinstance(contents, bytes) else "w") as fhand:
+            fhand.write(contents)
+        os.replace(temporary, file_name)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return None
+
+# DONE ✅ 
+def copy_atomic(source_file_name:str, file_name:str) -> None:
+    temporary:str = temporary_file_name(file_name)
+    try:
+        shutil.copyfile(source_file_name, temporary)
+        os.replace(temporary, file_name)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return None
@@ -0,0 +1,59 @@
+# Batch --> compiles the charge blocks of many dc files in parallel across a pool of worker processes
+
+import io
+import os
+import contextlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+import interpreter as inter
+import diagnostics as dg
+
+CHUNK_SIZE:int = 64 # charge blocks handed to a worker per task, amortises the inter-process overhead
+WINDOW_PER_WORKER:int = 4 # chunks kept in flight per worker, bounds memory however large the batch is
+
+# --- 
+
+# DONE ✅ 
+# runs inside a worker process, each job is (file_name, file_path, draft_charge_count, dc, offset of dc in its source, jurisdiction, whether to render the charge)
+# each result is (file_path, draft_charge_count, draft_charge or None if invalid, errors printed while compiling it, diagnostics of those errors)
+# results name the path of their source rather than its file name, which sources in different directories can share
+def compile_blocks(jobs:list[tuple]) -> list[tuple]:
+    results:list[tuple] = []
+    for file_name, file_path, draft_charge_count, dc, block_start, jurisdiction, render in jobs:
+        error_log = io.StringIO()
+        diagnostics:list[dg.Diagnostic] = []
+        with contextlib.redirect_stdout(error_log):
+            draft_charge:tuple | None = inter.compile_block(file_name, dc, draft_charge_count, diagnostics, jurisdiction=jurisdiction, render=render)
+        for diagnostic in diagnostics:
+            diagnostic.offset += block_start
+        results.append((file_path, draft_charge_count, draft_charge, error_log.getvalue(), diagnostics))
+    return results
+
+# ---
+
+# DONE ✅ 
+def chunk_jobs(jobs:Iterable[tuple], chunk_size:int) -> Iterator[list[tuple]]:
+    chunk:list[tuple] = []
+    for job in jobs:
+        chunk.append(job)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ---
+
+# DONE ✅ 
+# fans jobs out to the pool and yields their results in submission order, so output is deterministic regardless of which worker finishes first
+def batch_compile(jobs:Iterable[tuple], max_workers:int | None = None) -> Iterator[tuple]:
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending:deque[Future] = deque()
+        for chunk in chunk_jobs(jobs, CHUNK_SIZE):
+            pending.append(executor.submit(compile_blocks, chunk))
+            if len(pending) >= max_workers * WINDOW_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,219 @@
+# Bundle --> streams every compiled draft charge of a run into a single zip, tar, PDF, DOCX or concatenated HTML/TXT/MD document instead of one file per charge
+
+import io
+import os
+import sys
+import html
+import time
+import shutil
+import tarfile
+import zipfile
+import tempfile
+import renderer
+import templates
+import atomic
+import pdf_writer
+import docx_writer
+
+# bundle file suffix --> (kind, tarfile mode or document format), the kind of a bundle is chosen by its file name
+BUNDLE_KINDS:list[tuple[str, str, str]] = [
+    (".zip", "zip", ""),
+    (".tar.gz", "tar", "w:gz"),
+    (".tgz", "tar", "w:gz"),
+    (".tar", "tar", "w"),
+    (".html", "document", "HTML"),
+    (".txt", "document", "TXT"),
+    (".md", "document", "MD"),
+    (".pdf", "native", "PDF"),
+    (".docx", "native", "DOCX"),
+]
+
+# native document format --> document class charges are streamed into, each with add_charge(vital_information, title) and close
+NATIVE_DOCUMENTS:dict[str, type] = {
+    "PDF": pdf_writer.PdfDocument,
+    "DOCX": docx_writer.DocxDocument,
+}
+
+# document format --> (header, index entry, index footer, charge opening, footer), formatted with the fields named in each
+# the index fills the first page and every charge starts on a new one, a form feed in plain text and a CSS page break in HTML and Markdown
+DOCUMENT_PARTS:dict[str, tuple[str, str, str, str, str]] = {
+    "HTML": (
+        "<!DOCTYPE HTML>\n<html>\n<head>\n    <title>{title}</title>\n    <meta charset='UTF-8'>\n    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+        "    <style>.draft-charge {{ break-before: page; page-break-before: always; }}</style>\n</head>\n<body>\n    <h1>{title}</h1>\n    <ol>\n",
+        "        <li><a href=\"#charge-{number}\">{name}</a> {summary}</li>\n",
+        "    </ol>\n",
+        "<section class=\"draft-charge\" id=\"charge-{number}\">\n",
+        "</body>\n</html>\n",
+    ),
+    "TXT": (
+        "{title}\n\n",
+        "{number:>6}. {name} {summary}\n",
+        "",
+        "\f\n",
+        "",
+    ),
+    "MD": (
+        "# {title}\n\n",
+        "{number}. [{name}](#charge-{number}) {summary}\n",
+        "",
+        "\n<div style=\"page-break-before: always\"></div>\n<a id=\"charge-{number}\"></a>\n",
+        "",
+    ),
+}
+
+# ---
+
+# DONE ✅ 
+def bundle_kind(bundle_path:str) -> tuple[str, str] | None:
+    for suffix, kind, mode in BUNDLE_KINDS:
+        if bundle_path.lower().endswith(suffix):
+            return (kind, mode)
+    return None
+
+# DONE ✅ 
+# the body of a charge rendered as a whole HTML page, so charges can share one page
+def html_body(contents:str) -> str:
+    start:int = contents.find("<body>")
+    end:int = contents.rfind("</body>")
+    if start == -1 or end == -1:
+        return contents
+    return contents[start + len("<body>"):end]
+
+# ---
+
+# DONE ✅ 
+# drop-in replacement for output.OutputWriter, charges are added to the bundle as they are written so memory use does not grow with the number of charges
+# the bundle is written under a temporary name and renamed into place by close, so an interrupted run never leaves a truncated bundle
+# archives hold each charge under its usual output file name, PDF and DOCX charges are rendered in a scratch directory and added once rendered
+# documents hold every charge rendered in the document's format, the index is only known once every charge is in, so charges are spooled to a temporary file that is copied in after it
+# PDF and DOCX bundles have every charge laid out straight into them by pdf_writer or docx_writer, a PDF's outline standing in for the index
+class BundleWriter:
+
+    def __init__(self, bundle_path:str, render_workers:int, output_directory:str = "") -> None:
+        self.bundle_path:str = os.path.join(output_directory, bundle_path)
+        self.kind, self.mode = bundle_kind(bundle_path)
+        self.render_pool:renderer.RendererPool | None = None # started for the first PDF/DOCX charge of an archive
+        self.render_workers:int = render_workers
+        self.rendered:dict[str, str] = {} # .rmd file name in the scratch directory --> member name of the rendered file
+        self.scratch_directory:str | None = None
+        self.charge_count:int = 0
+        self.index:list[tuple[str, str]] = [] # (file name, summary) of each charge in a document
+        if os.path.dirname(self.bundle_path):
+            os.makedirs(os.path.dirname(self.bundle_path), exist_ok=True)
+        self.temporary:str = atomic.temporary_file_name(self.bundle_path)
+        match self.kind:
+            case "zip":
+                self.archive = zipfile.ZipFile(self.temporary, "w", zipfile.ZIP_DEFLATED)
+            case "tar":
+                self.archive = tarfile.open(self.temporary, self.mode)
+            case "native":
+                self.fhand = open(self.temporary, "wb")
+                self.document = NATIVE_DOCUMENTS[self.mode](self.fhand)
+            case "document":
+                self.spool = tempfile.TemporaryFile("w+", prefix="dc4u-bundle-", dir=os.path.dirname(self.bundle_path) or ".")
+
+    # dc is a compiled draft charge, (output file name, contents, vital information)
+    def write(self, dc:tuple) -> None:
+        self.charge_count += 1
+        if self.kind == "document":
+            self.write_document(dc)
+            return None
+        if self.kind == "native":
+            vital_information = dc[2]
+            self.document.add_charge(vital_information, f"{self.charge_count}. {vital_information.suspect_name}, {vital_information.charge_title}, {vital_information.offense_date}")
+            print(f"DC4U has bundled your file: {dc[0].split('|')[0]}")
+            return None
+        if "|" not in dc[0]:
+            self.add_member(dc[0], dc[1] if isinstance(dc[1], bytes) else dc[1].encode())
+            print(f"DC4U has bundled your file: {dc[0]}")
+            return None
+        if self.render_pool is None:
+            self.render_pool = renderer.RendererPool(self.render_workers)
+            self.scratch_directory = tempfile.mkdtemp(prefix="dc4u-bundle-")
+        rmd_file_name:str = os.path.join(self.scratch_directory, f"{self.charge_count}-{os.path.basename(dc[0].split('|')[0])}")
+        with open(rmd_file_name, "w") as fhand:
+            fhand.write(dc[1])
+        self.rendered[rmd_file_name] = os.path.splitext(dc[0].split("|")[0])[0] + (".pdf" if dc[0].endswith("|PDF") else ".docx")
+        self.render_pool.submit(rmd_file_name)
+        return None
+
+    def add_member(self, member_name:str, contents:bytes) -> None:
+        if self.kind == "zip":
+            self.archive.writestr(member_name, contents)
+            return None
+        info:tarfile.TarInfo = tarfile.TarInfo(member_name)
+        info.size = len(contents)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self.archive.addfile(info, io.BytesIO(contents))
+        return None
+
+    def write_document(self, dc:tuple) -> None:
+        vital_information = dc[2]
+        contents:str = templates.render(self.mode, vital_information)
+        name:str = os.path.splitext(dc[0].split("|")[0])[0]
+        summary:str = f"{vital_information.suspect_name}, {vital_information.charge_title}, {vital_information.offense_date}"
+        opening:str = DOCUMENT_PARTS[self.mode][3]
+        if self.mode == "HTML":
+            contents = html_body(contents) + "</section>\n"
+            name, summary = html.escape(name), html.escape(summary)
+        self.spool.write(opening.format(number=self.charge_count))
+        self.spool.write(contents if contents.endswith("\n") else contents + "\n")
+        self.index.append((name, summary))
+        print(f"DC4U has bundled your file: {dc[0].split('|')[0]}")
+        return None
+
+    # waits for outstanding renders and adds the rendered files to the archive in the order their charges were written
+    def flush(self) -> None:
+        if self.render_pool is not None:
+            self.finish_renders(self.render_pool.flush())
+        return None
+
+    def finish_renders(self, render_results:list[renderer.RenderResult]) -> None:
+        for result in render_results:
+            member_name:str = self.rendered.pop(result.file_name)
+            rendered_file_name:str = os.path.splitext(result.file_name)[0] + os.path.splitext(member_name)[1]
+            if result.exit_status == 0 and os.path.exists(rendered_file_name):
+                with open(rendered_file_name, "rb") as fhand:
+                    self.add_member(member_name, fhand.read())
+                os.remove(rendered_file_name)
+                print(f"DC4U has bundled your file: {member_name} (rendered in {result.seconds:.2f}s)")
+            else:
+                print(f"DC4U could not render {member_name} (exit status {result.exit_status}): {result.message}", file=sys.stderr)
+            os.remove(result.file_name)
+        return None
+
+    def close(self) -> None:
+        try:
+            if self.kind == "document":
+                self.finish_document()
+            elif self.kind == "native":
+                self.document.close()
+                self.fhand.close()
+            else:
+                if self.render_pool is not None:
+                    self.finish_renders(self.render_pool.close())
+                    shutil.rmtree(self.scratch_directory, ignore_errors=True)
+                self.archive.close()
+            os.replace(self.temporary, self.bundle_path)
+        except BaseException:
+            if os.path.exists(self.temporary):
+                os.remove(self.temporary)
+            raise
+        print(f"DC4U has created your bundle: {self.bundle_path} ({self.charge_count} draft charge(s))")
+        return None
+
+    # writes the header and index, then copies the spooled charges in after them a block at a time
+    def finish_document(self) -> None:
+        header, entry, index_footer, _, footer = DOCUMENT_PARTS[self.mode]
+        title:str = f"Draft Charges ({self.charge_count})"
+        with open(self.temporary, "w") as fhand:
+            fhand.write(header.format(title=title))
+            for number, (name, summary) in enumerate(self.index, start=1):
+                fhand.write(entry.format(number=number, name=name, summary=summary))
+            fhand.write(index_footer)
+            self.spool.seek(0)
+            shutil.copyfileobj(self.spool, fhand)
+            fhand.write(footer)
+        self.spool.close()
+        return None
@@ -0,0 +1,76 @@
+# Cache --> content-addressed store of rendered outputs, so charges that have not changed since the last run are not written or rendered again
+
+import os
+import json
+import filecmp
+import hashlib
+import templates
+import atomic
+from records import DraftCharge
+
+CACHE_DIRECTORY:str = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "dc4u")
+CACHE_SIZE:int = 256 * 1024 * 1024 # bytes kept before the least recently used outputs are evicted
+
+# ---
+
+# DONE ✅ 
+# entries are named by a hash of the charge's vital information, its output format and the template version, and hold the final output (the rendered .pdf/.docx for PDF and DOCX)
+class OutputCache:
+
+    def __init__(self, directory:str = CACHE_DIRECTORY, max_bytes:int = CACHE_SIZE) -> None:
+        self.directory:str = directory
+        self.max_bytes:int = max_bytes
+        self.pending:dict[str, tuple[str, str]] = {} # .rmd file name --> (key, rendered file name) awaiting the render pool
+        self.stats:dict[str, int] = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, vital_information:DraftCharge) -> str:
+        normalised:str = json.dumps(vital_information.as_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{templates.template_version(vital_information.jurisdiction)}\0{vital_information.output_format}\0{normalised}".encode()).hexdigest()
+
+    def entry(self, key:str, file_name:str) -> str:
+        return os.path.join(self.directory, key + os.path.splitext(file_name)[1])
+
+    # restores a cached output to file_name unless it is already identical, returns False on a miss
+    def fetch(self, key:str, file_name:str) -> bool:
+        entry:str = self.entry(key, file_name)
+        if not os.path.exists(entry):
+            self.stats["misses"] += 1
+            return False
+        os.utime(entry) # marks the entry as recently used
+        if not (os.path.exists(file_name) and filecmp.cmp(entry, file_name, shallow=False)):
+            atomic.copy_atomic(entry, file_name)
+        self.stats["hits"] += 1
+        return True
+
+    def store(self, key:str, file_name:str) -> None:
+        atomic.copy_atomic(file_name, self.entry(key, file_name))
+        self.stats["stored"] += 1
+
+    # PDF and DOCX outputs are only stored once the render pool reports them rendered
+    def expect(self, key:str, dc_file_name:str, rendered_file_name:str) -> None:
+        self.pending[dc_file_name] = (key, rendered_file_name)
+
+    def store_rendered(self, render_results:list) -> None:
+        for result in render_results:
+            if result.exit_status == 0 and result.file_name in self.pending:
+                key, rendered_file_name = self.pending.pop(result.file_name)
+                if os.path.exists(rendered_file_name):
+                    self.store(key, rendered_file_name)
+        self.pending.clear()
+
+    # evicts the least recently used entries until the cache fits within max_bytes
+    def close(self) -> None:
+        entries:list[os.DirEntry] = [entry for entry in os.scandir(self.directory) if entry.is_file()]
+        total_bytes:int = sum(entry.stat().st_size for entry in entries)
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= entry.stat().st_size
+            os.remove(entry.path)
+            self.stats["evicted"] += 1
+
+    def report(self) -> None:
+        entries:list[os.DirEntry] = [entry for entry in os.scandir(self.directory) if entry.is_file()]
+        total_bytes:int = sum(entry.stat().st_size for entry in entries)
+        print(f"DC4U cache: {self.stats['hits']} hits, {self.stats['misses']} misses, {self.stats['stored']} stored, {self.stats['evicted']} evicted, {len(entries)} entries ({total_bytes / 1024:.1f} KB) in {self.directory}")
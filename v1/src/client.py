@@ -0,0 +1,129 @@
+# Client --> tiny client for the compile server started with main.py --serve, run from the v1 directory with: python3 src/client.py ADDRESS FILE.dc [--name NAME] [-o DIR] [--server-output-dir DIR]
+
+import os
+import sys
+import json
+import base64
+import socket
+import argparse
+import http.client
+
+DEFAULT_PORT:int = 8765
+
+# ---
+
+# DONE ✅ 
+# an address with a : is a [HOST]:PORT to serve HTTP on (HOST defaults to 127.0.0.1), a bare port number also serves HTTP, anything else is the path of a Unix domain socket
+def parse_address(address:str) -> tuple[str, int] | str:
+    if address.isdigit():
+        return ("127.0.0.1", int(address))
+    if ":" in address:
+        host, port = address.rsplit(":", 1)
+        return (host or "127.0.0.1", int(port or DEFAULT_PORT))
+    return address
+
+# ---
+
+# DONE ✅ 
+# one connection to a compile server, reused for every request sent through it
+class Client:
+
+    def __init__(self, address:str, timeout:float | None = None) -> None:
+        self.address:tuple[str, int] | str = parse_address(address)
+        if isinstance(self.address, str):
+            self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.connection.settimeout(timeout)
+            self.connection.connect(self.address)
+            self.reader = self.connection.makefile("rb")
+        else:
+            self.connection = http.client.HTTPConnection(*self.address, timeout=timeout)
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self.address, str):
+            self.reader.close()
+        self.connection.close()
+
+    # sends a request, as described in server.py, and returns the server's response
+    def request(self, request:dict) -> dict:
+        body:bytes = json.dumps(request).encode()
+        if isinstance(self.address, str):
+            self.connection.sendall(body + b"\n")
+            line:bytes = self.reader.readline()
+            if not line:
+                raise ConnectionError("the compile server closed the connection")
+            return json.loads(line)
+        self.connection.request("POST", "/compile", body, {"Content-Type": "application/json"})
+        return json.loads(self.connection.getresponse().read())
+
+    def compile(self, dc:str, name:str = "request", output_directory:str | None = None, jurisdiction:str | None = None) -> dict:
+        request:dict = {"dc": dc, "name": name}
+        if output_directory:
+            request["output_dir"] = output_directory
+        if jurisdiction:
+            request["jurisdiction"] = jurisdiction
+        return self.request(request)
+
+# ---
+
+# DONE ✅ 
+# writes the outputs returned in a response under output_directory, outputs the server wrote itself are only listed
+def save_outputs(response:dict, output_directory:str) -> None:
+    for result in response["outputs"]:
+        if "error" in result:
+            print(f"DC4U could not render {result['file']}: {result['error']}", file=sys.stderr)
+        elif "path" in result:
+            print(f"DC4U has created your file: {result['path']}")
+        else:
+            file_name:str = os.path.join(output_directory, result["file"])
+            with open(file_name, "wb") as fhand:
+                fhand.write(base64.b64decode(result["contents_base64"]) if "contents_base64" in result else result["contents"].encode())
+            print(f"DC4U has created your file: {file_name}")
+    return None
+
+def parse_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="dc4u-client", description="Send a dc file to a DC4U compile server.")
+    parser.add_argument("address", help="address the server was started with, a Unix domain socket path or [HOST]:PORT")
+    parser.add_argument("file", help="dc file to compile, - reads from stdin")
+    parser.add_argument("--name", help="name outputs are written under (default the file's name)")
+    parser.add_argument("--output-dir", "-o", default="", metavar="DIR", help="directory the returned outputs are written to (default the current directory)")
+    parser.add_argument("--server-output-dir", metavar="DIR", help="have the server write outputs to DIR under the output root it was started with (--serve-output-root) and return their paths instead")
+    parser.add_argument("--jurisdiction", metavar="NAME", help="jurisdiction the charges are laid out for (default singapore)")
+    parser.add_argument("--json", action="store_true", help="print the server's response as JSON instead of writing outputs")
+    return parser.parse_args(argv)
+
+def main() -> None:
+    args:argparse.Namespace = parse_args()
+    if args.file == "-":
+        dc:str = sys.stdin.read()
+    else:
+        with open(args.file, "r") as fhand:
+            dc = fhand.read()
+    name:str = args.name or ("stdin" if args.file == "-" else os.path.basename(args.file).split(".")[0])
+    try:
+        with Client(args.address) as client:
+            response:dict = client.compile(dc, name, args.server_output_dir, args.jurisdiction)
+    except OSError as e:
+        print(f"Error log: could not reach the compile server at {args.address}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if args.json:
+        json.dump(response, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif "error" in response:
+        print(f"Error log: {response['error']}", file=sys.stderr)
+    else:
+        for diagnostic in response["diagnostics"]:
+            print(f"{diagnostic['file']}:{diagnostic['line']}:{diagnostic['column']}: {diagnostic['message']}", file=sys.stderr)
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        save_outputs(response, args.output_dir)
+    if "error" in response or response["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Compiled --> .dcc files kept next to each dc file, holding its validated charges so later runs render them without lexing or interpreting the source again
+
+import os
+import sys
+import marshal
+import hashlib
+from array import array
+from functools import cache
+import atomic
+from records import DraftCharge, DRAFT_CHARGE_FIELDS, DEFAULT_JURISDICTION
+from jurisdictions import JURISDICTIONS
+
+DCC_SUFFIX:str = ".dcc"
+DCC_MAGIC:bytes = b"DCC1"
+COMPILER_MODULES:tuple[str, ...] = ("lexer", "interpreter", "sections", "dates", "records", "jurisdictions/__init__", *(f"jurisdictions/{jurisdiction}" for jurisdiction in JURISDICTIONS)) # modules deciding what a charge compiles to
+AGE_INDEX:int = DRAFT_CHARGE_FIELDS.index("suspect_age")
+
+# a .dcc file is DCC_MAGIC, the 32 byte key of the source it was compiled from, then the charges marshalled column by column
+# each column holds one field of every charge in order, ages are packed into an array('i')
+# every other column is dictionary encoded, its distinct strings followed by an array('i') of each charge's index into them, since names, statutes, officers and dates repeat across a file
+# only sources whose every charge block is valid get a .dcc file, so invalid charges are always compiled again and their errors reported
+
+# ---
+
+# DONE ✅ 
+# hash of the compiler's own source, a .dcc file written by a compiler that has since changed is not used
+@cache
+def compiler_version() -> bytes:
+    digest = hashlib.sha256()
+    directory:str = os.path.dirname(os.path.abspath(__file__))
+    for module_name in COMPILER_MODULES:
+        with open(os.path.join(directory, f"{module_name}.py"), "rb") as fhand:
+            digest.update(fhand.read())
+    digest.update(sys.version.encode()) # marshal's format is only stable within a python version
+    return digest.digest()
+
+# DONE ✅ 
+# the same source compiles to different charges under different jurisdictions, so each has its own key
+def source_key(buffer:bytes, jurisdiction:str = DEFAULT_JURISDICTION) -> bytes:
+    return hashlib.sha256(compiler_version() + jurisdiction.encode() + b"\0" + buffer).digest()
+
+# DONE ✅ 
+def dcc_path(file_path:str) -> str:
+    return os.path.splitext(file_path)[0] + DCC_SUFFIX
+
+# ---
+
+# DONE ✅ 
+# the charges compiled from the source whose key is given, None when there is no .dcc file for it or it was compiled from something else
+def load(file_path:str, key:bytes) -> list[DraftCharge] | None:
+    try:
+        with open(dcc_path(file_path), "rb") as fhand:
+            if fhand.read(len(DCC_MAGIC) + len(key)) != DCC_MAGIC + key:
+                return None
+            columns:list = list(marshal.load(fhand))
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    for i, column in enumerate(columns):
+        if i == AGE_INDEX:
+            columns[i] = array("i", column)
+        else:
+            values, indices = column
+            columns[i] = [values[index] for index in array("i", indices)]
+    return [DraftCharge.from_tuple(values) for values in zip(*columns)]
+
+# DONE ✅ 
+# a .dcc file that cannot be written, such as next to a read-only source, is left out without failing the run
+def store(file_path:str, key:bytes, vital_informations:list[DraftCharge]) -> None:
+    columns:list = []
+    try:
+        for field in DRAFT_CHARGE_FIELDS:
+            column:list = [getattr(vital_information, field) for vital_information in vital_informations]
+            if field == "suspect_age":
+                columns.append(array("i", column).tobytes())
+                continue
+            positions:dict[str, int] = {}
+            indices:array = array("i", [positions.setdefault(value, len(positions)) for value in column])
+            columns.append((tuple(positions), indices.tobytes()))
+        atomic.write_atomic(dcc_path(file_path), DCC_MAGIC + key + marshal.dumps(tuple(columns)))
+    except (OSError, OverflowError): # OverflowError for an age too large for an array('i')
+        pass
+    return None
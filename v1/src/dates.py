@@ -0,0 +1,48 @@
+# Dates --> parses DD/MM/YYYY dates into compact values, memoized since a corpus repeats the same few hundred dates across every charge
+
+import calendar
+import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+DATE_CACHE_SIZE:int = 4096 # distinct dates kept parsed, least recently used first out
+
+MONTH_NAMES:tuple[str, ...] = ("", "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December")
+DAYS_IN_MONTH:tuple[int, ...] = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# ---
+
+# text is the date as written in a charge, the day and year are kept exactly as typed (leading zeros and surrounding whitespace included) so outputs are unchanged
+class Date(NamedTuple):
+    day:int
+    month:int
+    year:int
+    text:str
+
+# ---
+
+# DONE ✅ 
+def days_in_month(month:int, year:int) -> int:
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return DAYS_IN_MONTH[month]
+
+# DONE ✅ 
+# raises ValueError when the date is not three / separated integers, returns None for a date that does not exist such as 31/02 or 29/02 outside a leap year
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(date:str) -> Date | None:
+    day_text, month_text, year_text = date.split("/")
+    day, month, year = int(day_text), int(month_text), int(year_text)
+    if month < 1 or month > 12 or year < 1 or day < 1 or day > days_in_month(month, year):
+        return None
+    return Date(day, month, year, f"{day_text} {MONTH_NAMES[month]} {year_text}")
+
+# DONE ✅ 
+# proleptic Gregorian ordinal (1 January of year 1 is day 1) of a date as parse_date wrote it out, 0 for an empty date or one datetime cannot hold
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def date_ordinal(text:str) -> int:
+    try:
+        day_text, month_name, year_text = text.split()
+        return datetime.date(int(year_text), MONTH_NAMES.index(month_name), int(day_text)).toordinal()
+    except ValueError:
+        return 0
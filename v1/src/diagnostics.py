@@ -0,0 +1,134 @@
+# Diagnostics --> structured errors collected while compiling, so every invalid charge of a file is reported in one pass instead of stopping at the first
+
+import sys
+import json
+import lexer as lx
+from source import SourceFile
+
+# error codes follow the existing Error Code 000x scheme, 0001 to 0011 are internal errors that valid or invalid input should never reach
+ERROR_CODES:dict[str, str] = {
+    "0001": "internal error in output format",
+    "0002": "internal error in output generation",
+    "0003": "internal error, unknown token",
+    "0004": "internal error in comment",
+    "0005": "internal error in suspect information",
+    "0006": "internal error in charge information",
+    "0007": "internal error in charge information",
+    "0008": "internal error in charging officer information",
+    "0009": "internal error in charging officer information",
+    "0010": "internal error in statute information",
+    "0011": "internal error in suspect information",
+    "0012": "multiple output formats",
+    "0013": "unrecognised output format",
+    "0014": "unmatched output format character",
+    "0015": "multiple suspect information",
+    "0016": "unmatched suspect information character <",
+    "0017": "unmatched suspect information character >",
+    "0018": "wrong number of suspect information arguments",
+    "0019": "suspect age is not an integer",
+    "0020": "multiple charge information",
+    "0021": "unmatched charge information character [",
+    "0022": "unmatched charge information character ]",
+    "0023": "wrong number of charge information arguments",
+    "0024": "invalid date",
+    "0025": "multiple statutes",
+    "0026": "unmatched statute information character @",
+    "0027": "empty statute",
+    "0028": "multiple charging officer information",
+    "0029": "unmatched charging officer information character {",
+    "0030": "unmatched charging officer information character }",
+    "0031": "wrong number of charging officer information arguments",
+    "0032": "unmatched comment character #",
+    "0033": "required information not provided",
+    "0034": "syntax the lexer does not recognise",
+}
+
+# ---
+
+# DONE ✅ 
+# token_offset indexes the token array of the charge and offset is the byte offset of that token in the source
+# line and column are 1-based and filled in by locate once the source is known
+class Diagnostic:
+
+    __slots__ = ("code", "message", "file_path", "draft_charge_count", "token_offset", "offset", "line", "column")
+
+    def __init__(self, code:str, message:str, draft_charge_count:int, token_offset:int) -> None:
+        self.code:str = code
+        self.message:str = message
+        self.file_path:str = ""
+        self.draft_charge_count:int = draft_charge_count
+        self.token_offset:int = token_offset
+        self.offset:int | None = None
+        self.line:int | None = None
+        self.column:int | None = None
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.code}, {self.file_path}:{self.line}:{self.column}, Draft Charge {self.draft_charge_count}, token {self.token_offset})"
+
+    def as_dict(self) -> dict:
+        return {
+            "file": self.file_path,
+            "charge": self.draft_charge_count,
+            "token": self.token_offset,
+            "offset": self.offset,
+            "line": self.line,
+            "column": self.column,
+            "code": self.code,
+            "error": ERROR_CODES.get(self.code, ""),
+            "message": self.message,
+        }
+
+# ---
+
+# DONE ✅ 
+# prints an error the way the interpreter always has and records it when diagnostics are being collected
+# returns None so an interpreter check can fail with a single return statement
+def report(diagnostics:list[Diagnostic] | None, code:str, draft_charge_count:int, token_offset:int, message:str) -> None:
+    print(message)
+    if diagnostics is not None:
+        diagnostics.append(Diagnostic(code, message, draft_charge_count, token_offset))
+    return None
+
+# ---
+
+# DONE ✅ 
+# sets the source offset of the diagnostics a charge block added from diagnostics[first:] onwards, only charges with errors are scanned again
+def resolve_offsets(diagnostics:list[Diagnostic] | None, first:int, dc:str | bytes, start:int = 0, end:int | None = None) -> None:
+    if diagnostics is None or len(diagnostics) == first:
+        return None
+    offsets:list[int] = lx.token_offsets(dc, start, end)
+    for diagnostic in diagnostics[first:]:
+        diagnostic.offset = offsets[min(diagnostic.token_offset, len(offsets) - 1)]
+    return None
+
+# DONE ✅ 
+# fills in the file, line and column of diagnostics from their source offsets
+def locate(source_file:SourceFile, diagnostics:list[Diagnostic]) -> None:
+    for diagnostic in diagnostics:
+        diagnostic.file_path = source_file.file_path
+        if diagnostic.offset is not None:
+            diagnostic.line, diagnostic.column = source_file.line_column(diagnostic.offset)
+    return None
+
+# ---
+
+# DONE ✅ 
+# machine-readable summary of a run, diagnostics are ordered by file and charge
+def build_report(charge_total:int, created_total:int, diagnostics:list[Diagnostic]) -> dict:
+    return {
+        "charges": charge_total,
+        "created": created_total,
+        "failed": charge_total - created_total,
+        "diagnostics": [diagnostic.as_dict() for diagnostic in diagnostics],
+    }
+
+# a report path of - writes the report to stdout
+def write_report(report_path:str, report:dict) -> None:
+    if report_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return None
+    with open(report_path, "w") as fhand:
+        json.dump(report, fhand, indent=2)
+        fhand.write("\n")
+    return None
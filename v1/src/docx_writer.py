@@ -0,0 +1,154 @@
+# DOCX writer --> writes draft charges as Word documents from a WordprocessingML skeleton compiled once, one charge per document or many streamed into one, with no renderer process
+
+import io
+import re
+import zipfile
+from functools import cache
+from typing import BinaryIO
+from xml.sax.saxutils import escape
+from records import DraftCharge, DRAFT_CHARGE_FIELDS
+import layout
+
+WRITER_VERSION:int = 1 # bump whenever the skeleton or the way charges are set changes, so cached DOCX files are not reused, changes to a jurisdiction's layout are picked up by themselves
+ZIP_DATE_TIME:tuple[int, ...] = (1980, 1, 1, 0, 0, 0) # every part is dated the same, so the same charge always gives the same bytes
+INVALID_XML:re.Pattern = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]") # control characters XML 1.0 does not allow
+
+WORD_NAMESPACE:str = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIP_TYPES:str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_DECLARATION:str = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# the parts every document shares, written unchanged into each package
+CONTENT_TYPES:str = XML_DECLARATION + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+    '</Types>'
+)
+PACKAGE_RELATIONSHIPS:str = XML_DECLARATION + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{RELATIONSHIP_TYPES}/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+DOCUMENT_RELATIONSHIPS:str = XML_DECLARATION + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{RELATIONSHIP_TYPES}/styles" Target="styles.xml"/>'
+    f'<Relationship Id="rId2" Type="{RELATIONSHIP_TYPES}/settings" Target="settings.xml"/>'
+    '</Relationships>'
+)
+STYLES:str = XML_DECLARATION + (
+    f'<w:styles xmlns:w="{WORD_NAMESPACE}">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:eastAsia="Times New Roman" w:cs="Times New Roman"/>'
+    '<w:sz w:val="24"/><w:szCs w:val="24"/><w:lang w:val="en-GB"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="0" w:line="300" w:lineRule="auto"/></w:pPr></w:pPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '</w:styles>'
+)
+SETTINGS:str = XML_DECLARATION + (
+    f'<w:settings xmlns:w="{WORD_NAMESPACE}">'
+    '<w:defaultTabStop w:val="720"/>'
+    '<w:compat><w:compatSetting w:name="compatibilityMode" w:uri="http://schemas.microsoft.com/office/word" w:val="15"/></w:compat>'
+    '</w:settings>'
+)
+
+# word/document.xml is its opening, the body of each charge with a page break between charges, then its closing holding the A4 page setup
+DOCUMENT_OPENING:str = XML_DECLARATION + f'<w:document xmlns:w="{WORD_NAMESPACE}"><w:body>'
+DOCUMENT_CLOSING:str = (
+    '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="720" w:footer="720" w:gutter="0"/>'
+    '</w:sectPr></w:body></w:document>'
+)
+PAGE_BREAK:str = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# style of a layout block --> (paragraph properties, run properties)
+STYLE_PROPERTIES:dict[str, tuple[str, str]] = {
+    "heading": ('<w:pPr><w:jc w:val="center"/></w:pPr>', '<w:b/><w:u w:val="single"/>'),
+    "centred": ('<w:pPr><w:jc w:val="center"/></w:pPr>', "<w:b/>"),
+    "left": ("", ""),
+    "space": ("", ""),
+}
+
+# ---
+
+# DONE ✅ 
+def zip_info(part_name:str, compress_type:int) -> zipfile.ZipInfo:
+    info:zipfile.ZipInfo = zipfile.ZipInfo(part_name, date_time=ZIP_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o644 << 16
+    return info
+
+# the shared parts are small, so they are stored rather than compressed again for every document
+STATIC_PARTS:list[tuple[zipfile.ZipInfo, bytes]] = [
+    (zip_info(part_name, zipfile.ZIP_STORED), contents.encode()) for part_name, contents in [
+        ("[Content_Types].xml", CONTENT_TYPES),
+        ("_rels/.rels", PACKAGE_RELATIONSHIPS),
+        ("word/_rels/document.xml.rels", DOCUMENT_RELATIONSHIPS),
+        ("word/styles.xml", STYLES),
+        ("word/settings.xml", SETTINGS),
+    ]
+]
+DOCUMENT_PART:str = "word/document.xml"
+
+# DONE ✅ 
+# the paragraph of one layout block, the text of its runs left as {field} placeholders
+def compile_paragraph(style:str, text:str) -> str:
+    if style == "space":
+        return "<w:p/>"
+    paragraph_properties, run_properties = STYLE_PROPERTIES[style]
+    runs:list[str] = []
+    for italic, run in layout.italic_runs(text):
+        properties:str = run_properties + ("<w:i/>" if italic else "")
+        runs.append(f'<w:r>{f"<w:rPr>{properties}</w:rPr>" if properties else ""}<w:t xml:space="preserve">{escape(run)}</w:t></w:r>')
+    return f"<w:p>{paragraph_properties}{''.join(runs)}</w:p>"
+
+# DONE ✅ 
+# the body of a jurisdiction's charges as one format string, filled with the XML-escaped fields of each charge, compiled on its first charge
+@cache
+def body_template(jurisdiction:str) -> str:
+    return "".join(compile_paragraph(style, text) for style, text in layout.charge_layout(jurisdiction))
+
+# DONE ✅ 
+def charge_body(vital_information:DraftCharge) -> str:
+    return body_template(vital_information.jurisdiction).format_map({field: escape(INVALID_XML.sub("", str(getattr(vital_information, field)))) for field in DRAFT_CHARGE_FIELDS})
+
+# ---
+
+# DONE ✅ 
+# writes a DOCX package to a binary stream, the shared parts first and then word/document.xml as charges are added, so only one charge is held in memory at a time
+# every charge after the first starts on a new page
+class DocxDocument:
+
+    def __init__(self, fhand:BinaryIO) -> None:
+        self.archive = zipfile.ZipFile(fhand, "w")
+        for info, contents in STATIC_PARTS:
+            self.archive.writestr(info, contents)
+        self.document = self.archive.open(zip_info(DOCUMENT_PART, zipfile.ZIP_DEFLATED), "w")
+        self.document.write(DOCUMENT_OPENING.encode())
+        self.charge_count:int = 0
+
+    # the title is accepted so a DocxDocument can stand in for a pdf_writer.PdfDocument, Word builds its own navigation
+    def add_charge(self, vital_information:DraftCharge, title:str | None = None) -> None:
+        self.document.write(((PAGE_BREAK if self.charge_count else "") + charge_body(vital_information)).encode())
+        self.charge_count += 1
+        return None
+
+    def close(self) -> None:
+        self.document.write(DOCUMENT_CLOSING.encode())
+        self.document.close()
+        self.archive.close()
+        return None
+
+# ---
+
+# DONE ✅ 
+# a whole DOCX package holding a single charge, written by DocxDocument so single charge packages and streamed ones are built by zipfile the same way
+def render(vital_information:DraftCharge) -> bytes:
+    stream = io.BytesIO()
+    document:DocxDocument = DocxDocument(stream)
+    document.add_charge(vital_information)
+    document.close()
+    return stream.getvalue()
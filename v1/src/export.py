@@ -0,0 +1,178 @@
+# Export --> streams the vital information of every compiled draft charge into a single JSON Lines, CSV or columnar file for analysis, in place of one rendered document per charge
+
+import os
+import csv
+import json
+import marshal
+import itertools
+from array import array
+from collections.abc import Iterator
+import atomic
+import dates
+from records import DraftCharge, DRAFT_CHARGE_FIELDS
+
+CHUNK_ROWS:int = 65536 # charges held in the columns of a columnar export before they are written out
+COLUMNAR_MAGIC:str = "DC4U columns"
+COLUMNAR_VERSION:int = 1
+
+# export file suffix --> kind, the kind of an export is chosen by its file name
+EXPORT_KINDS:list[tuple[str, str]] = [
+    (".jsonl", "jsonl"),
+    (".ndjson", "jsonl"),
+    (".csv", "csv"),
+    (".columns", "columnar"),
+]
+
+# every row is the source the charge was compiled from and its number, then its vital information
+# the source is its directory followed by its file name (see main.source_name), so files that share a name in different directories are told apart
+EXPORT_FIELDS:tuple[str, ...] = ("file", "charge") + DRAFT_CHARGE_FIELDS
+
+# field --> type of its column in a columnar export
+#   int32    array('i')
+#   date     array('i') of proleptic Gregorian ordinals, 0 where the date was not given
+#   string   array('I') of the offsets each value starts at in the column's UTF-8 data, with a final offset at its end, followed by the data
+COLUMN_TYPES:dict[str, str] = {field: "string" for field in EXPORT_FIELDS} | {"charge": "int32", "suspect_age": "int32", "offense_date": "date", "charging_date": "date", "suspect_dob": "date"}
+
+# a columnar export is marshalled (COLUMNAR_MAGIC, COLUMNAR_VERSION, ((field, type), ...)) followed by one marshalled (rows, columns) per chunk
+# columns are in the order of EXPORT_FIELDS, each a bytes for int32 and date columns or (offsets, data) for string columns
+
+# ---
+
+# DONE ✅ 
+def export_kind(export_path:str) -> str | None:
+    for suffix, kind in EXPORT_KINDS:
+        if export_path.lower().endswith(suffix):
+            return kind
+    return None
+
+# DONE ✅ 
+# the source a charge was compiled from and its number, recovered from the name interpreter.origin_charge gave it
+def charge_origin(dc_file_name:str) -> tuple[str, int]:
+    file_name, _, rest = dc_file_name.split("|")[0].rpartition("-Draft-Charge-")
+    return file_name, int(rest.split(".")[0])
+
+# DONE ✅ 
+# the values a charge is exported with, stripped of the whitespace around them the way index.index_row strips them
+def export_values(vital_information:DraftCharge) -> tuple:
+    return tuple(value.strip() if isinstance(value, str) else value for value in vital_information.as_tuple())
+
+# DONE ✅ 
+def encode_strings(values:list[str]) -> tuple[bytes, bytes]:
+    data:list[bytes] = [value.encode() for value in values]
+    offsets:array = array("I", [0])
+    offsets.extend(itertools.accumulate(len(value) for value in data))
+    return offsets.tobytes(), b"".join(data)
+
+# ---
+
+# DONE ✅ 
+# drop-in replacement for output.OutputWriter, each charge becomes one row of the export as it is written, so memory use does not grow with the number of charges
+# the export is written under a temporary name and renamed into place by close, so an interrupted run never leaves a truncated export
+class ExportWriter:
+
+    def __init__(self, export_path:str, output_directory:str = "") -> None:
+        self.export_path:str = os.path.join(output_directory, export_path)
+        self.kind:str = export_kind(export_path)
+        self.charge_count:int = 0
+        if os.path.dirname(self.export_path):
+            os.makedirs(os.path.dirname(self.export_path), exist_ok=True)
+        self.temporary:str = atomic.temporary_file_name(self.export_path)
+        match self.kind:
+            case "jsonl":
+                self.fhand = open(self.temporary, "w", encoding="utf-8")
+            case "csv":
+                self.fhand = open(self.temporary, "w", encoding="utf-8", newline="")
+                self.csv_writer = csv.writer(self.fhand)
+                self.csv_writer.writerow(EXPORT_FIELDS)
+            case "columnar":
+                self.fhand = open(self.temporary, "wb")
+                marshal.dump((COLUMNAR_MAGIC, COLUMNAR_VERSION, tuple(COLUMN_TYPES.items())), self.fhand)
+                self.columns:dict[str, array | list[str]] = self.empty_columns()
+
+    # dc is a compiled draft charge, (output file name, contents, vital information), only its vital information is exported
+    def write(self, dc:tuple) -> None:
+        file_name, draft_charge_count = charge_origin(dc[0])
+        values:tuple = export_values(dc[2])
+        self.charge_count += 1
+        match self.kind:
+            case "jsonl":
+                self.fhand.write(json.dumps(dict(zip(EXPORT_FIELDS, (file_name, draft_charge_count) + values)), ensure_ascii=False) + "\n")
+            case "csv":
+                self.csv_writer.writerow((file_name, draft_charge_count) + values)
+            case "columnar":
+                self.add_row(file_name, draft_charge_count, values)
+        return None
+
+    def empty_columns(self) -> dict[str, array | list[str]]:
+        return {field: [] if column_type == "string" else array("i") for field, column_type in COLUMN_TYPES.items()}
+
+    # values are a charge's export_values, in the order of DRAFT_CHARGE_FIELDS
+    def add_row(self, file_name:str, draft_charge_count:int, values:tuple) -> None:
+        self.columns["file"].append(file_name)
+        self.columns["charge"].append(draft_charge_count)
+        for field, value in zip(DRAFT_CHARGE_FIELDS, values):
+            match COLUMN_TYPES[field]:
+                case "date":
+                    self.columns[field].append(dates.date_ordinal(value))
+                case "int32":
+                    try:
+                        self.columns[field].append(value)
+                    except OverflowError:
+                        print(f"Error log: {field} {value} of Draft Charge {draft_charge_count} of {file_name} does not fit a columnar export, it is exported as -1")
+                        self.columns[field].append(-1)
+                case _:
+                    self.columns[field].append(value)
+        if len(self.columns["file"]) >= CHUNK_ROWS:
+            self.write_chunk()
+        return None
+
+    def write_chunk(self) -> None:
+        rows:int = len(self.columns["file"])
+        if rows == 0:
+            return None
+        encoded:list[bytes | tuple[bytes, bytes]] = []
+        for field, column_type in COLUMN_TYPES.items():
+            encoded.append(encode_strings(self.columns[field]) if column_type == "string" else self.columns[field].tobytes())
+        marshal.dump((rows, tuple(encoded)), self.fhand)
+        self.columns = self.empty_columns()
+        return None
+
+    def flush(self) -> None:
+        self.fhand.flush()
+        return None
+
+    def close(self) -> None:
+        try:
+            if self.kind == "columnar":
+                self.write_chunk()
+            self.fhand.close()
+            os.replace(self.temporary, self.export_path)
+        except BaseException:
+            if os.path.exists(self.temporary):
+                os.remove(self.temporary)
+            raise
+        print(f"DC4U has exported {self.charge_count} draft charge(s) to {self.export_path}")
+        return None
+
+# ---
+
+# DONE ✅ 
+# reads a columnar export back a chunk at a time, each chunk a dict of field --> array('i') for int32 and date columns or list of strings
+def read_columnar(export_path:str) -> Iterator[dict[str, array | list[str]]]:
+    with open(export_path, "rb") as fhand:
+        header = marshal.load(fhand)
+        if header[:2] != (COLUMNAR_MAGIC, COLUMNAR_VERSION):
+            raise ValueError(f"{export_path} is not a DC4U columnar export")
+        while True:
+            try:
+                rows, columns = marshal.load(fhand)
+            except EOFError:
+                return
+            chunk:dict[str, array | list[str]] = {}
+            for (field, column_type), column in zip(header[2], columns):
+                if column_type == "string":
+                    offsets:array = array("I", column[0])
+                    chunk[field] = [column[1][offsets[i]:offsets[i + 1]].decode() for i in range(rows)]
+                else:
+                    chunk[field] = array("i", column)
+            yield chunk
@@ -0,0 +1,250 @@
+# Index --> records every validated draft charge in a local SQLite database, indexed by suspect, statute, offense date, charging officer and source, and answers lookups over it with: python3 src/main.py query DB [filters]
+
+import os
+import sys
+import json
+import time
+import marshal
+import sqlite3
+import hashlib
+import argparse
+import datetime
+import urllib.parse
+import dates
+from records import DraftCharge, DRAFT_CHARGE_FIELDS
+
+INDEX_VERSION:int = 3 # kept in the database's user_version, a database written by another version is rebuilt
+BATCH_ROWS:int = 10000 # charges upserted per transaction
+QUERY_LIMIT:int = 100
+CACHE_KIB:int = 131072 # page cache of a connection, large enough that the indexes of millions of charges are updated without rereading their pages
+OFFENSE_DATE_INDEX:int = DRAFT_CHARGE_FIELDS.index("offense_date")
+CHARGING_DATE_INDEX:int = DRAFT_CHARGE_FIELDS.index("charging_date")
+
+# the charges table holds one row per charge block, keyed by the source it was compiled from and its number in that source
+# source is the directory of the dc file followed by its name without extension, see main.source_name, file is only its name, which dc files in different directories share
+# text fields are kept stripped of the spaces the lexer leaves around them and compared case-insensitively, so lookups match however a value was typed
+# dates are also kept as proleptic Gregorian ordinals (0 where not given), so a range of dates is one index range
+# block_hash is the hash of the charge as compiled, a charge whose block is unchanged since it was last indexed is not written again
+INDEX_COLUMNS:tuple[str, ...] = ("source", "file", "block", "block_hash") + DRAFT_CHARGE_FIELDS + ("offense_ordinal", "charging_ordinal")
+SCHEMA:list[str] = [
+    "CREATE TABLE IF NOT EXISTS charges ("
+    "source TEXT NOT NULL, file TEXT NOT NULL COLLATE NOCASE, block INTEGER NOT NULL, block_hash BLOB NOT NULL, "
+    + "".join(f"{field} INTEGER NOT NULL, " if field == "suspect_age" else f"{field} TEXT NOT NULL COLLATE NOCASE, " for field in DRAFT_CHARGE_FIELDS)
+    + "offense_ordinal INTEGER NOT NULL, charging_ordinal INTEGER NOT NULL, "
+    "PRIMARY KEY (source, block))",
+    "CREATE INDEX IF NOT EXISTS charges_file ON charges (file, block)",
+    "CREATE INDEX IF NOT EXISTS charges_nric ON charges (suspect_nric)",
+    "CREATE INDEX IF NOT EXISTS charges_name ON charges (suspect_name)",
+    "CREATE INDEX IF NOT EXISTS charges_statute ON charges (statute)",
+    "CREATE INDEX IF NOT EXISTS charges_offense_date ON charges (offense_ordinal)",
+    "CREATE INDEX IF NOT EXISTS charges_officer ON charges (charging_officer)",
+]
+UPSERT:str = (
+    f"INSERT INTO charges ({', '.join(INDEX_COLUMNS)}) VALUES ({', '.join('?' for _ in INDEX_COLUMNS)}) "
+    f"ON CONFLICT (source, block) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in INDEX_COLUMNS if column not in ('source', 'block'))}"
+)
+
+# query option --> column it filters on, each answered from that column's index
+QUERY_FILTERS:list[tuple[str, str]] = [
+    ("nric", "suspect_nric"),
+    ("name", "suspect_name"),
+    ("statute", "statute"),
+    ("officer", "charging_officer"),
+    ("file", "file"),
+]
+
+# ---
+
+# DONE ✅ 
+# opens the index at index_path, creating it or rebuilding one written by another INDEX_VERSION
+# write-ahead logging lets queries read the index while a run is adding to it
+def connect(index_path:str) -> sqlite3.Connection:
+    connection:sqlite3.Connection = sqlite3.connect(index_path)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+    version:int = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version != INDEX_VERSION:
+        with connection:
+            if version:
+                print(f"Error log: {index_path} was written by another version of DC4U, it is rebuilt")
+                connection.execute("DROP TABLE IF EXISTS charges")
+            for statement in SCHEMA:
+                connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    return connection
+
+# DONE ✅ 
+# the source a charge was compiled from and its number, recovered from the name interpreter.origin_charge gave it
+def charge_source(dc_file_name:str) -> tuple[str, int]:
+    source_name, _, rest = dc_file_name.split("|")[0].rpartition("-Draft-Charge-")
+    return source_name, int(rest.split(".")[0])
+
+# DONE ✅ 
+# the row of a charge, block_hash is taken over its fields as compiled, before they are stripped
+def index_row(source_name:str, block:int, vital_information:DraftCharge) -> tuple:
+    fields:tuple = vital_information.as_tuple()
+    values:list = [value.strip() if isinstance(value, str) else value for value in fields]
+    return (source_name, os.path.basename(source_name), block, hashlib.sha256(marshal.dumps(fields)).digest(), *values, dates.date_ordinal(values[OFFENSE_DATE_INDEX]), dates.date_ordinal(values[CHARGING_DATE_INDEX]))
+
+# ---
+
+# DONE ✅ 
+# drop-in replacement for output.OutputWriter, each charge is upserted into the index in place of being written out
+# the blocks already indexed for a source are read when its first charge arrives, unchanged ones are skipped and the rest queued and upserted BATCH_ROWS to a transaction
+# blocks of a source that the run did not write, because they were removed or no longer compile, are deleted from the index by close
+class IndexWriter:
+
+    def __init__(self, index_path:str, output_directory:str = "") -> None:
+        self.index_path:str = os.path.join(output_directory, index_path)
+        if os.path.dirname(self.index_path):
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        self.connection:sqlite3.Connection = connect(self.index_path)
+        self.stale:dict[str, dict[int, bytes]] = {} # source --> block --> hash, of the blocks indexed before the run that it has not written yet
+        self.pending:list[tuple] = []
+        self.indexed_count:int = 0
+        self.unchanged_count:int = 0
+
+    # dc is a compiled draft charge, (name given by interpreter.origin_charge, contents, vital information), only its vital information is indexed
+    def write(self, dc:tuple) -> None:
+        source_name, block = charge_source(dc[0])
+        if source_name not in self.stale:
+            self.stale[source_name] = dict(self.connection.execute("SELECT block, block_hash FROM charges WHERE source = ?", (source_name,)))
+        row:tuple = index_row(source_name, block, dc[2])
+        if self.stale[source_name].pop(block, None) == row[3]:
+            self.unchanged_count += 1
+            return None
+        self.pending.append(row)
+        if len(self.pending) >= BATCH_ROWS:
+            self.flush()
+        return None
+
+    def flush(self) -> None:
+        if self.pending:
+            with self.connection:
+                self.connection.executemany(UPSERT, self.pending)
+            self.indexed_count += len(self.pending)
+            self.pending = []
+        return None
+
+    def close(self) -> None:
+        self.flush()
+        removed:list[tuple[str, int]] = [(source_name, block) for source_name, blocks in self.stale.items() for block in blocks]
+        with self.connection:
+            self.connection.executemany("DELETE FROM charges WHERE source = ? AND block = ?", removed)
+        self.connection.close()
+        print(f"DC4U has indexed {self.indexed_count} draft charge(s) in {self.index_path}, {self.unchanged_count} unchanged and {len(removed)} removed")
+        return None
+
+# ---
+
+# DONE ✅ 
+# ordinal of a date given as written in a dc file, as 12 February 2024, or as 2024-02-12, None if it is neither
+def query_ordinal(text:str) -> int | None:
+    ordinal:int = dates.date_ordinal(" ".join(text.split()).title())
+    if ordinal:
+        return ordinal
+    try:
+        return datetime.date.fromisoformat(text.strip()).toordinal()
+    except ValueError:
+        return None
+
+# DONE ✅ 
+# the where clause and parameters of a query, a value ending in * matches every value starting with the rest of it
+# prefixes are matched as a range of the column rather than with LIKE, so they are answered from its index too
+def query_conditions(args:argparse.Namespace) -> tuple[str, list]:
+    conditions:list[str] = []
+    parameters:list = []
+    for option, column in QUERY_FILTERS:
+        value:str | None = getattr(args, option)
+        if value is None:
+            continue
+        value = value.strip()
+        if value.endswith("*"):
+            conditions.append(f"{column} >= ? AND {column} < ?")
+            parameters.extend([value[:-1], value[:-1] + "\U0010ffff"])
+        else:
+            conditions.append(f"{column} = ?")
+            parameters.append(value)
+    if args.block is not None:
+        conditions.append("block = ?")
+        parameters.append(args.block)
+    if args.date_from is not None or args.date_to is not None: # one range, charges without an offense date (0) are not before every date
+        conditions.append("offense_ordinal BETWEEN ? AND ?")
+        parameters.extend([max(args.date_from or 1, 1), args.date_to or datetime.date.max.toordinal()])
+    return (" WHERE " + " AND ".join(conditions) if conditions else ""), parameters
+
+# DONE ✅ 
+# matching charges come in the order of the index answering the query, so a limit ends the search as soon as it is reached
+def query(connection:sqlite3.Connection, args:argparse.Namespace) -> list[dict]:
+    where, parameters = query_conditions(args)
+    limit:str = f" LIMIT {args.limit}" if args.limit > 0 else ""
+    cursor:sqlite3.Cursor = connection.execute(f"SELECT source, file, block, {', '.join(DRAFT_CHARGE_FIELDS)} FROM charges{where}{limit}", parameters)
+    columns:list[str] = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+# DONE ✅ 
+def count(connection:sqlite3.Connection, args:argparse.Namespace) -> int:
+    where, parameters = query_conditions(args)
+    return connection.execute(f"SELECT count(*) FROM charges{where}", parameters).fetchone()[0]
+
+# ---
+
+def parse_query_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="dc4u query", description="Look up draft charges in an index written with --index.")
+    parser.add_argument("index", metavar="DB", help="index database written with --index")
+    parser.add_argument("--nric", help="suspect NRIC, end with * to match a prefix")
+    parser.add_argument("--name", help="suspect name, end with * to match a prefix")
+    parser.add_argument("--statute", help="statute charged under, as s379 Penal Code, end with * to match a prefix")
+    parser.add_argument("--officer", help="charging officer, end with * to match a prefix")
+    parser.add_argument("--file", help="name of the dc file the charge was compiled from, without its extension")
+    parser.add_argument("--block", type=int, metavar="N", help="number of the charge in its dc file, counted from 1")
+    parser.add_argument("--from", dest="date_from", metavar="DATE", help="offense date on or after DATE, as 12 February 2024 or 2024-02-12")
+    parser.add_argument("--to", dest="date_to", metavar="DATE", help="offense date on or before DATE")
+    parser.add_argument("--limit", type=int, default=QUERY_LIMIT, metavar="N", help=f"stop after N charges, 0 for every charge (default {QUERY_LIMIT})")
+    parser.add_argument("--count", action="store_true", help="print only the number of matching charges")
+    parser.add_argument("--json", action="store_true", help="print each charge as a line of JSON")
+    return parser.parse_args(argv)
+
+# DONE ✅ 
+def query_main(argv:list[str]) -> int:
+    args:argparse.Namespace = parse_query_args(argv)
+    for option in ("date_from", "date_to"):
+        if getattr(args, option) is not None:
+            ordinal:int | None = query_ordinal(getattr(args, option))
+            if ordinal is None:
+                print(f"Error log: {getattr(args, option)} is not a date, write it as 12 February 2024 or 2024-02-12", file=sys.stderr)
+                return 2
+            setattr(args, option, ordinal)
+    if not os.path.isfile(args.index):
+        print(f"Error log: No index at {args.index}, write one with --index", file=sys.stderr)
+        return 2
+    connection:sqlite3.Connection = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(args.index))}?mode=ro", uri=True) # read only, so a lookup never takes a write lock
+    start:float = time.perf_counter()
+    try:
+        version:int = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == INDEX_VERSION:
+            result:int | list[dict] = count(connection, args) if args.count else query(connection, args)
+    except sqlite3.DatabaseError: # not an SQLite database, or one without the charges table
+        version = 0
+    finally:
+        connection.close()
+    if version != INDEX_VERSION:
+        if version:
+            print(f"Error log: {args.index} was written by another version of DC4U, index its dc files again with --index", file=sys.stderr)
+        else:
+            print(f"Error log: {args.index} is not a DC4U index, write one with --index", file=sys.stderr)
+        return 2
+    if args.count:
+        matches:int = result
+        print(matches)
+    else:
+        charges:list[dict] = result
+        for charge in charges:
+            if args.json:
+                print(json.dumps(charge, ensure_ascii=False))
+            else:
+                print(f"{charge['source']} Draft Charge {charge['block']}: {charge['suspect_name']} ({charge['suspect_nric']}), {charge['charge_title']} under {charge['statute']} on {charge['offense_date']}, charged by {charge['charging_officer']}")
+        matches = len(charges)
+    print(f"DC4U found {matches} draft charge(s) in {(time.perf_counter() - start) * 1e3:.1f} ms", file=sys.stderr)
+    return 0
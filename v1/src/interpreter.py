@@ -1,650 +1,307 @@
 # Interpreter --> implements dc language syntax and runs checks before compiling to diff output formats
 
+from collections.abc import Iterable, Iterator
+import lexer as lx
+import templates
+import diagnostics as dg
+import dates
+import sections
+from records import DraftCharge, Token, DEFAULT_JURISDICTION
+
 # DONE ✅ 
-def parser_interpreter(overall_token_array:list[tuple]) -> (list[tuple]) | None:
+def parser_interpreter(overall_token_array:list[tuple], jurisdiction:str = DEFAULT_JURISDICTION, render:bool = True) -> (list[tuple]) | None:
 
-    draft_charge_count:int = 0
     final_draft_charge_array:list[tuple] = []
 
-    for token_array in overall_token_array:
-
-        # print(token_array[1])
-
-        draft_charge_count += 1
-
-        # each of these is written to for each output, allowing output format to be specified in the end
-        final_pdf:str = "" # for pdf output
-        final_html:str = "" # for html output with included boilerplate
-        final_txt:str = "" # for txt output
-        final_md:str = "" # for md output
-        final_rmd:str = "" # for rmd output
-        final_docx:str = "" # for docx output
-
-        vital_information_dict:dict = { "OUTPUT_FORMAT":"", 
-                                        "SUSPECT_NAME":"", 
-                                        "SUSPECT_NRIC":"", 
-                                        "SUSPECT_RACE":"", 
-                                        "SUSPECT_AGE":0, 
-                                        "SUSPECT_GENDER":"", 
-                                        "SUSPECT_NATIONALITY":"",
-                                        "CHARGE_TITLE":"",
-                                        "OFFENSE_DATE":"",
-                                        "CHARGE_EXPLANATION":"",
-                                        "STATUTE":"",
-                                        "CHARGING_OFFICER":"",
-                                        "ROLE_DIV":"",
-                                        "CHARGING_DATE":""
-                                    } # used to record important information
-        match_stack:list[str]= [] # used to determine active stack of unmatched symbols
-        suspect_info:str = ""
-        charge_info:str = ""
-        statute_info:str = ""
-        charging_officer_info:str = ""
-
-        for i in range(len(token_array[1])):
-
-            # print(token_array[1][i])
-
-            match token_array[1][i]["type"]:
-                
-# --------------------
-
-                # DONE ✅ 
-                # - should only occur once
-                case "OUTPUT_FORMAT":
-
-                    # print(vital_information_dict)
-
-                    if vital_information_dict["OUTPUT_FORMAT"] != "" and "OUTPUT_FORMAT" not in match_stack:
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Multiple output formats provided. Please provide one only.")
-                        return None
-
-                    else:
-                        if "OUTPUT_FORMAT" not in match_stack:
-                            match_stack.append("OUTPUT_FORMAT") 
-                            output_format:str= token_array[1][i+1]["value"]
-                            match output_format:
-                                case "PDF":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "PDF"
-                                case "HTML":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "HTML"
-                                case "TXT":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "TXT"
-                                case "MD":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "MD"
-                                case "DOCX":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "DOCX"
-                                case "RMD":
-                                    vital_information_dict["OUTPUT_FORMAT"] = "RMD"
-                                case _:
-                                    print(f"Unrecognised output format detected in Draft Charge {draft_charge_count}! DC currently supports one of the following [PDF/HTML/TXT/MD/RMD/DOCX].")
-                                    return None
-                            if token_array[1][i+2]["type"] == "OUTPUT_FORMAT":
-                                pass
-                            else:
-                                print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched output format characters '`' found.")
-                                return None
-                        
-                        elif "OUTPUT_FORMAT" in match_stack:
-                            match_stack.remove("OUTPUT_FORMAT")
-
-                        else:
-                            print("Error Code 0001. Drop me a message on Github @gongahkia.")
-                            return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "L_SUSPECT_INFO":
-                    if vital_information_dict["SUSPECT_NAME"] != "" and vital_information_dict["SUSPECT_AGE"] != 0 and vital_information_dict["SUSPECT_RACE"] != "" and vital_information_dict["SUSPECT_GENDER"] != "" and vital_information_dict["SUSPECT_NRIC"] != "" and vital_information_dict["SUSPECT_NATIONALITY"] != "" and suspect_info != "": 
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Multiple instances of suspect information provided. Please provide one only.")
-                        return None
-
-                    else:
-
-                        if "R_SUSPECT_INFO" not in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched suspect infromation character `<` found.")
-                            return None
-
-                        elif "R_SUSPECT_INFO" in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            match_stack.append("L_SUSPECT_INFO")
-
-                        else:
-                            print("Error Code 0005. Drop me a message on Github @gongahkia.")
-                            return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "R_SUSPECT_INFO":
-
-                    if "L_SUSPECT_INFO" not in [list(token.values())[0] for token in token_array[1][:i+1]]:
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched suspect information character `>` found.")
-                        return None
-
-                    elif "L_SUSPECT_INFO" in [list(token.values())[0] for token in token_array[1][:i+1]] and "L_SUSPECT_INFO" in match_stack:
-                        match_stack.remove("L_SUSPECT_INFO")
-                        # print(suspect_info)
-                        
-                        if len(suspect_info.split(";")) != 6:
-                            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Wrong number of arguments provided for suspect information. Please provide 6, seperated by semicolons (;).")
-                            return None
-
-                        vital_information_dict["SUSPECT_NAME"] = suspect_info.split(";")[0]
-                        vital_information_dict["SUSPECT_NRIC"] = suspect_info.split(";")[1]
-                        vital_information_dict["SUSPECT_RACE"] = suspect_info.split(";")[2]
-
-                        try:
-                            vital_information_dict["SUSPECT_AGE"] = int(suspect_info.split(";")[3])
-                        except:
-                            print(f"Incorrect information detected in Draft Charge {draft_charge_count}. Please provide a valid integer value for suspect age.")
-                            return None
-
-                        vital_information_dict["SUSPECT_GENDER"] = suspect_info.split(";")[4]
-                        vital_information_dict["SUSPECT_NATIONALITY"] = suspect_info.split(";")[5]
-
-                    else:
-                        print("Error Code 0011. Drop me a message on Github @gongahkia.")
-                        return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "L_CHARGE_INFO":
-                    if vital_information_dict["CHARGE_TITLE"] != "" and vital_information_dict["CHARGE_EXPLANATION"] != "" and vital_information_dict["OFFENSE_DATE"] != "" and charge_info != "":
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Multiple instances of charge information provided. Please provide one only.")
-                        return None
-
-                    else:
-                        if "R_CHARGE_INFO" not in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched charge information character `[` found.")
-                            return None
-
-                        elif "R_CHARGE_INFO" in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            match_stack.append("L_CHARGE_INFO")
-
-                        else:
-                            print("Error Code 0007. Drop me a message on Github @gongahkia.")
-                            return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "R_CHARGE_INFO":
-
-                    if "L_CHARGE_INFO" not in [list(token.values())[0] for token in token_array[1][:i+1]]:
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched charge information character `]` found.")
-                        return None
-
-                    elif "L_CHARGE_INFO" in [list(token.values())[0] for token in token_array[1][:i+1]] and "L_CHARGE_INFO" in match_stack:
-                        match_stack.remove("L_CHARGE_INFO")
-                        # print(charge_info)
-                        
-                        if len(charge_info.split(";")) != 3:
-                            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Wrong number of arguments provided for charge information. Please provide 3, seperated by semicolons (;).")
-                            return None
-
-                        vital_information_dict["CHARGE_TITLE"] = charge_info.split(";")[0]
-                        vital_information_dict["CHARGE_EXPLANATION"] = charge_info.split(";")[2]
-
-                        if not check_date_format(charge_info.split(";")[1]):
-                            return None
-                        else:
-                            vital_information_dict["OFFENSE_DATE"] = create_date(charge_info.split(";")[1])
-                    else:
-                        print("Error Code 0006. Drop me a message on Github @gongahkia.")
-                        return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "STATUTE_INFO":
-
-                    if vital_information_dict["STATUTE"] != "" and "STATUTE_INFO" not in match_stack:
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Multiple statutes provided. Please provide one only.")
-                        return None
-
-                    else:
-                        if "STATUTE_INFO" not in match_stack: # opening statute info character 
-                            match_stack.append("STATUTE_INFO")     
-                            # print([list(token.values())[0] for token in token_array[1][i+1:]])
-                            if "STATUTE_INFO" not in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                                print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched statute information character '@' found.")
-                                return None
-
-                            else:
-                                pass
-
-                        elif "STATUTE_INFO" in match_stack: # closing statute info character
-                            match_stack.remove("STATUTE_INFO")
-                            # print(statute_info)
-                            if len(statute_info) < 1:
-                                print(f"Syntax error detected in Draft Charge {draft_charge_count}. No arguments were provided between the statute information characters '@'.")
-                                return None
-                            else:
-                                vital_information_dict["STATUTE"] = statute_info
-
-                        else:
-                            print("Error Code 0010. Drop me a message on Github @gongahkia.")
-                            return None
-
-# --------------------
-
-                # DONE ✅ 
-                case "L_CHARGING_OFFICER_INFO":
-                    if vital_information_dict["CHARGING_OFFICER"] != "" and vital_information_dict["CHARGING_DATE"] != "" and vital_information_dict["ROLE_DIV"] != "" and charging_officer_info != "":
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}. Multiple instances of charging officer information provided. Please provide one only.")
-                        return None
-
-                    else:
-                        if "R_CHARGING_OFFICER_INFO" not in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            print(f"Syntax error detected in Draft Charge {draft_charge_count}.", end="")
-                            print("Unmatched charging officer information character '{' found.")
-                            return None
-
-                        elif "R_CHARGING_OFFICER_INFO" in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            match_stack.append("L_CHARGING_OFFICER_INFO")
+    for draft_charge_count, token_array in enumerate(overall_token_array, start=1):
+        draft_charge:tuple | None = compile_charge(token_array, draft_charge_count, jurisdiction=jurisdiction, render=render)
+        if draft_charge is None:
+            return None
+        final_draft_charge_array.append(draft_charge)
 
-                        else:
-                            print("Error Code 0008. Drop me a message on Github @gongahkia.")
-                            return None
+    # print(final_draft_charge_array)
+    return final_draft_charge_array
 
 # --------------------
 
-                # DONE ✅ 
-                case "R_CHARGING_OFFICER_INFO":
-
-                    if "R_CHARGING_OFFICER_INFO" not in [list(token.values())[0] for token in token_array[1][:i+1]]:
-                        print(f"Syntax error detected in Draft Charge {draft_charge_count}.", end="")
-                        print("Unmatched charging officer information character `}` found.")
-                        return None
-
-                    elif "L_CHARGING_OFFICER_INFO" in [list(token.values())[0] for token in token_array[1][:i+1]] and "L_CHARGING_OFFICER_INFO" in match_stack:
-                        match_stack.remove("L_CHARGING_OFFICER_INFO")
-                        # print(charging_officer_info)
-                        
-                        if len(charging_officer_info.split(";")) != 3:
-                            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Wrong number of arguments provided for charging officer information. Please provide 3, seperated by semicolons (;).")
-                            return None
-
-                        vital_information_dict["CHARGING_OFFICER"] = charging_officer_info.split(";")[0]
-                        vital_information_dict["ROLE_DIV"] = charging_officer_info.split(";")[1]
-
-                        if not check_date_format(charging_officer_info.split(";")[2]):
-                            return None 
-                        else:
-                            vital_information_dict["CHARGING_DATE"] = create_date(charging_officer_info.split(";")[2])
-
-                    else:
-                        print("Error Code 0009. Drop me a message on Github @gongahkia.")
-                        return None
+# DONE ✅ 
+# lazy counterpart of parser_interpreter, yields each draft charge as soon as it is compiled and stops at the first invalid charge
+def stream_interpreter(overall_token_array:Iterable[tuple], jurisdiction:str = DEFAULT_JURISDICTION, render:bool = True) -> Iterator[tuple]:
+    for draft_charge_count, token_array in enumerate(overall_token_array, start=1):
+        draft_charge:tuple | None = compile_charge(token_array, draft_charge_count, jurisdiction=jurisdiction, render=render)
+        if draft_charge is None:
+            return
+        yield draft_charge
 
 # --------------------
 
-                # DONE ✅ 
-                case "COMMENT":
-
-                    if "COMMENT" not in match_stack: # opening comment character 
-                        match_stack.append("COMMENT")     
-                        # print([list(token.values())[0] for token in token_array[1][i+1:]])
-                        if "COMMENT" not in [list(token.values())[0] for token in token_array[1][i+1:]]:
-                            print(f"Syntax error detected in Draft Charge {draft_charge_count}. Unmatched comment character '#' found.")
-                            return None
-
-                        else:
-                            pass
-
-                    elif "COMMENT" in match_stack: # closing comment character
-                        match_stack.remove("COMMENT")
+# DONE ✅ 
+# validates a single draft charge and formats it into its output file name, contents and the vital information they were generated from
+# errors are recorded in diagnostics when a list is given, as well as printed
+# without render the charge is left unrendered, see origin_charge, for writers that only keep its vital information
+def compile_charge(token_array:tuple, draft_charge_count:int, diagnostics:list[dg.Diagnostic] | None = None, jurisdiction:str = DEFAULT_JURISDICTION, render:bool = True) -> tuple | None:
+    vital_information:DraftCharge | None = interpret_charge(token_array, draft_charge_count, diagnostics, jurisdiction)
+    if vital_information is None:
+        return None
+    draft_charge:tuple | None = generate_charge(token_array[0], draft_charge_count, vital_information, diagnostics) if render else origin_charge(token_array[0], draft_charge_count)
+    if draft_charge is None:
+        return None
+    return draft_charge + (vital_information,)
 
-                    else:
-                        print("Error Code 0004. Drop me a message on Github @gongahkia.")
-                        return None
-                    pass
+# DONE ✅ 
+# lexes and compiles the charge block dc[start:end], a block that does not lex is reported like any other invalid charge
+# the diagnostics it adds are given offsets into dc
+def compile_block(file_name:str, dc:str | bytes, draft_charge_count:int, diagnostics:list[dg.Diagnostic] | None = None, start:int = 0, end:int | None = None, jurisdiction:str = DEFAULT_JURISDICTION, render:bool = True) -> tuple | None:
+    first:int = 0 if diagnostics is None else len(diagnostics)
+    try:
+        token_array:list[Token] = lx.lexer(dc, start, end)
+    except ValueError as e:
+        dg.report(diagnostics, "0034", draft_charge_count, len(lx.token_offsets(dc, start, end)) - 1, f"Error log: {e}") # error logging 
+        dg.resolve_offsets(diagnostics, first, dc, start, end)
+        return None
+    draft_charge:tuple | None = compile_charge((file_name, token_array), draft_charge_count, diagnostics, jurisdiction, render)
+    dg.resolve_offsets(diagnostics, first, dc, start, end)
+    return draft_charge
 
 # --------------------
 
-                case "WORD":
-                    if "L_SUSPECT_INFO" in match_stack:
-                        suspect_info += token_array[1][i]["value"] + " "
-                    elif "L_CHARGE_INFO" in match_stack:
-                        charge_info += token_array[1][i]["value"] + " "
-                    elif "STATUTE_INFO" in match_stack:
-                        statute_info += token_array[1][i]["value"] + " "
-                    elif "L_CHARGING_OFFICER_INFO" in match_stack:
-                        charging_officer_info += token_array[1][i]["value"] + " "
-                    # elif blah blah
-                        # add code here
-                    pass
+# DONE ✅ 
+# runs syntax checks over the tokens of a single draft charge, returning its vital information or None on the first error
+# every section is checked by the same driver from its entry in the jurisdiction's table of sections, see sections.section_table, words are collected into a list per section and split into arguments once the section closes
+def interpret_charge(token_array:tuple, draft_charge_count:int, diagnostics:list[dg.Diagnostic] | None = None, jurisdiction:str = DEFAULT_JURISDICTION) -> DraftCharge | None:
+
+    tokens:list[Token] = token_array[1]
+    table:sections.SectionTable = sections.section_table(jurisdiction) # the sections a charge of this jurisdiction is written in
+    vital_information:DraftCharge = DraftCharge() # used to record important information
+    vital_information.jurisdiction = jurisdiction
+    match_stack:DelimiterStack = DelimiterStack() # used to determine active stack of unmatched symbols
+    first_index, last_index = index_token_types(tokens) # used to look up matching delimiters without rescanning the token array
+    section_words:list[list[int]] = [[] for _ in table.sections] # token indices of the words inside each section, kept across repeated sections so a repeat is checked against everything collected so far
+    collecting:list[int] | None = None # words of the section words are currently collected into, only changes when a delimiter is seen
+
+    for i, token in enumerate(tokens):
+
+        if token.kind == lx.WORD:
+            if collecting is not None:
+                collecting.append(i)
+            continue
+
+        delimiter:tuple[int, bool] | None = table.delimiters.get(token.kind)
+        if delimiter is None:
+            dg.report(diagnostics, "0003", draft_charge_count, i, "Error Code 0003. Drop me a message on @gongahkia.")
+            continue
+        section_index, opening = delimiter
+        section:sections.Section = table.sections[section_index]
+        if section.open_kind == section.close_kind:
+            opening = section.open_kind not in match_stack
+
+        if opening:
+            if open_section(section, tokens, i, vital_information, match_stack, last_index, draft_charge_count, diagnostics) is None:
+                return None
+        elif close_section(section, tokens, section_words[section_index], i, vital_information, match_stack, first_index, draft_charge_count, diagnostics) is None:
+            return None
+        if section_index in table.collecting:
+            collecting = collecting_words(table, section_words, match_stack)
 
-# --------------------
+    # DONE ✅ 
+    # checking for vital required information for each draft charge, in the order of the table's sections, a complete charge is confirmed with a single lookup of every field
+    required_values:tuple = table.required_values(vital_information)
+    if "" in required_values or 0 in required_values:
+        for field, value in zip(table.required_fields, required_values):
+            if not provided(value):
+                return dg.report(diagnostics, "0033", draft_charge_count, 0, f"Incomplete information detected in Draft Charge {draft_charge_count}. {field.missing}")
 
-                # DONE ✅ 
-                case _:
-                    print("Error Code 0003. Drop me a message on @gongahkia.")
+    # print(vital_information)
+    return vital_information
 
 # --------------------
 
-        # DONE ✅ 
-        # checking for vital required suspect information for each draft charge 
-        if vital_information_dict["SUSPECT_NAME"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect Name not provided. Please provide one.")
-            return None
-        elif vital_information_dict["SUSPECT_NRIC"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect NRIC not provided. Please provide one.")
-            return None
-        elif vital_information_dict["SUSPECT_RACE"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect Race not provided. Please provide one.")
-            return None
-        elif vital_information_dict["SUSPECT_AGE"] == 0:
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect Age not provided. Please provide one.")
-            return None
-        elif vital_information_dict["SUSPECT_GENDER"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect Gender not provided. Please provide one.")
-            return None
-        elif vital_information_dict["SUSPECT_NATIONALITY"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Suspect Nationality not provided. Please provide one.")
-            return None
-
-        # DONE ✅ 
-        # checking for vital required charge information for each draft charge
-        if vital_information_dict["CHARGE_TITLE"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Charge title not provided. Please provide one.")
-            return None
-        elif vital_information_dict["OFFENSE_DATE"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Date of offense not provided. Please provide one.")
-            return None
-        elif vital_information_dict["CHARGE_EXPLANATION"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Material facts of Charge not provided. Please provide them.")
-            return None
+# DONE ✅ 
+# words of the first open section that collects them, or None when words are not being collected
+def collecting_words(table:sections.SectionTable, section_words:list[list[int]], match_stack:"DelimiterStack") -> list[int] | None:
+    for section_index in table.collecting:
+        if match_stack.counts[table.sections[section_index].open_kind]:
+            return section_words[section_index]
+    return None
 
-        # DONE ✅ 
-        # checking for vital required statute information for each draft charge
-        if vital_information_dict["STATUTE"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Statute not provided. Please provide one.")
+# DONE ✅ 
+# returns True once the section is open, or None once its error has been reported
+def open_section(section:sections.Section, tokens:list[Token], i:int, vital_information:DraftCharge, match_stack:"DelimiterStack", last_index:list[int], draft_charge_count:int, diagnostics:list[dg.Diagnostic] | None) -> bool | None:
+    if "multiple" in section.errors:
+        for field in section.fields:
+            if not provided(getattr(vital_information, field.name)):
+                break
+        else:
+            return section_error(section, "multiple", draft_charge_count, i, diagnostics)
+    if section.arguments == "token":
+        match_stack.push(section.open_kind)
+        if i + 1 >= len(tokens):
+            return section_error(section, "unmatched open", draft_charge_count, i, diagnostics)
+        if store_argument(section, section.fields[0], tokens[i + 1].value, vital_information, draft_charge_count, i + 1, diagnostics) is None:
             return None
+        if i + 2 >= len(tokens) or tokens[i + 2].kind != section.close_kind:
+            return section_error(section, "unmatched open", draft_charge_count, i, diagnostics)
+        return True
+    if not occurs_after(last_index, section.close_kind, i):
+        return section_error(section, "unmatched open", draft_charge_count, i, diagnostics)
+    match_stack.push(section.open_kind)
+    return True
 
-        # DONE ✅ 
-        # checking for vital required charging officer information for each draft charge
-        if vital_information_dict["CHARGING_OFFICER"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Charging Officer name not provided. Please provide one.")
-            return None
-        elif vital_information_dict["ROLE_DIV"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Charging Officer appointment and division not specified. Please provide them.")
-            return None
-        elif vital_information_dict["CHARGING_DATE"] == "":
-            print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Date of Charge not specified. Please provide one.")
-            return None
+# DONE ✅ 
+# returns True once the section is closed and its fields stored, or None once its error has been reported
+# the words, given by their token indices, are joined with a space after each, as they are written in the dc file, and split into arguments once
+# an invalid argument is reported at the word it starts in, errors of the section as a whole at its closing delimiter i
+def close_section(section:sections.Section, tokens:list[Token], words:list[int], i:int, vital_information:DraftCharge, match_stack:"DelimiterStack", first_index:list[int], draft_charge_count:int, diagnostics:list[dg.Diagnostic] | None) -> bool | None:
+    if section.open_kind != section.close_kind:
+        if not occurs_up_to(first_index, section.open_kind, i):
+            return section_error(section, "unmatched close", draft_charge_count, i, diagnostics)
+        if section.open_kind not in match_stack:
+            return section_error(section, "internal", draft_charge_count, i, diagnostics)
+    match_stack.remove(section.open_kind)
+    text:str = " ".join(tokens[j].value for j in words) + " " if words else ""
+    match section.arguments:
+        case "split":
+            arguments:list[str] = text.split(";")
+            if len(arguments) != len(section.fields):
+                return section_error(section, "arity", draft_charge_count, i, diagnostics)
+            argument_start:int = 0
+            for field, argument in zip(section.fields, arguments):
+                if field.kind == "text":
+                    setattr(vital_information, field.name, argument)
+                elif store_argument(section, field, argument, vital_information, draft_charge_count, argument_token(tokens, words, argument_start, i), diagnostics) is None:
+                    return None
+                argument_start += len(argument) + 1
+        case "whole":
+            if len(text) < 1:
+                return section_error(section, "empty", draft_charge_count, i, diagnostics)
+            return store_argument(section, section.fields[0], text, vital_information, draft_charge_count, words[0], diagnostics)
+    return True
 
-# --------------------
+# DONE ✅ 
+# token index of the word the argument starting at argument_start of the joined words begins in, i when it begins after the last word
+def argument_token(tokens:list[Token], words:list[int], argument_start:int, i:int) -> int:
+    word_end:int = 0
+    for j in words:
+        word_end += len(tokens[j].value)
+        if word_end > argument_start:
+            return j
+        word_end += 1 # the space after each word
+    return i
 
-        # DONE ✅ 
-        # checks for incomplete output format and formats respective file type
-        match vital_information_dict["OUTPUT_FORMAT"]:
-            case "PDF":
-                final_pdf = pdf_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.rmd|PDF", final_pdf))
-            case "HTML":
-                final_html = html_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.html", final_html))
-            # DONE ✅ 
-            case "TXT":
-                final_txt = txt_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.txt", final_txt))
-            case "MD":
-                final_md = md_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.md", final_md))
-            case "RMD":
-                final_rmd = rmd_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.rmd", final_rmd))
-            case "DOCX":
-                final_docx = docx_draft_charge_gen(vital_information_dict)
-                final_draft_charge_array.append((f"{token_array[0]}-Draft-Charge-{draft_charge_count}.rmd|DOCX", final_docx))
-            case "":
-                print(f"Incomplete information detected in Draft Charge {draft_charge_count}. Output format not provided. Please provide one.")
-                return None
-            case _:
-                print("Error Code 0002. Drop me a message on @gongahkia.")
+# DONE ✅ 
+# converts and validates an argument by the kind of its field and stores it, returns None once an invalid argument has been reported at token i
+def store_argument(section:sections.Section, field:sections.Field, argument:str, vital_information:DraftCharge, draft_charge_count:int, i:int, diagnostics:list[dg.Diagnostic] | None) -> bool | None:
+    match field.kind:
+        case "integer":
+            try:
+                value:str | int = int(argument)
+            except ValueError:
+                return section_error(section, "integer", draft_charge_count, i, diagnostics)
+        case "date":
+            date:dates.Date | None = check_date_format(argument, draft_charge_count, i, diagnostics)
+            if date is None:
                 return None
+            value = date.text
+        case "format":
+            if argument not in templates.TEMPLATES:
+                return section_error(section, "format", draft_charge_count, i, diagnostics)
+            value = argument
+        case _:
+            value = argument
+    setattr(vital_information, field.name, value)
+    return True
 
-        # print(vital_information_dict)
+# DONE ✅ 
+def section_error(section:sections.Section, error:str, draft_charge_count:int, i:int, diagnostics:list[dg.Diagnostic] | None) -> None:
+    code, message = section.errors[error]
+    return dg.report(diagnostics, code, draft_charge_count, i, message.format(count=draft_charge_count))
+
+# DONE ✅ 
+# fields left empty ("" or an age of 0) have not been provided
+def provided(value:str | int) -> bool:
+    return value != "" and value != 0
 
-# --------------------
-    
-    # print(final_draft_charge_array)
-    return final_draft_charge_array
 
 # --------------------
 
 # DONE ✅ 
-def check_date_format(date:str) -> bool | None :
-    try:
-        day, month, year = map(int, date.split("/"))
-        if day < 1 or day > 31 or month < 1 or month > 12 or year < 1:
-            print(f"Syntax error detected in the date provided: {date}. Please adhere to the specified format of DD/MM/YYYY")
-            return False
-        else:
-            return True
-    except (ValueError, IndexError):
-        print(f"Syntax error detected in the date provided: {date}. Please adhere to the specified format of DD/MM/YYYY and use integers for all values.")
-        return False
-
-# --------------------
+# formats the output file name and contents for a validated draft charge
+def generate_charge(file_name:str, draft_charge_count:int, vital_information:DraftCharge, diagnostics:list[dg.Diagnostic] | None = None) -> tuple | None:
+    output_format:str = vital_information.output_format
+    if output_format not in templates.TEMPLATES:
+        return dg.report(diagnostics, "0002", draft_charge_count, 0, "Error Code 0002. Drop me a message on @gongahkia.")
+    return (f"{file_name}-Draft-Charge-{draft_charge_count}{templates.OUTPUT_SUFFIXES[output_format]}", templates.render(output_format, vital_information))
 
 # DONE ✅ 
-def create_date(date:str) -> str | None:
-    day:str= date.split("/")[0]
-    year:str = date.split("/")[2]
-    match int(date.split("/")[1]):
-        case 1:
-            month:str = "January"
-        case 2:
-            month = "February"
-        case 3:
-            month = "March"
-        case 4:
-            month = "April"
-        case 5:
-            month = "May"
-        case 6:
-            month = "June"
-        case 7:
-            month = "July"
-        case 8:
-            month = "August"
-        case 9:
-            month = "September"
-        case 10:
-            month = "October"
-        case 11:
-            month = "November"
-        case 12:
-            month = "December"
-        case _:
-            return None
-    return f"{day} {month} {year}"
+# the name a validated draft charge is known by and no contents, in place of generate_charge for writers that never render it (export.ExportWriter, index.IndexWriter)
+# the charge's file name and number are recovered from the name with export.charge_origin
+def origin_charge(file_name:str, draft_charge_count:int) -> tuple:
+    return (f"{file_name}-Draft-Charge-{draft_charge_count}", "")
 
 # --------------------
 
 # DONE ✅ 
-def rmd_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f'''
----
-output: [edit accordingly]
----
-
-# Criminal Procedure Code 2010
-# (CHAPTER 68)
-# REVISED EDITION 2012
-# SECTIONS 123-125
-
-# CHARGE
-
-You, 
-
-**Name:** {vital_information_dict["SUSPECT_NAME"]}
-**NRIC:** {vital_information_dict["SUSPECT_NRIC"]}
-**RACE:** {vital_information_dict["SUSPECT_RACE"]}
-**AGE:** {vital_information_dict["SUSPECT_AGE"]}
-**SEX:** {vital_information_dict["SUSPECT_GENDER"]}
-**NATIONALITY:** {vital_information_dict["SUSPECT_NATIONALITY"]}
-
-are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], *to wit* {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.
-
-{vital_information_dict["CHARGING_OFFICER"]}
-{vital_information_dict["ROLE_DIV"]}
-{vital_information_dict["CHARGING_DATE"]}
-                            '''
-    return final_charge_txt
+# records the first and last position of every token kind in a single pass over the token array, -1 where a kind does not occur
+def index_token_types(token_array:list[Token]) -> tuple[list[int], list[int]]:
+    first_index:list[int] = [-1] * len(lx.TOKEN_KIND_NAMES)
+    last_index:list[int] = [-1] * len(lx.TOKEN_KIND_NAMES)
+    for i, token in enumerate(token_array):
+        if first_index[token.kind] == -1:
+            first_index[token.kind] = i
+        last_index[token.kind] = i
+    return first_index, last_index
 
 # DONE ✅ 
-def pdf_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f'''
----
-output: pdf_document
----
-
-# Criminal Procedure Code 2010
-# (CHAPTER 68)
-# REVISED EDITION 2012
-# SECTIONS 123-125
-
-# CHARGE
+# whether a token of the given kind occurs strictly after position i
+def occurs_after(last_index:list[int], kind:int, i:int) -> bool:
+    return last_index[kind] > i
 
-You, 
-
-**Name:** {vital_information_dict["SUSPECT_NAME"]}
-**NRIC:** {vital_information_dict["SUSPECT_NRIC"]}
-**RACE:** {vital_information_dict["SUSPECT_RACE"]}
-**AGE:** {vital_information_dict["SUSPECT_AGE"]}
-**SEX:** {vital_information_dict["SUSPECT_GENDER"]}
-**NATIONALITY:** {vital_information_dict["SUSPECT_NATIONALITY"]}
-
-are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], *to wit* {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.
+# DONE ✅ 
+# whether a token of the given kind occurs at or before position i
+def occurs_up_to(first_index:list[int], kind:int, i:int) -> bool:
+    return first_index[kind] != -1 and first_index[kind] <= i
 
-{vital_information_dict["CHARGING_OFFICER"]}
-{vital_information_dict["ROLE_DIV"]}
-{vital_information_dict["CHARGING_DATE"]}
-                            '''
-    return final_charge_txt
+# --------------------
 
 # DONE ✅ 
-def docx_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f'''
----
-output: officedown::rdocx_document
----
+# multiset of currently unmatched delimiters, membership checks and removals are constant time however deeply delimiters are nested
+class DelimiterStack:
 
-# Criminal Procedure Code 2010
-# (CHAPTER 68)
-# REVISED EDITION 2012
-# SECTIONS 123-125
+    __slots__ = ("counts",)
 
-# CHARGE
+    def __init__(self) -> None:
+        self.counts:list[int] = [0] * len(lx.TOKEN_KIND_NAMES)
 
-You, 
+    def __contains__(self, kind:int) -> bool:
+        return self.counts[kind] > 0
 
-**Name:** {vital_information_dict["SUSPECT_NAME"]}
-**NRIC:** {vital_information_dict["SUSPECT_NRIC"]}
-**RACE:** {vital_information_dict["SUSPECT_RACE"]}
-**AGE:** {vital_information_dict["SUSPECT_AGE"]}
-**SEX:** {vital_information_dict["SUSPECT_GENDER"]}
-**NATIONALITY:** {vital_information_dict["SUSPECT_NATIONALITY"]}
+    def push(self, kind:int) -> None:
+        self.counts[kind] += 1
 
-are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], *to wit* {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.
+    def remove(self, kind:int) -> None:
+        if self.counts[kind] == 0:
+            raise ValueError("delimiter is not open")
+        self.counts[kind] -= 1
 
-{vital_information_dict["CHARGING_OFFICER"]}
-{vital_information_dict["ROLE_DIV"]}
-{vital_information_dict["CHARGING_DATE"]}
-                            '''
-    return final_charge_txt
+# --------------------
 
 # DONE ✅ 
-def txt_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f'''
-Criminal Procedure Code 2010
-(CHAPTER 68)
-REVISED EDITION 2012
-SECTIONS 123-125
-
-CHARGE
-
-You, 
-
-Name: {vital_information_dict["SUSPECT_NAME"]}
-NRIC: {vital_information_dict["SUSPECT_NRIC"]}
-RACE: {vital_information_dict["SUSPECT_RACE"]}
-AGE: {vital_information_dict["SUSPECT_AGE"]}
-SEX: {vital_information_dict["SUSPECT_GENDER"]}
-NATIONALITY: {vital_information_dict["SUSPECT_NATIONALITY"]}
-
-are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], to wit {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.
-
-{vital_information_dict["CHARGING_OFFICER"]}
-{vital_information_dict["ROLE_DIV"]}
-{vital_information_dict["CHARGING_DATE"]}
-                            '''
-    return final_charge_txt
+# the parsed date, or None once the error has been reported
+def check_date_format(date:str, draft_charge_count:int = 0, token_offset:int = 0, diagnostics:list[dg.Diagnostic] | None = None) -> dates.Date | None :
+    try:
+        parsed_date:dates.Date | None = dates.parse_date(date)
+    except (ValueError, IndexError):
+        return dg.report(diagnostics, "0024", draft_charge_count, token_offset, f"Syntax error detected in the date provided: {date}. Please adhere to the specified format of DD/MM/YYYY and use integers for all values.")
+    if parsed_date is None:
+        return dg.report(diagnostics, "0024", draft_charge_count, token_offset, f"Syntax error detected in the date provided: {date}. Please adhere to the specified format of DD/MM/YYYY")
+    return parsed_date
 
-# DONE ✅ 
-def md_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f'''
-<h2 align="center"><u>Criminal Procedure Code 2010</u></h2>
-<h2 align="center"><u>(CHAPTER 68)</u></h2>
-<h2 align="center"><u>REVISED EDITION 2012</u></h2>
-<h2 align="center"><u>SECTIONS 123-125</u></h2>
-<br>  
-<h2 align="center"><u>CHARGE</u></h2>
-
-You,  
-<div align="center"><b>Name: {vital_information_dict["SUSPECT_NAME"]}</b></div>
-<div align="center"><b>NRIC: {vital_information_dict["SUSPECT_NRIC"]}</b></div>
-<div align="center"><b>RACE: {vital_information_dict["SUSPECT_RACE"]}</b></div>
-<div align="center"><b>AGE: {vital_information_dict["SUSPECT_AGE"]}</b></div>
-<div align="center"><b>SEX: {vital_information_dict["SUSPECT_GENDER"]}</b></div>
-<div align="center"><b>NATIONALITY: {vital_information_dict["SUSPECT_NATIONALITY"]}</b></div>
-<br>
-are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], <i>to wit</i> {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.  
-<br>  
-<br>
-{vital_information_dict["CHARGING_OFFICER"]}<br>
-{vital_information_dict["ROLE_DIV"]}<br>
-{vital_information_dict["CHARGING_DATE"]}
-    '''
-    return final_charge_txt
+# --------------------
 
 # DONE ✅ 
-def html_draft_charge_gen(vital_information_dict:dict) -> str:
-    final_charge_txt:str = f"""
-<!DOCTYPE HTML>
-<html>
-<head>
-    <title>Draft Charge</title>
-    <meta charset='UTF-8'>
-    <meta name="viewport" content="width=device-width, initial-scale=1" />
-</head>
-<body>
-    <h2 align="center"><u>Criminal Procedure Code 2010</u></h2>
-    <h2 align="center"><u>(CHAPTER 68)</u></h2>
-    <h2 align="center"><u>REVISED EDITION 2012</u></h2>
-    <h2 align="center"><u>SECTIONS 123-125</u></h2><br>
-    <h2 align="center"><u>CHARGE</u></h2>
-
-    <div>You,</div>
-    <div align="center"><b>Name: {vital_information_dict["SUSPECT_NAME"]}</b></div>
-    <div align="center"><b>NRIC: {vital_information_dict["SUSPECT_NRIC"]}</b></div>
-    <div align="center"><b>RACE: {vital_information_dict["SUSPECT_RACE"]}</b></div>
-    <div align="center"><b>AGE: {vital_information_dict["SUSPECT_AGE"]}</b></div>
-    <div align="center"><b>SEX: {vital_information_dict["SUSPECT_GENDER"]}</b></div>
-    <div align="center"><b>NATIONALITY: {vital_information_dict["SUSPECT_NATIONALITY"]}</b></div><br>
-
-    <div>are charged that you, on (or about) {vital_information_dict["OFFENSE_DATE"]} at [location, add as necessary], Singapore, did [add brief summary of charge], <i>to wit</i> {vital_information_dict["CHARGE_EXPLANATION"]}, and you have thereby committed an offence under {vital_information_dict["STATUTE"]}.<br><br></div>
-
-    <div>{vital_information_dict["CHARGING_OFFICER"]}</div>
-    <div>{vital_information_dict["ROLE_DIV"]}</div>
-    <div>{vital_information_dict["CHARGING_DATE"]}</div>
-</body>
-</html>
-    """
-    return final_charge_txt
-
+def create_date(date:str) -> str | None:
+    try:
+        parsed_date:dates.Date | None = dates.parse_date(date)
+    except (ValueError, IndexError):
+        return None
+    return parsed_date.text if parsed_date is not None else None
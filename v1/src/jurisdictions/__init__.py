@@ -0,0 +1,49 @@
+# Jurisdictions --> registry of the jurisdictions draft charges are laid out for, each defined in its own module of this package and imported only when a charge of that jurisdiction is first compiled
+
+import importlib
+from functools import cache
+from typing import NamedTuple
+
+# adding a jurisdiction means adding its module here, defining JURISDICTION, and its entry to JURISDICTIONS
+# its sections, templates and PDF and DOCX layouts are compiled from the definition on first use and cached for the rest of the process, see sections.section_table, templates.compile_template, pdf_writer.compiled_layout and docx_writer.body_template
+
+# jurisdiction --> what it is listed as, its module is jurisdictions.<jurisdiction>
+JURISDICTIONS:dict[str, str] = {
+    "singapore": "Singapore",
+    "malaysia": "Malaysia",
+    "uk": "United Kingdom",
+    "india": "India",
+    "australia": "Australia",
+}
+
+# ---
+
+# DONE ✅ 
+# how a jurisdiction lays out a charge, every format is built from the same parts in this order
+#   name         its key in JURISDICTIONS
+#   headings     the act and chapter the charge is brought under, one heading per line
+#   title        heading of the charge itself
+#   addressee    line addressing the suspect
+#   particulars  (label, field) of each particular of the suspect, one line each
+#   charge       paragraph setting out the charge, {field} names fields of records.DraftCharge and *...* is set in italics
+#   signature    lines closing the charge, naming the charging officer
+#   sections     the table of sections.Section its charges are written with, which decides the fields they fill
+class Jurisdiction(NamedTuple):
+    name:str
+    headings:tuple[str, ...]
+    title:str
+    addressee:str
+    particulars:tuple[tuple[str, str], ...]
+    charge:str
+    signature:tuple[str, ...]
+    sections:tuple
+
+# ---
+
+# DONE ✅ 
+# the definition of a jurisdiction, its module is imported the first time it is asked for, so a run never loads jurisdictions it has no charges for
+@cache
+def load(jurisdiction:str) -> Jurisdiction:
+    if jurisdiction not in JURISDICTIONS:
+        raise ValueError(f"Unknown jurisdiction {jurisdiction}, DC currently supports one of the following [{'/'.join(JURISDICTIONS)}].")
+    return importlib.import_module(f"{__name__}.{jurisdiction}").JURISDICTION
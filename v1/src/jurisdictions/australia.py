@@ -0,0 +1,19 @@
+# Australia --> charge sheets under the Crimes Act 1900 and Criminal Code Act 1995, the accused identified by date of birth and address
+
+import sections
+from jurisdictions import Jurisdiction
+
+JURISDICTION:Jurisdiction = Jurisdiction(
+    name="australia",
+    headings=("Criminal Charge", "Commonwealth of Australia"),
+    title="CHARGE SHEET",
+    addressee="Accused:",
+    particulars=(
+        ("Full Name", "suspect_name"),
+        ("Date of Birth", "suspect_dob"),
+        ("Address", "suspect_address"),
+    ),
+    charge="That on or about {offense_date} at {charge_location}, the accused did {charge_explanation}, contrary to {statute}.",
+    signature=("Informant: {charging_officer}", "{role_div}", "Date of Charge: {charging_date}"),
+    sections=sections.ADDRESS_SECTIONS,
+)
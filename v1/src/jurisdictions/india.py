@@ -0,0 +1,19 @@
+# India --> charge sheets under the Indian Penal Code 1860, the accused identified by date of birth and address
+
+import sections
+from jurisdictions import Jurisdiction
+
+JURISDICTION:Jurisdiction = Jurisdiction(
+    name="india",
+    headings=("First Information Report", "Republic of India"),
+    title="CHARGE SHEET",
+    addressee="Accused Person:",
+    particulars=(
+        ("Name", "suspect_name"),
+        ("Date of Birth", "suspect_dob"),
+        ("Address", "suspect_address"),
+    ),
+    charge="That on or about {offense_date} at {charge_location}, the accused did commit the offence of {charge_explanation}, punishable under {statute}.",
+    signature=("Investigating Officer: {charging_officer}", "{role_div}", "Date: {charging_date}"),
+    sections=sections.ADDRESS_SECTIONS,
+)
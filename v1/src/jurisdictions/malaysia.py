@@ -0,0 +1,22 @@
+# Malaysia --> charges under the Kanun Prosedur Jenayah (Criminal Procedure Code), set in Malay and English
+
+import sections
+from jurisdictions import Jurisdiction
+
+JURISDICTION:Jurisdiction = Jurisdiction(
+    name="malaysia",
+    headings=("Kanun Prosedur Jenayah", "(Criminal Procedure Code)"),
+    title="PERTUDUHAN / CHARGE",
+    addressee="Bahawa kamu / You,",
+    particulars=(
+        ("Nama / Name", "suspect_name"),
+        ("No. K/P / NRIC", "suspect_nric"),
+        ("Bangsa / Race", "suspect_race"),
+        ("Umur / Age", "suspect_age"),
+        ("Jantina / Sex", "suspect_gender"),
+        ("Kewarganegaraan / Nationality", "suspect_nationality"),
+    ),
+    charge="adalah dituduh bahawa kamu pada / are charged that you on (or about) {offense_date} di / at [tempat / location, add as necessary], Malaysia, telah / did {charge_explanation}, dan dengan itu kamu telah melakukan satu kesalahan di bawah / and you have thereby committed an offence under {statute}.",
+    signature=("{charging_officer}", "{role_div}", "Tarikh / Date: {charging_date}"),
+    sections=sections.SECTIONS,
+)
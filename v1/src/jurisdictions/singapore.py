@@ -0,0 +1,22 @@
+# Singapore --> charges under the Criminal Procedure Code 2010
+
+import sections
+from jurisdictions import Jurisdiction
+
+JURISDICTION:Jurisdiction = Jurisdiction(
+    name="singapore",
+    headings=("Criminal Procedure Code 2010", "(CHAPTER 68)", "REVISED EDITION 2012", "SECTIONS 123-125"),
+    title="CHARGE",
+    addressee="You,",
+    particulars=(
+        ("Name", "suspect_name"),
+        ("NRIC", "suspect_nric"),
+        ("RACE", "suspect_race"),
+        ("AGE", "suspect_age"),
+        ("SEX", "suspect_gender"),
+        ("NATIONALITY", "suspect_nationality"),
+    ),
+    charge="are charged that you, on (or about) {offense_date} at [location, add as necessary], Singapore, did [add brief summary of charge], *to wit* {charge_explanation}, and you have thereby committed an offence under {statute}.",
+    signature=("{charging_officer}", "{role_div}", "{charging_date}"),
+    sections=sections.SECTIONS,
+)
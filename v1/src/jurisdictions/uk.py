@@ -0,0 +1,19 @@
+# UK --> charge sheets under the Criminal Justice Act 2003, the defendant identified by date of birth and address
+
+import sections
+from jurisdictions import Jurisdiction
+
+JURISDICTION:Jurisdiction = Jurisdiction(
+    name="uk",
+    headings=("Criminal Justice Act 2003",),
+    title="CHARGE SHEET",
+    addressee="Defendant:",
+    particulars=(
+        ("Name", "suspect_name"),
+        ("Date of Birth", "suspect_dob"),
+        ("Address", "suspect_address"),
+    ),
+    charge="That you on {offense_date} at {charge_location}, did {charge_explanation}, contrary to {statute}.",
+    signature=("Prosecutor: {charging_officer}", "{role_div}", "Date: {charging_date}"),
+    sections=sections.ADDRESS_SECTIONS,
+)
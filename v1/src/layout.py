@@ -0,0 +1,37 @@
+# Layout --> the blocks of a draft charge as laid out by the native PDF and DOCX writers, which set the text themselves rather than filling in a template
+
+from functools import cache
+import jurisdictions
+
+# each block of a charge is (style, text), text names fields of records.DraftCharge as {field} and sets *...* in italics
+#   heading    bold, centred and underlined
+#   centred    bold and centred
+#   left       regular, wrapped at the right margin
+#   space      a blank line
+# the layout follows the TXT and HTML templates, built from the parts of the charge's jurisdiction
+
+# ---
+
+# DONE ✅ 
+# the blocks of a jurisdiction's charges, built once per jurisdiction
+@cache
+def charge_layout(jurisdiction:str) -> tuple[tuple[str, str], ...]:
+    definition:jurisdictions.Jurisdiction = jurisdictions.load(jurisdiction)
+    return (
+        *(("heading", heading) for heading in definition.headings),
+        ("space", ""),
+        ("heading", definition.title),
+        ("space", ""),
+        ("left", definition.addressee),
+        *(("centred", f"{label}: {{{field}}}") for label, field in definition.particulars),
+        ("space", ""),
+        ("left", definition.charge),
+        ("space", ""),
+        ("space", ""),
+        *(("left", line) for line in definition.signature),
+    )
+
+# DONE ✅ 
+# a block's text split on * into (italic, text) runs
+def italic_runs(text:str) -> list[tuple[bool, str]]:
+    return [(i % 2 == 1, run) for i, run in enumerate(text.split("*")) if run]
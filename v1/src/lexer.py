@@ -1,6 +1,7 @@
 # handles lexical analysis of dc files
 
 import re 
+from records import Token
 
 # defines the grammer rules for the markup language
 # order of patterns matters since they're checked from top to bottom. Place more specific patterns before generic ones.
@@ -17,19 +18,61 @@ grammer_pattern:list = [
     ('WORD', r'[A-Za-z0-9;,.?$!%-+*_/()]+'),
         ]
 
-# create the token array, which contains dictionaries of the data type and value of each token
-def lexer(input_string:str):
-    token_array:list = []
-    while input_string: 
-        match_val = None 
-        for data_type, regex_pattern in grammer_pattern:
-            regex_1 = re.compile(regex_pattern) # .compile() method takes in a string and converts it to a machine readable regular expression pattern which can be applied to a string
-            match_val = regex_1.match(input_string)
-            if match_val:
-                matched_token = match_val.group(0)
-                token_array.append({"type": data_type, "value": matched_token}) 
-                input_string = input_string[len(matched_token):].lstrip() 
-                break
-        if not match_val:
-            raise ValueError(f"Please follow the specified syntax: {input_string}")
+# token kinds, interned as the position of their rule in grammer_pattern
+OUTPUT_FORMAT, L_SUSPECT_INFO, R_SUSPECT_INFO, L_CHARGE_INFO, R_CHARGE_INFO, STATUTE_INFO, L_CHARGING_OFFICER_INFO, R_CHARGING_OFFICER_INFO, COMMENT, WORD = range(len(grammer_pattern))
+TOKEN_KIND_NAMES:list[str] = [data_type for data_type, _ in grammer_pattern]
+
+# all grammer rules compiled once into a single alternation of named groups, alternation order preserves the top to bottom priority above
+# whitespace following a token is consumed as part of its match instead of re-slicing the input string
+master_pattern:re.Pattern = re.compile("(?:" + "|".join(f"(?P<{data_type}>{regex_pattern})" for data_type, regex_pattern in grammer_pattern) + r")\s*")
+# the same rules over bytes, so memory-mapped sources are lexed in place without being decoded first
+master_pattern_bytes:re.Pattern = re.compile(master_pattern.pattern.encode())
+
+# tokens are interned by value, which always lexes to the same kind, so repeated words and every delimiter share one Token
+# values lexed from bytes are interned under their bytes, so they are decoded once rather than once per occurrence
+# the table is cleared once it holds INTERNED_TOKEN_LIMIT distinct values, keeping memory bounded on large vocabularies
+INTERNED_TOKEN_LIMIT:int = 65536
+interned_tokens:dict[str | bytes, Token] = {}
+
+# create the token array, which contains the kind and value of each token
+# runs in linear time, the scanner advances a position index through the input string and never copies the unscanned remainder
+# input_string is a str or any bytes-like buffer such as an mmap, of which only input_string[start:end] is lexed
+def lexer(input_string:str | bytes, start:int = 0, end:int | None = None) -> list[Token]:
+    token_array:list[Token] = []
+    end = len(input_string) if end is None else end
+    if input_string[start:start + 1].isspace() and start < end: # leading whitespace is not skipped, only whitespace following a token
+        raise ValueError(f"Please follow the specified syntax: {remainder(input_string, start, end)}")
+    pattern:re.Pattern = master_pattern if isinstance(input_string, str) else master_pattern_bytes
+    position:int = start
+    for match_val in iter(pattern.scanner(input_string, start, end).match, None):
+        position = match_val.end()
+        value:str | bytes = match_val[match_val.lastindex]
+        token:Token | None = interned_tokens.get(value)
+        if token is None:
+            if len(interned_tokens) >= INTERNED_TOKEN_LIMIT:
+                interned_tokens.clear()
+            token = interned_tokens[value] = Token(match_val.lastindex - 1, value if isinstance(value, str) else value.decode()) # group numbers follow the order of grammer_pattern
+        token_array.append(token)
+    if position != end:
+        raise ValueError(f"Please follow the specified syntax: {remainder(input_string, position, end)}")
     return token_array
+
+# the unlexed rest of the offending line, quoted in syntax errors
+def remainder(input_string:str | bytes, start:int, end:int) -> str:
+    if isinstance(input_string, str):
+        return input_string[start:end].split("\n", 1)[0].rstrip()
+    return bytes(input_string[start:end]).split(b"\n", 1)[0].decode(errors="replace").rstrip()
+
+# start offset in input_string of each token lexer would return, followed by the offset scanning stopped at (end unless the input does not lex)
+# only used to locate diagnostics, so the tokens themselves are not built
+def token_offsets(input_string:str | bytes, start:int = 0, end:int | None = None) -> list[int]:
+    end = len(input_string) if end is None else end
+    offsets:list[int] = []
+    position:int = start
+    if not (input_string[start:start + 1].isspace() and start < end):
+        pattern:re.Pattern = master_pattern if isinstance(input_string, str) else master_pattern_bytes
+        for match_val in iter(pattern.scanner(input_string, start, end).match, None):
+            offsets.append(match_val.start())
+            position = match_val.end()
+    offsets.append(position)
+    return offsets
@@ -1,6 +1,28 @@
 import os
+import sys
+import glob
+import time
+import fnmatch
+import argparse
+import contextlib
+from collections.abc import Iterator
 import lexer as lx
 import interpreter as inter
+import batch
+import cache
+import output
+import bundle
+import export
+import index
+import watch
+import server
+import compiled
+import templates
+import diagnostics as dg
+import source
+import profiling
+from records import DEFAULT_JURISDICTION
+from jurisdictions import JURISDICTIONS
 
 # --- 
 
@@ -11,63 +33,416 @@ def debug_print_original():
         print(line,end="")
 
 # ---
-    
-# DONE ✅ 
-def main():
-    overall_token_array:list[tuple] = []
-    file_str:str = ""
-    file_name:str = input("Name of dc file: ").split(".")[0]
-    fhand = open(f"../samples/{file_name}.dc", "r") 
-    for line in fhand:
-        file_str += f"{line.strip()}"
-    dc_array:list[str]= file_str.split("---")
-    fhand.close()
-    # print(dc_array)
 
-    for dc in dc_array:
+# DONE ✅ 
+# lexes each charge block of a source in place, blocks that do not lex are reported and skipped
+def lex_charge_blocks(file_name:str, source_file:source.SourceFile) -> Iterator[tuple]:
+    for start, end in source_file.blocks():
         try:
-            each_token_array = lx.lexer(dc)
-            overall_token_array.append((file_name, each_token_array))
+            each_token_array = lx.lexer(source_file.buffer, start, end)
+            yield (file_name, each_token_array)
         except ValueError as e:
             print(f"Error log: {e}") # error logging 
+
+# ---
+    
+STDIN_PATH:str = source.STDIN_PATH
+
+# DONE ✅ 
+# pairs each dc file with the name its outputs are written under, expanding globs the shell left alone and reading - as stdin
+# prompts for a file in the samples directory when none were given on an interactive terminal, and reads stdin when input is piped
+def resolve_sources(file_paths:list[str], stdin_name:str = "stdin") -> list[tuple[str, str]]:
+    if not file_paths:
+        if not sys.stdin.isatty():
+            return [(stdin_name, STDIN_PATH)]
+        file_name:str = input("Name of dc file: ").split(".")[0]
+        return [(file_name, f"../samples/{file_name}.dc")]
+    sources:list[tuple[str, str]] = []
+    seen:set[str] = set()
+    for file_path in file_paths:
+        if file_path == STDIN_PATH:
+            matches:list[str] = [STDIN_PATH]
+        elif glob.has_magic(file_path):
+            matches = [match for match in sorted(glob.glob(file_path, recursive=True)) if not match.endswith(compiled.DCC_SUFFIX)] # .dcc files sit next to the dc files they were compiled from
+        else:
+            matches = [file_path] if os.path.isfile(file_path) else []
+        if not matches:
+            print(f"Error log: No dc file matches {file_path}")
+        for match in matches:
+            if os.path.abspath(match) not in seen: # the same file given twice, as d/a.dc and ./d/a.dc, is compiled once
+                seen.add(os.path.abspath(match))
+                sources.append((stdin_name if match == STDIN_PATH else os.path.basename(match).split(".")[0], match))
+    return sources
+
+# DONE ✅ 
+# name a source's unrendered charges are known by, its directory followed by its file name, so sources that share a name in different directories are told apart
+# stdin keeps its name, see interpreter.origin_charge and index.charge_source
+def source_name(file_name:str, file_path:str) -> str:
+    if file_path == STDIN_PATH:
+        return file_name
+    return os.path.join(os.path.dirname(os.path.abspath(file_path)), file_name)
+
+# DONE ✅ 
+# pairs each source with the jurisdiction its charges are laid out for, given by --jurisdiction as NAME for every file or NAME=GLOB for the files matching GLOB
+# the last --jurisdiction a file matches wins, files matching none are laid out for DEFAULT_JURISDICTION, None if any NAME is not a known jurisdiction
+def assign_jurisdictions(sources:list[tuple[str, str]], jurisdiction_specs:list[str]) -> list[tuple[str, str, str]] | None:
+    rules:list[tuple[str, str]] = []
+    for jurisdiction_spec in jurisdiction_specs:
+        jurisdiction, _, pattern = jurisdiction_spec.partition("=")
+        if jurisdiction.strip().lower() not in JURISDICTIONS:
+            return None
+        rules.append((jurisdiction.strip().lower(), pattern or "*"))
+    assigned:list[tuple[str, str, str]] = []
+    for file_name, file_path in sources:
+        jurisdiction = DEFAULT_JURISDICTION
+        for rule_jurisdiction, pattern in rules:
+            if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(os.path.basename(file_path), pattern):
+                jurisdiction = rule_jurisdiction
+        assigned.append((file_name, file_path, jurisdiction))
+    return assigned
+
+# ---
+    
+# DONE ✅ 
+def main(file_name:str, file_path:str):
+    with source.SourceFile(file_path) as source_file:
+        overall_token_array:list[tuple] = list(lex_charge_blocks(file_name, source_file))
     return overall_token_array
 
 # ---
 
 # DONE ✅ 
-def event_loop() -> None:
-    dc_array:list[tuple] | None = inter.parser_interpreter(main()) # expressing the possible enums
-    if dc_array is not None:
-        for dc in dc_array:
-            dc_file_name:str = dc[0] 
-            dc_file_contents:str = dc[1]
-
-            if "|" in dc_file_name:
-                os.system("clear")
-                match dc_file_name.split("|")[-1]:
-                    case "PDF":
-                        dc_file_name = dc_file_name.split("|")[0]
-                        fhand = open(dc_file_name,"w")
-                        fhand.write(dc_file_contents)
-                        fhand.close()
-                        os.system(f"rmarkdown::render('{dc_file_name}')")
-                        print(f"DC4U has created your file: {dc_file_name}")
-
-                    case "DOCX":
-                        dc_file_name = dc_file_name.split("|")[0]
-                        fhand = open(dc_file_name,"w")
-                        fhand.write(dc_file_contents)
-                        fhand.close()
-                        os.system(f"rmarkdown::render('{dc_file_name}')")
-                        print(f"DC4U has created your file: {dc_file_name}")
-            else:
-                fhand = open(dc_file_name,"w")
-                fhand.write(dc_file_contents)
-                fhand.close()
-                print(f"DC4U has created your file: {dc_file_name}")
+# key of the .dcc file a source's charges are kept in, None for stdin or when .dcc files are not used
+def dcc_key(file_path:str, source_file:source.SourceFile, use_dcc:bool, jurisdiction:str = DEFAULT_JURISDICTION) -> bytes | None:
+    if not use_dcc or file_path == STDIN_PATH:
+        return None
+    return compiled.source_key(source_file.buffer, jurisdiction)
+
+# DONE ✅ 
+# writes the charges of a source from its .dcc file without lexing or interpreting it, returning how many or None when there is no up to date .dcc file
+# every charge in a .dcc file is valid, so each is numbered by its position the way every loop numbers them
+def write_compiled(file_name:str, file_path:str, key:bytes | None, writer:output.OutputWriter, render:bool = True) -> int | None:
+    if key is None:
+        return None
+    vital_informations:list | None = compiled.load(file_path, key)
+    if vital_informations is None:
+        return None
+    for draft_charge_count, vital_information in enumerate(vital_informations, start=1):
+        draft_charge:tuple = inter.generate_charge(file_name, draft_charge_count, vital_information) if render else inter.origin_charge(file_name, draft_charge_count)
+        writer.write(draft_charge + (vital_information,))
+    return len(vital_informations)
+
+# DONE ✅ 
+# keeps the charges compiled from a source in its .dcc file, only once every one of its charge blocks compiled
+# vital_informations is None when there is no .dcc file to keep them in
+def store_compiled(file_path:str, key:bytes | None, source_file:source.SourceFile, vital_informations:list | None) -> None:
+    if key is not None and len(vital_informations) == sum(1 for _ in source_file.blocks()):
+        compiled.store(file_path, key, vital_informations)
     return None
 
 # ---
 
-event_loop()
+# DONE ✅ 
+def event_loop(sources:list[tuple[str, str, str]], writer:output.OutputWriter, use_dcc:bool = True, render:bool = True) -> None:
+    for file_name, file_path, jurisdiction in sources:
+        with source.SourceFile(file_path) as source_file:
+            key:bytes | None = dcc_key(file_path, source_file, use_dcc, jurisdiction)
+            if write_compiled(file_name, file_path, key, writer, render) is not None:
+                continue
+            dc_array:list[tuple] | None = inter.parser_interpreter(list(lex_charge_blocks(file_name, source_file)), jurisdiction, render) # expressing the possible enums
+            if dc_array is not None:
+                store_compiled(file_path, key, source_file, [dc[2] for dc in dc_array])
+        if dc_array is not None:
+            for dc in dc_array:
+                writer.write(dc)
+    return None
 
+# ---
+
+# DONE ✅ 
+# streaming counterpart of event_loop, each charge block is lexed, interpreted and written before the next one is read
+# charges preceding an invalid charge have already been written when it is reported
+def stream_loop(sources:list[tuple[str, str, str]], writer:output.OutputWriter, use_dcc:bool = True, render:bool = True) -> None:
+    for file_name, file_path, jurisdiction in sources:
+        with source.SourceFile(file_path) as source_file:
+            key:bytes | None = dcc_key(file_path, source_file, use_dcc, jurisdiction)
+            if write_compiled(file_name, file_path, key, writer, render) is not None:
+                continue
+            vital_informations:list | None = [] if key is not None else None # only kept for the .dcc file, so memory stays flat without one
+            for dc in inter.stream_interpreter(lex_charge_blocks(file_name, source_file), jurisdiction, render):
+                writer.write(dc)
+                if vital_informations is not None:
+                    vital_informations.append(dc[2])
+            store_compiled(file_path, key, source_file, vital_informations)
+    return None
+
+# ---
+
+# DONE ✅ 
+# error-collecting counterpart of stream_loop, an invalid charge is reported and the charges after it are still compiled and written
+# charges are numbered by their position in the file, and the diagnostics of every invalid charge are returned in a machine-readable report
+def check_loop(sources:list[tuple[str, str, str]], writer:output.OutputWriter, use_dcc:bool = True, render:bool = True) -> dict:
+    collected:list[dg.Diagnostic] = []
+    charge_total:int = 0
+    created_total:int = 0
+    for file_name, file_path, jurisdiction in sources:
+        diagnostics:list[dg.Diagnostic] = []
+        with source.SourceFile(file_path) as source_file:
+            key:bytes | None = dcc_key(file_path, source_file, use_dcc, jurisdiction)
+            written:int | None = write_compiled(file_name, file_path, key, writer, render)
+            if written is not None:
+                charge_total += written
+                created_total += written
+                continue
+            vital_informations:list | None = [] if key is not None else None
+            for draft_charge_count, (start, end) in enumerate(source_file.blocks(), start=1):
+                charge_total += 1
+                draft_charge:tuple | None = inter.compile_block(file_name, source_file.buffer, draft_charge_count, diagnostics, start, end, jurisdiction, render)
+                if draft_charge is not None:
+                    created_total += 1
+                    writer.write(draft_charge)
+                    if vital_informations is not None:
+                        vital_informations.append(draft_charge[2])
+            store_compiled(file_path, key, source_file, vital_informations)
+            dg.locate(source_file, diagnostics)
+        collected.extend(diagnostics)
+    if charge_total != created_total:
+        print(f"DC4U could not create {charge_total - created_total} draft charge(s), please fix the errors above.")
+    return dg.build_report(charge_total, created_total, collected)
+
+# DONE ✅ 
+# a source is opened again to locate its diagnostics once its charges have all been compiled
+# stdin cannot be read a second time, so its diagnostics are reported without a line and column
+def finish_diagnostics(file_path:str, diagnostics:list[dg.Diagnostic], collected:list[dg.Diagnostic]) -> None:
+    if diagnostics and file_path != STDIN_PATH:
+        with source.SourceFile(file_path) as source_file:
+            dg.locate(source_file, diagnostics)
+    for diagnostic in diagnostics:
+        diagnostic.file_path = file_path
+    collected.extend(diagnostics)
+    return None
+
+# ---
+
+# DONE ✅ 
+def batch_jobs(sources:list[tuple[str, str, str]], render:bool = True) -> Iterator[tuple]:
+    for file_name, file_path, jurisdiction in sources:
+        with source.SourceFile(file_path) as source_file:
+            for draft_charge_count, (start, dc) in enumerate(source_file.block_texts(), start=1):
+                yield (file_name, file_path, draft_charge_count, dc, start, jurisdiction, render)
+
+# DONE ✅ 
+# parallel counterpart of event_loop, charge blocks of every file are compiled across a pool of worker processes
+# charges are numbered by their position in the file, and an invalid charge is reported without discarding the others
+# sources with an up to date .dcc file are written from it before the others are handed to the pool
+# sources are told apart by their path, as files in different directories can share a name
+def batch_loop(sources:list[tuple[str, str, str]], jobs:int, writer:output.OutputWriter, use_dcc:bool = True, render:bool = True) -> dict:
+    file_diagnostics:dict[str, list[dg.Diagnostic]] = {}
+    keys:dict[str, bytes | None] = {}
+    charge_total:int = 0
+    failed_count:int = 0
+    remaining:list[tuple[str, str, str]] = []
+    for file_name, file_path, jurisdiction in sources:
+        if file_path == STDIN_PATH: # stdin has no .dcc file and can only be read once, by batch_jobs
+            keys[file_path] = None
+            remaining.append((file_name, file_path, jurisdiction))
+            continue
+        with source.SourceFile(file_path) as source_file:
+            keys[file_path] = dcc_key(file_path, source_file, use_dcc, jurisdiction)
+            written:int | None = write_compiled(file_name, file_path, keys[file_path], writer, render)
+        if written is None:
+            remaining.append((file_name, file_path, jurisdiction))
+        else:
+            charge_total += written
+    file_charges:dict[str, list | None] = {} # file path --> charges compiled from it, None once one of them is invalid or when it has no .dcc file
+    for file_path, _, dc, error_log, diagnostics in batch.batch_compile(batch_jobs(remaining, render), jobs):
+        print(error_log, end="")
+        charge_total += 1
+        file_diagnostics.setdefault(file_path, []).extend(diagnostics)
+        if dc is None:
+            failed_count += 1
+            file_charges[file_path] = None
+            continue
+        if file_charges.setdefault(file_path, [] if keys[file_path] is not None else None) is not None:
+            file_charges[file_path].append(dc[2])
+        writer.write(dc)
+    for file_path, vital_informations in file_charges.items():
+        if vital_informations is not None and keys[file_path] is not None:
+            compiled.store(file_path, keys[file_path], vital_informations)
+    if failed_count:
+        print(f"DC4U could not create {failed_count} draft charge(s), please fix the errors above.")
+    collected:list[dg.Diagnostic] = []
+    for file_path, diagnostics in file_diagnostics.items():
+        finish_diagnostics(file_path, diagnostics, collected)
+    return dg.build_report(charge_total, charge_total - failed_count, collected)
+
+# ---
+
+# DONE ✅ 
+# rebuilds a source whenever it is saved, polling its modification time, only charge blocks that changed are recompiled and only their outputs rewritten
+def watch_loop(sources:list[tuple[str, str, str]], writer:output.OutputWriter, interval:float) -> None:
+    compilers:dict[str, watch.IncrementalCompiler] = {file_path: watch.IncrementalCompiler(file_name, jurisdiction) for file_name, file_path, jurisdiction in sources}
+    last_seen:dict[str, tuple[int, int]] = {}
+    try:
+        while True:
+            for file_name, file_path, _ in sources:
+                try:
+                    stat:os.stat_result = os.stat(file_path)
+                except FileNotFoundError: # some editors save by replacing the file
+                    continue
+                if last_seen.get(file_path) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                last_seen[file_path] = (stat.st_mtime_ns, stat.st_size)
+                with source.SourceFile(file_path, use_mmap=False) as source_file: # a mapped file truncated by the editor mid-read would crash
+                    draft_charges:list[tuple] = compilers[file_path].update(dc for _, dc in source_file.block_texts())
+                for dc_file_name in compilers[file_path].removed: # removed before the rebuilt outputs are written, which may share a name with them under --format
+                    writer.remove(dc_file_name)
+                for dc in draft_charges:
+                    writer.write(dc)
+                writer.flush()
+                print(f"DC4U is watching {file_path} for changes, press Ctrl-C to stop.")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return None
+
+# ---
+
+def parse_args(argv:list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="dc4u", description="Draft Charges 4 U, a legal draft charge creator.")
+    parser.add_argument("files", nargs="*", help="dc files or globs to compile, - reads from stdin, read from stdin when piped and prompted for otherwise when none are given")
+    parser.add_argument("--output-dir", "-o", default="", metavar="DIR", help="directory outputs are written to, created if missing (default the current directory)")
+    parser.add_argument("--stdout", action="store_true", help="write HTML/TXT/MD/RMD outputs to stdout instead of files, with messages going to stderr")
+    parser.add_argument("--bundle", metavar="FILE", help="write every charge into the single bundle FILE instead of one file per charge, a .zip, .tar, .tar.gz or .tgz archive, a .pdf or .docx or a .html, .txt or .md document with an index, placed under --output-dir and never cached")
+    parser.add_argument("--export", metavar="FILE", help="write the vital information of every charge as one row of FILE instead of rendering it, a .jsonl (or .ndjson) or .csv file or a .columns file of typed columns read back with export.read_columnar, placed under --output-dir and never cached")
+    parser.add_argument("--index", metavar="DB", help="record every valid charge in the SQLite database DB instead of rendering it, adding to it run after run, and look charges up in it with: main.py query DB, placed under --output-dir and never cached")
+    parser.add_argument("--name", default="stdin", help="name outputs of charges read from stdin are written under (default stdin)")
+    parser.add_argument("--jobs", "-j", type=int, metavar="N", help="compile charges in parallel across N worker processes, 0 uses every core")
+    parser.add_argument("--render-workers", type=int, default=2, metavar="N", help="number of long-lived PDF/DOCX render workers when rendering through R with DC4U_BACKEND=rmarkdown (default 2)")
+    parser.add_argument("--write-workers", type=int, default=output.WRITE_WORKERS, metavar="N", help=f"threads writing output files, 0 writes them one at a time (default {output.WRITE_WORKERS})")
+    parser.add_argument("--no-cache", action="store_true", help="regenerate every output instead of reusing unchanged ones from the cache")
+    parser.add_argument("--cache-stats", action="store_true", help="print cache hits, misses and size after the run")
+    parser.add_argument("--cache-dir", default=cache.CACHE_DIRECTORY, metavar="DIR", help=f"directory holding cached outputs (default {cache.CACHE_DIRECTORY})")
+    parser.add_argument("--cache-size", type=int, default=cache.CACHE_SIZE // (1024 * 1024), metavar="MB", help="size the cache is trimmed to after each run, least recently used outputs first")
+    parser.add_argument("--watch", action="store_true", help="keep running and recompile the charges that changed whenever a file is saved")
+    parser.add_argument("--watch-interval", type=float, default=0.5, metavar="SECONDS", help="how often watched files are checked for changes (default 0.5)")
+    parser.add_argument("--stream", action="store_true", help="compile and write each charge as soon as it is read instead of validating the whole file first")
+    parser.add_argument("--keep-going", "-k", action="store_true", help="report every invalid charge and still write the valid ones instead of stopping at the first error")
+    parser.add_argument("--report", metavar="FILE", help="write a JSON report of every error found to FILE, implies --keep-going")
+    parser.add_argument("--format", metavar="FMT[,FMT...]", help=f"write every charge in these formats instead of the one its output format directive names, one of {', '.join(templates.TEMPLATES)} or all, each format in its own subdirectory when there is more than one")
+    parser.add_argument("--jurisdiction", action="append", default=[], metavar="NAME[=GLOB]", help=f"lay charges out for jurisdiction NAME, one of {', '.join(JURISDICTIONS)}, for every file or only the files matching GLOB, repeat for batches mixing jurisdictions (default {DEFAULT_JURISDICTION})")
+    parser.add_argument("--no-dcc", action="store_true", help="neither read nor write the .dcc file kept next to each dc file, which holds its compiled charges so unchanged files are not lexed again")
+    parser.add_argument("--serve", metavar="ADDRESS", help="run as a compile server instead, answering JSON requests on a Unix domain socket path or on HTTP at [HOST]:PORT or PORT (HOST defaults to 127.0.0.1), see server.py")
+    parser.add_argument("--serve-output-root", metavar="DIR", help="let compile requests have their outputs written to an output_dir inside DIR on the server, requests naming an output_dir are refused without it")
+    parser.add_argument("--profile", action="store_true", help="print the time spent in each stage and counts of tokens, charges, bytes and renders after the run (stages run by --jobs workers are not included)")
+    parser.add_argument("--trace", metavar="FILE", help="write a Chrome trace of every stage to FILE, viewable in chrome://tracing or Perfetto")
+    return parser.parse_args(argv)
+
+# DONE ✅ 
+# the first two sources whose outputs would be written under the same name, as files sharing a name in different directories are, None if every name is distinct
+def colliding_sources(sources:list[tuple[str, str, str]]) -> tuple[str, str, str] | None:
+    seen:dict[str, str] = {} # file name --> path of the source first written under it
+    for file_name, file_path, _ in sources:
+        if file_name in seen:
+            return file_name, seen[file_name], file_path
+        seen[file_name] = file_path
+    return None
+
+# ---
+
+# DONE ✅ 
+# formats named by --format, None if any of them is not a known format
+def output_formats(format_names:str) -> list[str] | None:
+    if format_names.strip().upper() == "ALL":
+        return list(templates.TEMPLATES)
+    formats:list[str] = []
+    for format_name in format_names.upper().split(","):
+        if format_name.strip() not in templates.TEMPLATES:
+            return None
+        if format_name.strip() not in formats:
+            formats.append(format_name.strip())
+    return formats
+
+# DONE ✅ 
+# returns the exit status, 1 when a run that reports its invalid charges (--jobs, --keep-going, --report) found any
+def run(args:argparse.Namespace, sources:list[tuple[str, str, str]], output_stream) -> int:
+    if args.profile or args.trace:
+        profiling.enable(trace=args.trace is not None)
+    output_cache:cache.OutputCache | None = None if args.no_cache or args.bundle or args.export or args.index else cache.OutputCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    writer:output.OutputWriter | bundle.BundleWriter | export.ExportWriter | index.IndexWriter
+    if args.index:
+        writer = index.IndexWriter(args.index, args.output_dir)
+    elif args.export:
+        writer = export.ExportWriter(args.export, args.output_dir)
+    elif args.bundle:
+        writer = bundle.BundleWriter(args.bundle, args.render_workers, args.output_dir)
+    else:
+        writer = output.OutputWriter(args.render_workers, output_cache, args.output_dir, output_stream, args.write_workers)
+    if args.format:
+        writer = output.FormatWriter(writer, output_formats(args.format), None if args.bundle else args.output_dir)
+    report:dict | None = None
+    use_dcc:bool = not args.no_dcc
+    render:bool = not isinstance(writer, (export.ExportWriter, index.IndexWriter)) # an export or index keeps only the vital information of each charge, so charges are never rendered for it
+    if not render:
+        sources = [(source_name(file_name, file_path), file_path, jurisdiction) for file_name, file_path, jurisdiction in sources]
+    if args.watch:
+        watch_loop(sources, writer, args.watch_interval)
+    elif args.jobs is not None:
+        report = batch_loop(sources, args.jobs, writer, use_dcc, render)
+    elif args.keep_going or args.report:
+        report = check_loop(sources, writer, use_dcc, render)
+    elif args.stream:
+        stream_loop(sources, writer, use_dcc, render)
+    else:
+        event_loop(sources, writer, use_dcc, render)
+    writer.close()
+    if output_cache is not None and args.cache_stats:
+        output_cache.report()
+    if report is not None and args.report:
+        dg.write_report(args.report, report)
+    profiling.finish(args.profile, args.trace)
+    return 1 if report is not None and report["failed"] else 0
+
+# ---
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["query"]: # a dc file named query is compiled with ./query
+        sys.exit(index.query_main(sys.argv[2:]))
+    args:argparse.Namespace = parse_args()
+    if args.serve:
+        server.serve(args.serve, args.render_workers, args.serve_output_root)
+        sys.exit(0)
+    sources:list[tuple[str, str, str]] | None = assign_jurisdictions(resolve_sources(args.files, args.name), args.jurisdiction)
+    if sources is None:
+        print(f"Error log: --jurisdiction takes NAME or NAME=GLOB, where NAME is one of {', '.join(JURISDICTIONS)}")
+        sys.exit(2)
+    if args.watch and any(file_path == STDIN_PATH for _, file_path, _ in sources):
+        print("Error log: stdin cannot be watched for changes")
+        sys.exit(2)
+    if args.bundle and (bundle.bundle_kind(args.bundle) is None or args.watch or args.stdout):
+        print("Error log: --bundle takes a .zip, .tar, .tar.gz, .tgz, .pdf, .docx, .html, .txt or .md file and cannot be combined with --watch or --stdout")
+        sys.exit(2)
+    if args.export and (export.export_kind(args.export) is None or args.bundle or args.watch or args.stdout or args.format):
+        print("Error log: --export takes a .jsonl, .ndjson, .csv or .columns file and cannot be combined with --bundle, --watch, --stdout or --format")
+        sys.exit(2)
+    if args.index and (args.bundle or args.export or args.watch or args.stdout or args.format):
+        print("Error log: --index cannot be combined with --bundle, --export, --watch, --stdout or --format")
+        sys.exit(2)
+    if args.format and output_formats(args.format) is None:
+        print(f"Error log: --format takes a comma-separated list of {', '.join(templates.TEMPLATES)}, or all")
+        sys.exit(2)
+    collision:tuple[str, str, str] | None = None if args.export or args.index else colliding_sources(sources) # an export or index tells sources apart by their path
+    if collision is not None:
+        print(f"Error log: {collision[1]} and {collision[2]} would both be written as {collision[0]}-Draft-Charge-N, compile them in separate runs with different --output-dir or rename one of them")
+        sys.exit(2)
+    if args.stdout:
+        try:
+            with contextlib.redirect_stdout(sys.stderr): # keeps DC4U's messages out of the piped outputs
+                status:int = run(args, sources, sys.__stdout__)
+            sys.__stdout__.flush()
+        except BrokenPipeError: # the reader went away, as with | head
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.__stdout__.fileno())
+            sys.exit(1)
+        sys.exit(status)
+    else:
+        sys.exit(run(args, sources, None))
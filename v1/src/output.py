@@ -0,0 +1,208 @@
+# Output --> writes compiled draft charges to disk, handing PDF/DOCX off to the render pool and reusing unchanged outputs from the cache
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TextIO
+import renderer
+import cache
+import atomic
+import templates
+from records import DraftCharge
+
+WRITE_WORKERS:int = 8 # threads writing output files, writes are I/O bound so they overlap even under the GIL
+WRITE_BATCH_SIZE:int = 16 # files handed to a write thread at a time, amortises the cost of each hand-off
+BATCHES_PER_WORKER:int = 2 # batches in flight per thread before write blocks, which holds the compiler back when the disk falls behind
+
+# ---
+
+# DONE ✅ 
+# file that ends up on disk for a draft charge, PDF and DOCX charges rendered through R (DC4U_BACKEND=rmarkdown) are written as .rmd and rendered next to it
+def rendered_file_name(dc_file_name:str) -> str:
+    match dc_file_name.split("|")[-1]:
+        case "PDF":
+            return os.path.splitext(dc_file_name.split("|")[0])[0] + ".pdf"
+        case "DOCX":
+            return os.path.splitext(dc_file_name.split("|")[0])[0] + ".docx"
+        case _:
+            return dc_file_name
+
+# DONE ✅ 
+# writes each (file name, contents) atomically, returning the error of each file or None once written
+def write_batch(files:list[tuple[str, str | bytes]]) -> list[OSError | None]:
+    errors:list[OSError | None] = []
+    for file_name, contents in files:
+        try:
+            atomic.write_atomic(file_name, contents)
+            errors.append(None)
+        except OSError as e:
+            errors.append(e)
+    return errors
+
+# ---
+
+# DONE ✅ 
+class OutputWriter:
+
+    # outputs are written under output_directory, or text outputs to output_stream when one is given (PDF and DOCX are always rendered to files)
+    # files are written atomically on write_workers threads, 0 writes them on the calling thread
+    def __init__(self, render_workers:int, output_cache:cache.OutputCache | None = None, output_directory:str = "", output_stream:TextIO | None = None, write_workers:int = WRITE_WORKERS) -> None:
+        self.render_pool = renderer.RendererPool(render_workers)
+        self.output_cache:cache.OutputCache | None = output_cache
+        self.output_directory:str = output_directory
+        self.output_stream:TextIO | None = output_stream
+        self.write_pool:ThreadPoolExecutor | None = ThreadPoolExecutor(write_workers, thread_name_prefix="dc4u-write") if write_workers > 0 else None
+        self.batch_size:int = WRITE_BATCH_SIZE if write_workers > 0 else 1
+        self.max_pending_batches:int = write_workers * BATCHES_PER_WORKER
+        self.batch:list[tuple[str, str | bytes]] = [] # (file name, contents) not yet handed to a write thread
+        self.batch_outputs:list[tuple[str, str | None, bool]] = [] # (file name, cache key, whether it is rendered next) of each file in batch
+        self.pending_batches:deque[tuple[Future, list[tuple[str, str | None, bool]]]] = deque() # batches being written, in submission order
+        if output_directory:
+            os.makedirs(output_directory, exist_ok=True)
+
+    # dc is a compiled draft charge, (output file name, contents, vital information)
+    def write(self, dc:tuple) -> None:
+        dc_file_name:str = os.path.join(self.output_directory, dc[0])
+        dc_file_contents:str | bytes = dc[1]
+        key:str | None = None
+        if self.output_stream is not None and "|" not in dc_file_name and isinstance(dc_file_contents, str): # natively written PDF and DOCX go to files like rendered ones
+            self.output_stream.write(dc_file_contents if dc_file_contents.endswith("\n") else dc_file_contents + "\n")
+            return None
+        if self.output_cache is not None:
+            key = self.output_cache.key(dc[2])
+            if self.output_cache.fetch(key, rendered_file_name(dc_file_name)):
+                print(f"DC4U has reused your unchanged file: {rendered_file_name(dc_file_name)}")
+                return None
+        if "|" in dc_file_name:
+            match dc_file_name.split("|")[-1]:
+                case "PDF" | "DOCX":
+                    if key is not None:
+                        self.output_cache.expect(key, dc_file_name.split("|")[0], rendered_file_name(dc_file_name))
+                    self.write_file(dc_file_name.split("|")[0], dc_file_contents, key, True)
+        else:
+            self.write_file(dc_file_name, dc_file_contents, key, False)
+        return None
+
+    # queues an atomic write, the batch is handed to a write thread once full, blocking while too many batches are in flight
+    # batches are finished in the order they were queued, so messages, caching and renders follow the order charges were compiled in
+    def write_file(self, file_name:str, contents:str | bytes, key:str | None, render:bool) -> None:
+        self.batch.append((file_name, contents))
+        self.batch_outputs.append((file_name, key, render))
+        if len(self.batch) >= self.batch_size:
+            self.submit_batch()
+        return None
+
+    def submit_batch(self) -> None:
+        if not self.batch:
+            return None
+        if self.write_pool is None:
+            write:Future = Future()
+            write.set_result(write_batch(self.batch))
+        else:
+            while len(self.pending_batches) >= self.max_pending_batches:
+                self.finish_batch()
+            write = self.write_pool.submit(write_batch, self.batch)
+        self.pending_batches.append((write, self.batch_outputs))
+        self.batch = []
+        self.batch_outputs = []
+        while self.pending_batches and self.pending_batches[0][0].done():
+            self.finish_batch()
+        return None
+
+    def finish_batch(self) -> None:
+        write, outputs = self.pending_batches.popleft()
+        for (file_name, key, render), error in zip(outputs, write.result()):
+            if error is not None:
+                print(f"DC4U could not write {file_name}: {error}", file=sys.stderr)
+            elif render:
+                self.render_pool.submit(file_name)
+            else:
+                print(f"DC4U has created your file: {file_name}")
+                if key is not None:
+                    self.output_cache.store(key, file_name)
+        return None
+
+    def finish_writes(self) -> None:
+        self.submit_batch()
+        while self.pending_batches:
+            self.finish_batch()
+        return None
+
+    # waits for outstanding writes and renders, then caches what was rendered
+    def flush(self) -> None:
+        self.finish_writes()
+        self.finish_renders(self.render_pool.flush())
+        return None
+
+    def close(self) -> None:
+        self.finish_writes()
+        if self.write_pool is not None:
+            self.write_pool.shutdown()
+        self.finish_renders(self.render_pool.close())
+        if self.output_cache is not None:
+            self.output_cache.close()
+        return None
+
+    # deletes the outputs of a draft charge no longer in its source, the .rmd and what was rendered from it for charges rendered through R
+    # text outputs sent to output_stream never reached the disk, so nothing is deleted for them
+    def remove(self, dc_file_name:str) -> None:
+        dc_file_name = os.path.join(self.output_directory, dc_file_name)
+        if self.output_stream is not None and "|" not in dc_file_name and os.path.splitext(dc_file_name)[1] not in (".pdf", ".docx"):
+            return None
+        for file_name in dict.fromkeys((dc_file_name.split("|")[0], rendered_file_name(dc_file_name))):
+            try:
+                os.remove(file_name)
+            except FileNotFoundError:
+                continue
+            print(f"DC4U has removed your file: {file_name}")
+        return None
+
+    def finish_renders(self, render_results:list[renderer.RenderResult]) -> None:
+        renderer.report(render_results)
+        if self.output_cache is not None:
+            self.output_cache.store_rendered(render_results)
+        return None
+
+# ---
+
+# DONE ✅ 
+# writes every draft charge in each of output_formats in place of the format its output format directive chose, so one compile fans out to all of them
+# with more than one format, each format's outputs go in a subdirectory named after it since RMD charges would otherwise share a .rmd with PDF and DOCX charges rendered through R
+class FormatWriter:
+
+    # writer is the OutputWriter or BundleWriter the outputs are handed to, subdirectories are created under output_directory unless it is None
+    def __init__(self, writer, output_formats:list[str], output_directory:str | None = "") -> None:
+        self.writer = writer
+        self.output_formats:list[str] = output_formats
+        self.subdirectories:bool = len(output_formats) > 1
+        if self.subdirectories and output_directory is not None:
+            for output_format in output_formats:
+                os.makedirs(os.path.join(output_directory, output_format.lower()), exist_ok=True)
+
+    def write(self, dc:tuple) -> None:
+        vital_information:DraftCharge = dc[2]
+        stem:str = dc[0][:-len(templates.OUTPUT_SUFFIXES[vital_information.output_format])]
+        for output_format in self.output_formats:
+            formatted:DraftCharge = DraftCharge.from_tuple((output_format,) + vital_information.as_tuple()[1:])
+            dc_file_name:str = stem + templates.OUTPUT_SUFFIXES[output_format]
+            if self.subdirectories:
+                dc_file_name = os.path.join(output_format.lower(), dc_file_name)
+            self.writer.write((dc_file_name, templates.render(output_format, formatted), formatted))
+        return None
+
+    # dc_file_name is the output name the charge's own output format gave it, removed in every format written for it
+    def remove(self, dc_file_name:str) -> None:
+        stem:str = next(dc_file_name[:-len(suffix)] for suffix in templates.OUTPUT_SUFFIXES.values() if dc_file_name.endswith(suffix))
+        for output_format in self.output_formats:
+            formatted_file_name:str = stem + templates.OUTPUT_SUFFIXES[output_format]
+            self.writer.remove(os.path.join(output_format.lower(), formatted_file_name) if self.subdirectories else formatted_file_name)
+        return None
+
+    def flush(self) -> None:
+        self.writer.flush()
+        return None
+
+    def close(self) -> None:
+        self.writer.close()
+        return None
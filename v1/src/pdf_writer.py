@@ -0,0 +1,207 @@
+# PDF writer --> lays draft charges out directly as PDF pages set in the standard Times fonts, one charge per document or many streamed into one, with no renderer process
+
+import io
+import zlib
+from functools import cache, lru_cache
+from typing import BinaryIO
+from records import DraftCharge
+import layout
+
+WRITER_VERSION:int = 1 # bump whenever the way charges are set changes, so cached PDFs are not reused, changes to a jurisdiction's layout are picked up by themselves
+PAGE_WIDTH:float = 595.28 # A4, in points
+PAGE_HEIGHT:float = 841.89
+MARGIN:float = 72.0
+FONT_SIZE:float = 12.0
+LEADING:float = 15.0 # baseline to baseline
+UNDERLINE_OFFSET:float = 2.0
+TEXT_WIDTH:float = PAGE_WIDTH - 2 * MARGIN
+WIDTH_CACHE_SIZE:int = 65536 # words measured, names, statutes and the words of charge paragraphs repeat across a corpus
+
+# advance widths in thousandths of the font size of the printable ASCII characters, space to tilde, from the Adobe font metrics of the standard 14 fonts
+TIMES_ROMAN_WIDTHS:tuple[int, ...] = (
+    250, 333, 408, 500, 500, 833, 778, 180, 333, 333, 500, 564, 250, 333, 250, 278,
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 278, 278, 564, 564, 564, 444,
+    921, 722, 667, 667, 722, 611, 556, 722, 722, 333, 389, 722, 611, 889, 722, 722,
+    556, 722, 667, 556, 611, 722, 722, 944, 722, 722, 611, 333, 278, 333, 469, 500,
+    333, 444, 500, 444, 500, 444, 333, 500, 500, 278, 278, 500, 278, 778, 500, 500,
+    500, 500, 333, 389, 278, 500, 500, 722, 500, 500, 444, 480, 200, 480, 541,
+)
+TIMES_BOLD_WIDTHS:tuple[int, ...] = (
+    250, 333, 555, 500, 500, 1000, 833, 278, 333, 333, 500, 570, 250, 333, 250, 278,
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 333, 333, 570, 570, 570, 500,
+    930, 722, 667, 722, 722, 667, 611, 778, 778, 389, 500, 778, 667, 944, 722, 778,
+    611, 778, 722, 556, 667, 722, 722, 1000, 722, 722, 667, 333, 278, 333, 581, 500,
+    333, 500, 556, 444, 556, 444, 333, 500, 556, 278, 333, 556, 278, 833, 556, 500,
+    556, 556, 444, 389, 333, 556, 500, 722, 500, 500, 444, 394, 220, 394, 520,
+)
+TIMES_ITALIC_WIDTHS:tuple[int, ...] = (
+    250, 333, 420, 500, 500, 833, 778, 214, 333, 333, 500, 675, 250, 333, 250, 278,
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 333, 333, 675, 675, 675, 500,
+    920, 611, 611, 667, 722, 611, 611, 722, 722, 333, 444, 667, 556, 833, 667, 722,
+    611, 722, 611, 500, 556, 722, 611, 833, 611, 556, 556, 389, 278, 389, 422, 500,
+    333, 500, 500, 444, 500, 444, 278, 500, 500, 278, 278, 444, 278, 722, 500, 500,
+    500, 500, 389, 389, 278, 500, 444, 667, 444, 444, 389, 400, 275, 400, 541,
+)
+DEFAULT_WIDTH:int = 500 # characters beyond ASCII, close enough for wrapping
+
+# font --> (resource name, base font, width of each byte in WinAnsiEncoding)
+FONTS:dict[str, tuple[bytes, bytes, tuple[int, ...]]] = {
+    "regular": (b"F1", b"Times-Roman", (DEFAULT_WIDTH,) * 32 + TIMES_ROMAN_WIDTHS + (DEFAULT_WIDTH,) * 129),
+    "bold": (b"F2", b"Times-Bold", (DEFAULT_WIDTH,) * 32 + TIMES_BOLD_WIDTHS + (DEFAULT_WIDTH,) * 129),
+    "italic": (b"F3", b"Times-Italic", (DEFAULT_WIDTH,) * 32 + TIMES_ITALIC_WIDTHS + (DEFAULT_WIDTH,) * 129),
+}
+STYLE_FONTS:dict[str, str] = {"heading": "bold", "centred": "bold", "left": "regular", "space": "regular"}
+
+# objects 1 and 2 are the catalog and page tree, written last once every page is known, the fonts follow the header so every page can share them
+CATALOG_OBJECT:int = 1
+PAGES_OBJECT:int = 2
+FIRST_FONT_OBJECT:int = 3
+FONT_RESOURCES:bytes = b"<< /Font << " + b" ".join(b"/%s %d 0 R" % (resource, FIRST_FONT_OBJECT + i) for i, (resource, _, _) in enumerate(FONTS.values())) + b" >> >>"
+PDF_HEADER:bytes = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n" # the binary comment marks the file as binary to transfer programs
+
+# ---
+
+# DONE ✅ 
+# each block of a jurisdiction's layout.charge_layout as its style and (font, text) runs, compiled on its first charge and shared by every charge after it
+@cache
+def compiled_layout(jurisdiction:str) -> tuple[tuple[str, list[tuple[str, str]]], ...]:
+    return tuple((style, [("italic" if italic else STYLE_FONTS[style], run) for italic, run in layout.italic_runs(text)]) for style, text in layout.charge_layout(jurisdiction))
+
+# DONE ✅ 
+# characters outside WinAnsiEncoding are replaced by ?, and the string delimiters and backslash are escaped
+def pdf_string(text:str) -> bytes:
+    return text.encode("cp1252", "replace").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+# DONE ✅ 
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def text_width(font:str, text:str) -> float:
+    widths:tuple[int, ...] = FONTS[font][2]
+    return sum(widths[byte] for byte in text.encode("cp1252", "replace")) * FONT_SIZE / 1000
+
+# DONE ✅ 
+# greedy line breaking over the words of (font, text) runs, each line is a list of (font, text) pieces and its width
+# a word wider than a whole line is left to overflow it rather than broken
+def wrap_runs(runs:list[tuple[str, str]]) -> list[tuple[list[tuple[str, str]], float]]:
+    lines:list[tuple[list[tuple[str, str]], float]] = []
+    pieces:list[tuple[str, str]] = []
+    width:float = 0.0
+    for font, text in runs:
+        for word in text.split():
+            word_width:float = text_width(font, word)
+            space_width:float = text_width(font, " ") if pieces else 0.0
+            if pieces and width + space_width + word_width > TEXT_WIDTH:
+                lines.append((pieces, width))
+                pieces, width, space_width = [], 0.0, 0.0
+            if pieces and pieces[-1][0] == font:
+                pieces[-1] = (font, f"{pieces[-1][1]} {word}")
+            else:
+                pieces.append((font, f" {word}" if pieces else word))
+            width += space_width + word_width
+    if pieces:
+        lines.append((pieces, width))
+    return lines
+
+# ---
+
+# DONE ✅ 
+# writes PDF objects to a binary stream as charges are added, keeping only the offset of each object and the page list in memory
+# every charge starts on a new page and runs onto further pages if it does not fit on one, close writes the page tree, outline, cross-reference table and trailer
+class PdfDocument:
+
+    def __init__(self, fhand:BinaryIO) -> None:
+        self.fhand:BinaryIO = fhand
+        self.position:int = 0 # bytes written so far, streams such as pipes cannot tell
+        self.offsets:dict[int, int] = {} # object number --> offset of the object in the file
+        self.pages:list[int] = [] # object number of each page in order
+        self.outline:list[tuple[str, int]] = [] # (title, object number of its first page) of each charge given a title
+        self.next_object:int = FIRST_FONT_OBJECT + len(FONTS)
+        self.write(PDF_HEADER)
+        for i, (_, base_font, _) in enumerate(FONTS.values()):
+            self.write_object(FIRST_FONT_OBJECT + i, b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % base_font)
+
+    def write(self, data:bytes) -> None:
+        self.fhand.write(data)
+        self.position += len(data)
+        return None
+
+    def write_object(self, number:int, body:bytes) -> None:
+        self.offsets[number] = self.position
+        self.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        return None
+
+    def reserve_object(self) -> int:
+        self.next_object += 1
+        return self.next_object - 1
+
+    # lays out one charge, a title adds it to the document's outline
+    def add_charge(self, vital_information:DraftCharge, title:str | None = None) -> None:
+        fields:dict = vital_information.as_dict()
+        content:list[bytes] = []
+        y:float = PAGE_HEIGHT - MARGIN - FONT_SIZE
+        first_page:int = len(self.pages)
+        for style, runs in compiled_layout(vital_information.jurisdiction):
+            if style == "space":
+                y -= LEADING
+                continue
+            for pieces, width in wrap_runs([(font, text.format(**fields)) for font, text in runs]):
+                if y < MARGIN:
+                    self.add_page(content)
+                    content, y = [], PAGE_HEIGHT - MARGIN - FONT_SIZE
+                x:float = MARGIN if style == "left" else MARGIN + max(0.0, (TEXT_WIDTH - width) / 2)
+                content.append(b"BT 1 0 0 1 %.2f %.2f Tm" % (x, y))
+                for font, text in pieces:
+                    content.append(b"/%s %g Tf (%s) Tj" % (FONTS[font][0], FONT_SIZE, pdf_string(text)))
+                content.append(b"ET")
+                if style == "heading":
+                    content.append(b"0.6 w %.2f %.2f m %.2f %.2f l S" % (x, y - UNDERLINE_OFFSET, x + width, y - UNDERLINE_OFFSET))
+                y -= LEADING
+        self.add_page(content)
+        if title is not None:
+            self.outline.append((title, self.pages[first_page]))
+        return None
+
+    def add_page(self, content:list[bytes]) -> None:
+        stream:bytes = zlib.compress(b"\n".join(content))
+        content_object:int = self.reserve_object()
+        page_object:int = self.reserve_object()
+        self.write_object(content_object, b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+        self.write_object(page_object, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] /Resources %s /Contents %d 0 R >>" % (PAGES_OBJECT, PAGE_WIDTH, PAGE_HEIGHT, FONT_RESOURCES, content_object))
+        self.pages.append(page_object)
+        return None
+
+    # writes the outline as a flat list of items, one per titled charge, each opening at the charge's first page
+    def write_outline(self) -> int:
+        outline_object:int = self.reserve_object()
+        items:list[int] = [self.reserve_object() for _ in self.outline]
+        for i, (title, page_object) in enumerate(self.outline):
+            links:bytes = b""
+            if i > 0:
+                links += b" /Prev %d 0 R" % items[i - 1]
+            if i < len(items) - 1:
+                links += b" /Next %d 0 R" % items[i + 1]
+            self.write_object(items[i], b"<< /Title (%s) /Parent %d 0 R%s /Dest [%d 0 R /XYZ null null null] >>" % (pdf_string(title), outline_object, links, page_object))
+        self.write_object(outline_object, b"<< /Type /Outlines /First %d 0 R /Last %d 0 R /Count %d >>" % (items[0], items[-1], len(items)))
+        return outline_object
+
+    def close(self) -> None:
+        catalog:bytes = b"<< /Type /Catalog /Pages %d 0 R >>" % PAGES_OBJECT
+        if self.outline:
+            catalog = b"<< /Type /Catalog /Pages %d 0 R /Outlines %d 0 R /PageMode /UseOutlines >>" % (PAGES_OBJECT, self.write_outline())
+        self.write_object(PAGES_OBJECT, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % page for page in self.pages), len(self.pages)))
+        self.write_object(CATALOG_OBJECT, catalog)
+        xref_offset:int = self.position
+        entries:list[bytes] = [b"0000000000 65535 f \n"] + [b"%010d 00000 n \n" % self.offsets[number] for number in range(1, self.next_object)]
+        self.write(b"xref\n0 %d\n%s" % (self.next_object, b"".join(entries)))
+        self.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (self.next_object, CATALOG_OBJECT, xref_offset))
+        return None
+
+# ---
+
+# DONE ✅ 
+# a whole PDF holding a single charge
+def render(vital_information:DraftCharge) -> bytes:
+    stream = io.BytesIO()
+    document:PdfDocument = PdfDocument(stream)
+    document.add_charge(vital_information)
+    document.close()
+    return stream.getvalue()
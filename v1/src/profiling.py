@@ -0,0 +1,137 @@
+# Profiling --> per-stage timers, counters and Chrome trace spans showing where a run spends its time, nothing is instrumented until enable is called
+
+import os
+import json
+import time
+import threading
+from collections.abc import Callable
+import lexer as lx
+import interpreter as inter
+import templates
+import source
+import output
+import bundle
+import export
+import index
+import renderer
+import cache
+import atomic
+import compiled
+
+# stages are timed by replacing the functions below with timed wrappers when profiling is enabled, so a run without --profile or --trace runs the original functions untouched
+# each entry is (module or class, function name, stage, counter), the counter maps the call's arguments and result to the counts it adds
+INSTRUMENTED:list[tuple[object, str, str, Callable | None]] = [
+    (source.SourceFile, "__init__", "read", lambda args, result: {"files": 1, "bytes read": len(args[0].buffer)}),
+    (lx, "lexer", "lex", lambda args, result: {"tokens": len(result)}),
+    (inter, "interpret_charge", "interpret", lambda args, result: {"charges": 1, "invalid charges": result is None}),
+    (compiled, "load", "dcc load", lambda args, result: {"charges read from .dcc": len(result) if result is not None else 0}),
+    (compiled, "store", "dcc store", None),
+    (templates, "render", "generate", None),
+    (output.OutputWriter, "write", "write", lambda args, result: {"outputs": 1}),
+    (bundle.BundleWriter, "write", "write", lambda args, result: {"outputs": 1}),
+    (export.ExportWriter, "write", "export", lambda args, result: {"charges exported": 1}),
+    (index.IndexWriter, "write", "index", lambda args, result: {"charges indexed": 1}),
+    (atomic, "write_atomic", "write file", lambda args, result: {"files written": 1, "bytes written": len(args[1])}),
+    (cache.OutputCache, "fetch", "cache", lambda args, result: {"cache hits": bool(result)}),
+    (renderer.RendererPool, "render", "render (subprocess)", lambda args, result: {"renders": 1, "render failures": result[1].exit_status != 0}),
+]
+
+# ---
+
+# DONE ✅ 
+# totals of every instrumented stage, plus the spans of each call when tracing
+class Profile:
+
+    def __init__(self, trace:bool) -> None:
+        self.lock = threading.Lock() # the render and write file stages run on the render and write pools' threads
+        self.seconds:dict[str, float] = {}
+        self.calls:dict[str, int] = {}
+        self.counters:dict[str, int] = {}
+        self.spans:list[tuple] | None = [] if trace else None # (stage, start ns, end ns, thread id)
+        self.start:int = time.perf_counter_ns()
+        self.originals:list[tuple[object, str, Callable]] = []
+
+    def record(self, stage:str, start:int, end:int, counts:dict | None) -> None:
+        with self.lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + (end - start) / 1e9
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+            if counts:
+                for counter, value in counts.items():
+                    self.counters[counter] = self.counters.get(counter, 0) + int(value)
+            if self.spans is not None:
+                self.spans.append((stage, start, end, threading.get_ident()))
+
+    def timed(self, function:Callable, stage:str, counter:Callable | None) -> Callable:
+        def timed_function(*args, **kwargs):
+            start:int = time.perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            except Exception:
+                self.record(stage, start, time.perf_counter_ns(), {f"{stage} errors": 1}) # such as charge blocks that do not lex
+                raise
+            self.record(stage, start, time.perf_counter_ns(), counter(args, result) if counter is not None else None)
+            return result
+        timed_function.__wrapped__ = function
+        return timed_function
+
+    def instrument(self) -> None:
+        for owner, name, stage, counter in INSTRUMENTED:
+            function:Callable = getattr(owner, name)
+            self.originals.append((owner, name, function))
+            setattr(owner, name, self.timed(function, stage, counter))
+
+    def uninstrument(self) -> None:
+        for owner, name, function in reversed(self.originals):
+            setattr(owner, name, function)
+        self.originals.clear()
+
+    # stages nest (cache and write file run inside write, generate inside a bundle's write), so their times overlap and do not add up to the wall time
+    def report(self) -> None:
+        wall:float = (time.perf_counter_ns() - self.start) / 1e9
+        print(f"DC4U profile ({wall:.3f}s wall time):")
+        print(f"  {'stage':<22} {'calls':>10} {'seconds':>10} {'% wall':>8} {'us/call':>10}")
+        for stage, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            calls:int = self.calls[stage]
+            print(f"  {stage:<22} {calls:>10} {seconds:>10.4f} {seconds / wall * 100 if wall else 0:>7.1f}% {seconds / calls * 1e6:>10.1f}")
+        for counter, value in self.counters.items():
+            print(f"  {counter:<22} {value:>10}")
+
+    # Chrome trace event format, opened with chrome://tracing or https://ui.perfetto.dev
+    def write_trace(self, trace_path:str) -> None:
+        pid:int = os.getpid()
+        thread_ids:dict[int, int] = {}
+        events:list[dict] = []
+        for stage, start, end, thread in self.spans or []:
+            tid:int = thread_ids.setdefault(thread, len(thread_ids))
+            events.append({"name": stage, "cat": "dc4u", "ph": "X", "ts": (start - self.start) / 1e3, "dur": (end - start) / 1e3, "pid": pid, "tid": tid})
+        for thread, tid in thread_ids.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "main" if thread == threading.main_thread().ident else f"worker {tid}"}})
+        with open(trace_path, "w") as fhand:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fhand)
+        print(f"DC4U has written a trace of {len(self.spans or [])} spans to {trace_path}")
+
+# ---
+
+active_profile:Profile | None = None
+
+# DONE ✅ 
+def enable(trace:bool = False) -> Profile:
+    global active_profile
+    if active_profile is None:
+        active_profile = Profile(trace)
+        active_profile.instrument()
+    return active_profile
+
+# DONE ✅ 
+# prints the summary and writes the trace if asked for, then restores the original functions
+def finish(summary:bool, trace_path:str | None) -> None:
+    global active_profile
+    if active_profile is None:
+        return None
+    active_profile.uninstrument()
+    if summary:
+        active_profile.report()
+    if trace_path:
+        active_profile.write_trace(trace_path)
+    active_profile = None
+    return None
@@ -0,0 +1,92 @@
+# Records --> compact typed records passed between the lexer, interpreter and generators in place of per-token and per-charge dicts
+
+# ---
+
+# DONE ✅ 
+# kind is one of the integer token kinds defined in lexer, tokens are interned and shared between token arrays so are never modified
+class Token:
+
+    __slots__ = ("kind", "value")
+
+    def __init__(self, kind:int, value:str) -> None:
+        self.kind:int = kind
+        self.value:str = value
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.value!r})"
+
+    def __eq__(self, other:object) -> bool:
+        return isinstance(other, Token) and self.kind == other.kind and self.value == other.value
+
+# ---
+
+DEFAULT_JURISDICTION:str = "singapore" # jurisdiction a charge is laid out for when none is chosen, see jurisdictions
+
+# fields of a draft charge, in the order they are reported
+# the suspect's date of birth and address and where the offense took place are only filled in for jurisdictions whose sections ask for them, see sections.ADDRESS_SECTIONS
+DRAFT_CHARGE_FIELDS:tuple[str, ...] = (
+    "output_format",
+    "suspect_name",
+    "suspect_nric",
+    "suspect_race",
+    "suspect_age",
+    "suspect_gender",
+    "suspect_nationality",
+    "charge_title",
+    "offense_date",
+    "charge_explanation",
+    "statute",
+    "charging_officer",
+    "role_div",
+    "charging_date",
+    "jurisdiction",
+    "suspect_dob",
+    "suspect_address",
+    "charge_location",
+)
+
+# DONE ✅ 
+# vital information recorded for a single draft charge, fields left empty ("" or an age of 0) have not been provided
+class DraftCharge:
+
+    __slots__ = DRAFT_CHARGE_FIELDS
+
+    def __init__(self) -> None:
+        self.output_format:str = ""
+        self.suspect_name:str = ""
+        self.suspect_nric:str = ""
+        self.suspect_race:str = ""
+        self.suspect_age:int = 0
+        self.suspect_gender:str = ""
+        self.suspect_nationality:str = ""
+        self.charge_title:str = ""
+        self.offense_date:str = ""
+        self.charge_explanation:str = ""
+        self.statute:str = ""
+        self.charging_officer:str = ""
+        self.role_div:str = ""
+        self.charging_date:str = ""
+        self.jurisdiction:str = DEFAULT_JURISDICTION
+        self.suspect_dob:str = ""
+        self.suspect_address:str = ""
+        self.charge_location:str = ""
+
+    def __repr__(self) -> str:
+        return f"DraftCharge({', '.join(f'{field}={getattr(self, field)!r}' for field in DRAFT_CHARGE_FIELDS)})"
+
+    def __eq__(self, other:object) -> bool:
+        return isinstance(other, DraftCharge) and self.as_tuple() == other.as_tuple()
+
+    # inverse of as_tuple
+    @classmethod
+    def from_tuple(cls, values:tuple) -> "DraftCharge":
+        draft_charge:DraftCharge = cls.__new__(cls)
+        for field, value in zip(DRAFT_CHARGE_FIELDS, values):
+            setattr(draft_charge, field, value)
+        return draft_charge
+
+    def as_tuple(self) -> tuple:
+        return tuple(getattr(self, field) for field in DRAFT_CHARGE_FIELDS)
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in DRAFT_CHARGE_FIELDS}
@@ -0,0 +1,122 @@
+# Renderer --> renders .rmd files to PDF/DOCX through a bounded pool of long-lived render worker processes
+
+import os
+import sys
+import time
+import shlex
+import queue
+import threading
+import subprocess
+from concurrent.futures import Future
+from typing import NamedTuple
+
+# command that starts one render worker, overridable with the DC4U_RENDERER environment variable to point at another renderer
+# a worker reads one path per line on stdin and replies with a line starting with DC4U-OK or DC4U-ERR per path
+RENDER_WORKER:list[str] = ["Rscript", os.path.join(os.path.dirname(os.path.abspath(__file__)), "render_worker.R")]
+QUEUE_PER_WORKER:int = 4 # queued jobs per worker before submit blocks
+
+# ---
+
+class RenderResult(NamedTuple):
+    file_name:str
+    exit_status:int # 0 once rendered, 1 when the renderer reported an error, the worker's exit code if it died
+    message:str
+    seconds:float
+
+# ---
+
+# DONE ✅ 
+def render_command() -> list[str]:
+    if os.environ.get("DC4U_RENDERER"):
+        return shlex.split(os.environ["DC4U_RENDERER"])
+    return RENDER_WORKER
+
+# ---
+
+# DONE ✅ 
+# pool of render workers fed from a bounded job queue, each worker stays alive across documents so the renderer starts up once per worker rather than once per file
+class RendererPool:
+
+    def __init__(self, size:int = 2, command:list[str] | None = None) -> None:
+        self.command:list[str] = command or render_command()
+        self.jobs:queue.Queue = queue.Queue(maxsize=size * QUEUE_PER_WORKER)
+        self.results:list[RenderResult | None] = []
+        self.threads:list[threading.Thread] = [threading.Thread(target=self.work, daemon=True) for _ in range(size)]
+        for thread in self.threads:
+            thread.start()
+
+    # queues a file for rendering, blocking while the queue is full
+    def submit(self, file_name:str) -> None:
+        self.results.append(None)
+        self.jobs.put((len(self.results) - 1, file_name))
+
+    # queues a file for rendering and returns a future of its result, for callers waiting on their own files rather than on everything queued
+    # its result is not returned by flush or close
+    def submit_future(self, file_name:str) -> Future:
+        future:Future = Future()
+        self.jobs.put((future, file_name))
+        return future
+
+    # waits for every queued file and returns their results in submission order, the workers stay up for further files
+    def flush(self) -> list[RenderResult]:
+        self.jobs.join()
+        results:list[RenderResult] = self.results
+        self.results = []
+        return results
+
+    # waits for every queued file and stops the workers, returning the results since the last flush
+    def close(self) -> list[RenderResult]:
+        for _ in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads:
+            thread.join()
+        return self.results
+
+    def spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    # runs on one thread per worker process
+    def work(self) -> None:
+        process:subprocess.Popen | None = None
+        while (job := self.jobs.get()) is not None:
+            index, file_name = job
+            process, result = self.render(process, file_name)
+            if isinstance(index, Future):
+                index.set_result(result)
+            else:
+                self.results[index] = result
+            self.jobs.task_done()
+        self.jobs.task_done()
+        if process is not None:
+            process.stdin.close()
+            process.wait()
+
+    # sends one file to the worker process, starting it if needed, returns None in place of the process if it died mid-document
+    def render(self, process:subprocess.Popen | None, file_name:str) -> tuple[subprocess.Popen | None, RenderResult]:
+        start:float = time.perf_counter()
+        try:
+            if process is None:
+                process = self.spawn()
+            process.stdin.write(f"{file_name}\n")
+            process.stdin.flush()
+            reply:str = ""
+            while not reply.startswith(("DC4U-OK", "DC4U-ERR")):
+                reply = process.stdout.readline()
+                if reply == "":
+                    raise BrokenPipeError("render worker exited")
+        except OSError as e:
+            exit_status:int = process.wait() if process is not None else 127
+            return None, RenderResult(file_name, exit_status or 1, str(e), time.perf_counter() - start)
+        if reply.startswith("DC4U-OK"):
+            return process, RenderResult(file_name, 0, "", time.perf_counter() - start)
+        return process, RenderResult(file_name, 1, reply[len("DC4U-ERR"):].strip(), time.perf_counter() - start)
+
+# ---
+
+# DONE ✅ 
+def report(results:list[RenderResult]) -> None:
+    for result in results:
+        if result.exit_status == 0:
+            print(f"DC4U has created your file: {result.file_name} (rendered in {result.seconds:.2f}s)")
+        else:
+            print(f"DC4U could not render {result.file_name} (exit status {result.exit_status}): {result.message}", file=sys.stderr)
@@ -0,0 +1,158 @@
+# Sections --> the sections of a draft charge as data, each delimiter pair mapped to the fields its arguments fill and the errors it reports, interpreted by interpreter.interpret_charge
+
+from operator import attrgetter
+from functools import cache
+from typing import NamedTuple
+import lexer as lx
+import templates
+import jurisdictions
+
+# adding a section means adding its delimiter tokens to lexer.grammer_pattern, its fields to records.DraftCharge and its entry to SECTIONS here
+# a jurisdiction whose charges are written with other fields names its own table of sections, as ADDRESS_SECTIONS
+
+# ---
+
+# kind is how the argument is converted and validated, "text" is stored as is, "integer" must parse as an int, "date" as a DD/MM/YYYY date and "format" must name an output format
+# missing is reported when the field has not been provided once the whole charge is read
+class Field(NamedTuple):
+    name:str
+    kind:str
+    missing:str
+
+# open_kind and close_kind are the same kind for sections delimited by one character on either side
+# arguments is how the section's words become its fields
+#   "split"  words are joined and split on ; into exactly one argument per field
+#   "whole"  words are joined into the single field, which must not be empty
+#   "token"  the token right after the opening delimiter is the single field, and the closing delimiter must come straight after it
+#   "none"   words are not collected, as in comments
+# errors maps each way the section can be malformed to its (error code, message), messages are formatted with the number of the charge
+class Section(NamedTuple):
+    open_kind:int
+    close_kind:int
+    arguments:str
+    fields:tuple[Field, ...]
+    errors:dict[str, tuple[str, str]]
+
+# ---
+
+SUSPECT_SECTION:Section = Section(lx.L_SUSPECT_INFO, lx.R_SUSPECT_INFO, "split",
+    (
+        Field("suspect_name", "text", "Suspect Name not provided. Please provide one."),
+        Field("suspect_nric", "text", "Suspect NRIC not provided. Please provide one."),
+        Field("suspect_race", "text", "Suspect Race not provided. Please provide one."),
+        Field("suspect_age", "integer", "Suspect Age not provided. Please provide one."),
+        Field("suspect_gender", "text", "Suspect Gender not provided. Please provide one."),
+        Field("suspect_nationality", "text", "Suspect Nationality not provided. Please provide one."),
+    ),
+    {
+        "multiple": ("0015", "Syntax error detected in Draft Charge {count}. Multiple instances of suspect information provided. Please provide one only."),
+        "unmatched open": ("0016", "Syntax error detected in Draft Charge {count}. Unmatched suspect infromation character `<` found."),
+        "unmatched close": ("0017", "Syntax error detected in Draft Charge {count}. Unmatched suspect information character `>` found."),
+        "internal": ("0011", "Error Code 0011. Drop me a message on Github @gongahkia."),
+        "arity": ("0018", "Incomplete information detected in Draft Charge {count}. Wrong number of arguments provided for suspect information. Please provide 6, seperated by semicolons (;)."),
+        "integer": ("0019", "Incorrect information detected in Draft Charge {count}. Please provide a valid integer value for suspect age."),
+    },
+)
+CHARGE_SECTION:Section = Section(lx.L_CHARGE_INFO, lx.R_CHARGE_INFO, "split",
+    (
+        Field("charge_title", "text", "Charge title not provided. Please provide one."),
+        Field("offense_date", "date", "Date of offense not provided. Please provide one."),
+        Field("charge_explanation", "text", "Material facts of Charge not provided. Please provide them."),
+    ),
+    {
+        "multiple": ("0020", "Syntax error detected in Draft Charge {count}. Multiple instances of charge information provided. Please provide one only."),
+        "unmatched open": ("0021", "Syntax error detected in Draft Charge {count}. Unmatched charge information character `[` found."),
+        "unmatched close": ("0022", "Syntax error detected in Draft Charge {count}. Unmatched charge information character `]` found."),
+        "internal": ("0006", "Error Code 0006. Drop me a message on Github @gongahkia."),
+        "arity": ("0023", "Incomplete information detected in Draft Charge {count}. Wrong number of arguments provided for charge information. Please provide 3, seperated by semicolons (;)."),
+    },
+)
+STATUTE_SECTION:Section = Section(lx.STATUTE_INFO, lx.STATUTE_INFO, "whole",
+    (
+        Field("statute", "text", "Statute not provided. Please provide one."),
+    ),
+    {
+        "multiple": ("0025", "Syntax error detected in Draft Charge {count}. Multiple statutes provided. Please provide one only."),
+        "unmatched open": ("0026", "Syntax error detected in Draft Charge {count}. Unmatched statute information character '@' found."),
+        "empty": ("0027", "Syntax error detected in Draft Charge {count}. No arguments were provided between the statute information characters '@'."),
+    },
+)
+OFFICER_SECTION:Section = Section(lx.L_CHARGING_OFFICER_INFO, lx.R_CHARGING_OFFICER_INFO, "split",
+    (
+        Field("charging_officer", "text", "Charging Officer name not provided. Please provide one."),
+        Field("role_div", "text", "Charging Officer appointment and division not specified. Please provide them."),
+        Field("charging_date", "date", "Date of Charge not specified. Please provide one."),
+    ),
+    {
+        "multiple": ("0028", "Syntax error detected in Draft Charge {count}. Multiple instances of charging officer information provided. Please provide one only."),
+        "unmatched open": ("0029", "Syntax error detected in Draft Charge {count}.Unmatched charging officer information character '{{' found."),
+        "unmatched close": ("0030", "Syntax error detected in Draft Charge {count}.Unmatched charging officer information character `}}` found."),
+        "internal": ("0009", "Error Code 0009. Drop me a message on Github @gongahkia."),
+        "arity": ("0031", "Incomplete information detected in Draft Charge {count}. Wrong number of arguments provided for charging officer information. Please provide 3, seperated by semicolons (;)."),
+    },
+)
+FORMAT_SECTION:Section = Section(lx.OUTPUT_FORMAT, lx.OUTPUT_FORMAT, "token",
+    (
+        Field("output_format", "format", "Output format not provided. Please provide one."),
+    ),
+    {
+        "multiple": ("0012", "Syntax error detected in Draft Charge {count}. Multiple output formats provided. Please provide one only."),
+        "format": ("0013", "Unrecognised output format detected in Draft Charge {count}! DC currently supports one of the following [" + "/".join(templates.TEMPLATES) + "]."),
+        "unmatched open": ("0014", "Syntax error detected in Draft Charge {count}. Unmatched output format characters '`' found."),
+    },
+)
+COMMENT_SECTION:Section = Section(lx.COMMENT, lx.COMMENT, "none",
+    (),
+    {
+        "unmatched open": ("0032", "Syntax error detected in Draft Charge {count}. Unmatched comment character '#' found."),
+    },
+)
+
+# the suspect identified by their date of birth and address, and the place of the offense given after its material facts, as charges are written in the UK, India and Australia
+ADDRESS_SUSPECT_SECTION:Section = SUSPECT_SECTION._replace(
+    fields=(
+        Field("suspect_name", "text", "Suspect Name not provided. Please provide one."),
+        Field("suspect_dob", "date", "Suspect Date of Birth not provided. Please provide one."),
+        Field("suspect_address", "text", "Suspect Address not provided. Please provide one."),
+    ),
+    errors=SUSPECT_SECTION.errors | {"arity": ("0018", "Incomplete information detected in Draft Charge {count}. Wrong number of arguments provided for suspect information. Please provide 3 (name, date of birth and address), seperated by semicolons (;).")},
+)
+LOCATION_CHARGE_SECTION:Section = CHARGE_SECTION._replace(
+    fields=CHARGE_SECTION.fields + (Field("charge_location", "text", "Location of offense not provided. Please provide one."),),
+    errors=CHARGE_SECTION.errors | {"arity": ("0023", "Incomplete information detected in Draft Charge {count}. Wrong number of arguments provided for charge information. Please provide 4 (title, date, material facts and location), seperated by semicolons (;).")},
+)
+
+# tables of sections, in the order required fields are checked, words inside nested sections go to the first section listed that is open
+SECTIONS:tuple[Section, ...] = (SUSPECT_SECTION, CHARGE_SECTION, STATUTE_SECTION, OFFICER_SECTION, FORMAT_SECTION, COMMENT_SECTION)
+ADDRESS_SECTIONS:tuple[Section, ...] = (ADDRESS_SUSPECT_SECTION, LOCATION_CHARGE_SECTION, STATUTE_SECTION, OFFICER_SECTION, FORMAT_SECTION, COMMENT_SECTION)
+
+# ---
+
+# DONE ✅ 
+# a table of sections with the lookups interpreter.interpret_charge drives it by
+#   delimiters       token kind --> (index into sections, whether it opens the section), a kind that both opens and closes its section opens it when the section is not already open
+#   collecting       indexes into sections of the sections that collect the words inside them, in the order they are offered a word
+#   required_fields  every field of every section, in the order they are checked once the whole charge is read
+#   required_values  vital information --> tuple of the values of required_fields
+class SectionTable(NamedTuple):
+    sections:tuple[Section, ...]
+    delimiters:dict[int, tuple[int, bool]]
+    collecting:tuple[int, ...]
+    required_fields:tuple[Field, ...]
+    required_values:attrgetter
+
+# DONE ✅ 
+def compile_sections(table:tuple[Section, ...]) -> SectionTable:
+    delimiters:dict[int, tuple[int, bool]] = {}
+    for section_index, section in enumerate(table):
+        delimiters[section.close_kind] = (section_index, False)
+        delimiters[section.open_kind] = (section_index, True)
+    collecting:tuple[int, ...] = tuple(section_index for section_index, section in enumerate(table) if section.arguments in ("split", "whole"))
+    required_fields:tuple[Field, ...] = tuple(field for section in table for field in section.fields)
+    return SectionTable(table, delimiters, collecting, required_fields, attrgetter(*(field.name for field in required_fields)))
+
+# DONE ✅ 
+# the compiled table of a jurisdiction's sections, compiled on the first charge of that jurisdiction and shared by every charge after it
+@cache
+def section_table(jurisdiction:str) -> SectionTable:
+    return compile_sections(jurisdictions.load(jurisdiction).sections)
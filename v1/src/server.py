@@ -0,0 +1,219 @@
+# Server --> long-running compile server that keeps the compiler and render workers warm, answering JSON compile requests over a Unix domain socket or localhost HTTP
+
+import os
+import sys
+import json
+import signal
+import base64
+import shutil
+import tempfile
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import Future
+import interpreter as inter
+import diagnostics as dg
+import source
+import renderer
+import atomic
+import output
+from client import parse_address
+from records import DEFAULT_JURISDICTION
+from jurisdictions import JURISDICTIONS
+
+MAX_REQUEST_BYTES:int = 64 * 1024 * 1024 # largest request body accepted over HTTP
+
+# a request is a JSON object
+#   dc          text of a dc file, required
+#   name        name outputs are written under (default "request")
+#   output_dir  directory under the server's output root outputs are written to, their paths are returned instead of their contents, refused unless the server was started with --serve-output-root
+#   jurisdiction  jurisdiction the charges are laid out for, one of jurisdictions.JURISDICTIONS (default singapore)
+# a response is a JSON object
+#   charges, created   charge blocks read and draft charges created
+#   outputs            {"file", "format", then "contents" (text), "contents_base64" (PDF/DOCX) or "path"}, or {"file", "error"} when rendering failed
+#   diagnostics        every error found, as in --report
+#   error              instead of the above when the request itself is malformed or its outputs cannot be written to output_dir
+
+# ---
+
+# DONE ✅ 
+# compiles requests on the calling thread, rendering PDF/DOCX on a render pool shared by every request
+class CompileService:
+
+    # output_root is the only directory requests may have outputs written under, None returns every output in the response
+    def __init__(self, render_workers:int, output_root:str | None = None) -> None:
+        self.render_pool = renderer.RendererPool(render_workers)
+        self.output_root:str | None = os.path.realpath(output_root) if output_root else None
+        self.lock = threading.Lock() # counts are updated from every connection's thread
+        self.requests:int = 0
+
+    def close(self) -> None:
+        self.render_pool.close()
+
+    # a request line or body, returns the response and whether the request was well formed
+    def handle(self, body:bytes) -> tuple[dict, bool]:
+        try:
+            request:dict = json.loads(body)
+            if not isinstance(request, dict) or not isinstance(request.get("dc"), str):
+                raise ValueError("a request must be a JSON object with the dc text in its dc field")
+            for field in ("name", "output_dir", "jurisdiction"):
+                if request.get(field) is not None and not isinstance(request[field], str):
+                    raise ValueError(f"{field} must be a string")
+            if request.get("jurisdiction", DEFAULT_JURISDICTION) not in JURISDICTIONS:
+                raise ValueError(f"jurisdiction must be one of {', '.join(JURISDICTIONS)}")
+            output_directory:str | None = self.output_directory(request.get("output_dir"))
+        except ValueError as e:
+            return {"error": str(e)}, False
+        with self.lock:
+            self.requests += 1
+        try:
+            return self.compile(request["dc"], os.path.basename(request.get("name") or "") or "request", output_directory, request.get("jurisdiction", DEFAULT_JURISDICTION)), True
+        except (TypeError, ValueError, OSError) as e: # an output_dir that cannot be created or written to
+            return {"error": str(e)}, False
+
+    # a request's output_dir resolved under the output root, symlinks included, so a client cannot have files written anywhere else the server can write
+    def output_directory(self, output_dir:str | None) -> str | None:
+        if not output_dir:
+            return None
+        if self.output_root is None:
+            raise ValueError("output_dir is refused, the server was not started with --serve-output-root")
+        output_directory:str = os.path.realpath(os.path.join(self.output_root, output_dir))
+        if os.path.commonpath([self.output_root, output_directory]) != self.output_root:
+            raise ValueError(f"output_dir must be inside the server's output root {self.output_root}")
+        return output_directory
+
+    # every charge block is compiled as in --keep-going, an invalid charge is reported without stopping the others
+    def compile(self, dc:str, name:str, output_directory:str | None, jurisdiction:str = DEFAULT_JURISDICTION) -> dict:
+        diagnostics:list[dg.Diagnostic] = []
+        outputs:list[dict] = []
+        renders:list[tuple[dict, Future, str]] = [] # (output, render future, rendered file name)
+        charge_total:int = 0
+        created_total:int = 0
+        scratch_directory:str | None = None
+        source_file = source.SourceFile(name, buffer=dc.encode())
+        if output_directory:
+            os.makedirs(output_directory, exist_ok=True)
+        for draft_charge_count, (start, end) in enumerate(source_file.blocks(), start=1):
+            charge_total += 1
+            draft_charge:tuple | None = inter.compile_block(name, source_file.buffer, draft_charge_count, diagnostics, start, end, jurisdiction)
+            if draft_charge is None:
+                continue
+            created_total += 1
+            dc_file_name, contents, vital_information = draft_charge
+            result:dict = {"file": os.path.basename(output.rendered_file_name(dc_file_name)), "format": vital_information.output_format}
+            outputs.append(result)
+            if "|" not in dc_file_name:
+                if output_directory:
+                    result["path"] = os.path.abspath(os.path.join(output_directory, dc_file_name))
+                    atomic.write_atomic(result["path"], contents)
+                elif isinstance(contents, bytes): # written natively
+                    result["contents_base64"] = base64.b64encode(contents).decode()
+                else:
+                    result["contents"] = contents
+                continue
+            if not output_directory:
+                scratch_directory = scratch_directory or tempfile.mkdtemp(prefix="dc4u-server-")
+            target:str = os.path.abspath(os.path.join(output_directory or scratch_directory, dc_file_name))
+            atomic.write_atomic(target.split("|")[0], contents)
+            renders.append((result, self.render_pool.submit_future(target.split("|")[0]), output.rendered_file_name(target)))
+        for result, render, rendered_file_name in renders:
+            render_result:renderer.RenderResult = render.result()
+            if render_result.exit_status != 0 or not os.path.exists(rendered_file_name):
+                result["error"] = f"could not render (exit status {render_result.exit_status}): {render_result.message}"
+            elif output_directory:
+                result["path"] = rendered_file_name
+            else:
+                with open(rendered_file_name, "rb") as fhand:
+                    result["contents_base64"] = base64.b64encode(fhand.read()).decode()
+        if scratch_directory is not None:
+            shutil.rmtree(scratch_directory, ignore_errors=True)
+        dg.locate(source_file, diagnostics)
+        response:dict = dg.build_report(charge_total, created_total, diagnostics)
+        response["outputs"] = outputs
+        return response
+
+# ---
+
+# DONE ✅ 
+# one JSON request per line, answered with one JSON response per line, a connection can send any number of requests
+class UnixRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response, _ = self.server.service.handle(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+# DONE ✅ 
+# POST /compile with a JSON request as the body, GET /health to check the server is up, connections are kept alive between requests
+class HTTPRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True # headers and body are written separately, delayed ACKs would otherwise add 40ms to every reply on a kept-alive connection
+
+    def do_POST(self) -> None:
+        if self.path != "/compile":
+            return self.reply(404, {"error": f"no such endpoint {self.path}, requests are sent to /compile"})
+        if self.headers.get_content_type() != "application/json": # a browser cannot send a cross-site form as JSON without a preflight
+            self.close_connection = True
+            return self.reply(415, {"error": "requests must be sent with Content-Type: application/json"})
+        length:int = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            return self.reply(413, {"error": f"requests are limited to {MAX_REQUEST_BYTES} bytes"})
+        response, well_formed = self.server.service.handle(self.rfile.read(length))
+        self.reply(200 if well_formed else 400, response)
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            return self.reply(404, {"error": f"no such endpoint {self.path}"})
+        self.reply(200, {"ok": True, "requests": self.server.service.requests})
+
+    def reply(self, status:int, response:dict) -> None:
+        body:bytes = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format:str, *args) -> None: # requests are not logged, the compiler's own messages are
+        pass
+
+# ---
+
+def stop(signal_number:int, frame) -> None:
+    raise KeyboardInterrupt
+
+# DONE ✅ 
+# serves until interrupted, the compiler's messages go to stdout as they would for a command line run
+def serve(address:str, render_workers:int, output_root:str | None = None) -> None:
+    service:CompileService = CompileService(render_workers, output_root)
+    parsed_address:tuple[str, int] | str = parse_address(address)
+    if isinstance(parsed_address, str):
+        if os.path.exists(parsed_address): # left behind by a server that did not shut down cleanly
+            os.remove(parsed_address)
+        server = UnixServer(parsed_address, UnixRequestHandler)
+        description:str = f"unix socket {parsed_address}"
+    else:
+        server = ThreadingHTTPServer(parsed_address, HTTPRequestHandler)
+        server.daemon_threads = True
+        description = f"http://{parsed_address[0]}:{server.server_address[1]}"
+    server.service = service
+    signal.signal(signal.SIGTERM, stop) # stopped by a service manager the way Ctrl-C stops it
+    print(f"DC4U is serving compile requests on {description}, press Ctrl-C to stop.", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if isinstance(parsed_address, str) and os.path.exists(parsed_address):
+            os.remove(parsed_address)
+    return None
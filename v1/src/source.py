@@ -0,0 +1,75 @@
+# Source --> memory-mapped dc files, split into charge blocks that are lexed in place and mapped back to lines and columns for diagnostics
+
+import re
+import sys
+import mmap
+import bisect
+from array import array
+from collections.abc import Iterator
+
+STDIN_PATH:str = "-"
+BLOCK_DELIMITER:bytes = b"---"
+WHITESPACE:re.Pattern = re.compile(rb"\s*")
+NEWLINE:re.Pattern = re.compile(rb"\n")
+
+# ---
+
+# DONE ✅ 
+# a dc file held as bytes, memory-mapped so opening it costs the same however large it is, stdin and files that may change underneath (watch mode) are read instead
+# charge blocks are (start, end) spans into buffer, newlines are kept so words on adjacent lines stay apart and every offset is an offset into the file
+class SourceFile:
+
+    __slots__ = ("file_path", "buffer", "fhand", "line_starts")
+
+    def __init__(self, file_path:str, use_mmap:bool = True, buffer:bytes | None = None) -> None:
+        self.file_path:str = file_path
+        self.fhand = None
+        self.line_starts:array | None = None # offset each line starts at, built on first use since only diagnostics need it
+        if buffer is not None: # dc text that did not come from a file, such as a compile server request
+            self.buffer = buffer
+            return
+        if file_path == STDIN_PATH:
+            self.buffer:bytes | mmap.mmap = sys.stdin.buffer.read()
+            return
+        self.fhand = open(file_path, "rb")
+        try:
+            self.buffer = mmap.mmap(self.fhand.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else self.fhand.read()
+        except ValueError: # empty files cannot be mapped
+            self.buffer = b""
+
+    def __enter__(self) -> "SourceFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self.fhand is not None:
+            self.fhand.close()
+            self.fhand = None
+
+    # yields the span of each charge block delimited by ---, starting at its first non-whitespace byte
+    def blocks(self) -> Iterator[tuple[int, int]]:
+        position:int = 0
+        while True:
+            boundary:int = self.buffer.find(BLOCK_DELIMITER, position)
+            end:int = len(self.buffer) if boundary == -1 else boundary
+            yield (WHITESPACE.match(self.buffer, position, end).end(), end)
+            if boundary == -1:
+                return
+            position = boundary + len(BLOCK_DELIMITER)
+
+    # copies of each charge block, for blocks that are handed to another process or kept after the source is closed
+    def block_texts(self) -> Iterator[tuple[int, bytes]]:
+        for start, end in self.blocks():
+            yield (start, self.buffer[start:end])
+
+    # 1-based line and column of a byte offset, the line table is built in a single pass the first time it is needed
+    def line_column(self, offset:int) -> tuple[int, int]:
+        if self.line_starts is None:
+            self.line_starts = array("q", [0])
+            self.line_starts.extend(match_val.end() for match_val in NEWLINE.finditer(self.buffer))
+        line_index:int = bisect.bisect_right(self.line_starts, offset) - 1
+        return (line_index + 1, offset - self.line_starts[line_index] + 1)
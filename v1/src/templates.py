@@ -0,0 +1,168 @@
+# Templates --> compiles each output format's draft charge template once into literal and field segments, rendered by joining them with the charge's vital information
+
+import os
+import hashlib
+from string import Formatter
+from functools import cache
+from collections.abc import Callable
+from records import DraftCharge, DEFAULT_JURISDICTION
+import layout
+import jurisdictions
+import pdf_writer
+import docx_writer
+
+# templates are plain data, {field} placeholders name fields of records.DraftCharge
+# each format's template is built from the parts of a jurisdiction, see jurisdictions.Jurisdiction, and compiled once per jurisdiction on first use
+# adding an output format means adding its template builder and output file suffix here
+
+# DONE ✅ 
+# a jurisdiction's charge paragraph with its *...* runs set in italics by the given tags, or left as they are in R Markdown
+def italics(charge:str, opening:str, closing:str) -> str:
+    return "".join(f"{opening}{run}{closing}" if italic else run for italic, run in layout.italic_runs(charge))
+
+# DONE ✅ 
+# body shared by every R Markdown based format, which differ only in their output front matter
+def r_markdown_body(jurisdiction:jurisdictions.Jurisdiction) -> str:
+    return (
+        "\n---\n\n"
+        + "".join(f"# {heading}\n" for heading in jurisdiction.headings)
+        + f"\n# {jurisdiction.title}\n\n{jurisdiction.addressee} \n\n"
+        + "\n".join(f"**{label}:** {{{field}}}" for label, field in jurisdiction.particulars)
+        + f"\n\n{jurisdiction.charge}\n\n"
+        + "\n".join(jurisdiction.signature)
+        + "\n                            "
+    )
+
+def r_markdown(output:str) -> Callable[[jurisdictions.Jurisdiction], str]:
+    return lambda jurisdiction: f"\n---\noutput: {output}" + r_markdown_body(jurisdiction)
+
+# DONE ✅ 
+def txt_template(jurisdiction:jurisdictions.Jurisdiction) -> str:
+    return (
+        "\n"
+        + "".join(f"{heading}\n" for heading in jurisdiction.headings)
+        + f"\n{jurisdiction.title}\n\n{jurisdiction.addressee} \n\n"
+        + "\n".join(f"{label}: {{{field}}}" for label, field in jurisdiction.particulars)
+        + f"\n\n{italics(jurisdiction.charge, '', '')}\n\n"
+        + "\n".join(jurisdiction.signature)
+        + "\n                            "
+    )
+
+# DONE ✅ 
+def md_template(jurisdiction:jurisdictions.Jurisdiction) -> str:
+    return (
+        "\n"
+        + "".join(f'<h2 align="center"><u>{heading}</u></h2>\n' for heading in jurisdiction.headings)
+        + f'<br>  \n<h2 align="center"><u>{jurisdiction.title}</u></h2>\n\n{jurisdiction.addressee}  \n'
+        + "".join(f'<div align="center"><b>{label}: {{{field}}}</b></div>\n' for label, field in jurisdiction.particulars)
+        + f"<br>\n{italics(jurisdiction.charge, '<i>', '</i>')}  \n<br>  \n<br>\n"
+        + "<br>\n".join(jurisdiction.signature)
+        + "\n    "
+    )
+
+HTML_OPENING:str = """
+<!DOCTYPE HTML>
+<html>
+<head>
+    <title>Draft Charge</title>
+    <meta charset='UTF-8'>
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+</head>
+<body>
+"""
+HTML_CLOSING:str = """
+</body>
+</html>
+    """
+
+# DONE ✅ 
+def html_template(jurisdiction:jurisdictions.Jurisdiction) -> str:
+    return (
+        HTML_OPENING
+        + "\n".join(f'    <h2 align="center"><u>{heading}</u></h2>' for heading in jurisdiction.headings)
+        + f'<br>\n    <h2 align="center"><u>{jurisdiction.title}</u></h2>\n\n    <div>{jurisdiction.addressee}</div>\n'
+        + "\n".join(f'    <div align="center"><b>{label}: {{{field}}}</b></div>' for label, field in jurisdiction.particulars)
+        + f"<br>\n\n    <div>{italics(jurisdiction.charge, '<i>', '</i>')}<br><br></div>\n\n"
+        + "\n".join(f"    <div>{line}</div>" for line in jurisdiction.signature)
+        + HTML_CLOSING
+    )
+
+# output format --> builder of its template source from a jurisdiction's parts, in the order formats are listed to the user
+TEMPLATES:dict[str, Callable[[jurisdictions.Jurisdiction], str]] = {
+    "PDF": r_markdown("pdf_document"),
+    "HTML": html_template,
+    "TXT": txt_template,
+    "MD": md_template,
+    "RMD": r_markdown("[edit accordingly]"),
+    "DOCX": r_markdown("officedown::rdocx_document"),
+}
+
+# output format --> writer producing the whole document as bytes, formats written natively skip their R Markdown template and the render pool
+# DC4U_BACKEND=rmarkdown renders them from their template through R as before
+NATIVE_WRITERS:dict[str, Callable[[DraftCharge], bytes]] = {} if os.environ.get("DC4U_BACKEND") == "rmarkdown" else {
+    "PDF": pdf_writer.render,
+    "DOCX": docx_writer.render,
+}
+
+# output format --> suffix of the generated file name, PDF and DOCX rendered through R are written as .rmd and rendered afterwards
+OUTPUT_SUFFIXES:dict[str, str] = {
+    "PDF": ".pdf" if "PDF" in NATIVE_WRITERS else ".rmd|PDF",
+    "HTML": ".html",
+    "TXT": ".txt",
+    "MD": ".md",
+    "RMD": ".rmd",
+    "DOCX": ".docx" if "DOCX" in NATIVE_WRITERS else ".rmd|DOCX",
+}
+
+# DONE ✅ 
+# changes whenever any of a jurisdiction's templates or a native writer does, so cached outputs rendered from an older template are never reused
+# taken once per jurisdiction on first use, so starting for one jurisdiction never builds the templates of the others
+@cache
+def template_version(jurisdiction:str) -> str:
+    parts:jurisdictions.Jurisdiction = jurisdictions.load(jurisdiction)
+    sources:list[str] = [builder(parts) for builder in TEMPLATES.values()]
+    return hashlib.sha256("\0".join([jurisdiction, *sources, *NATIVE_WRITERS, repr(layout.charge_layout(jurisdiction)), str(pdf_writer.WRITER_VERSION), str(docx_writer.WRITER_VERSION)]).encode()).hexdigest()[:16]
+
+# ---
+
+# DONE ✅ 
+# a template split into its literal text and field segments, compiled into a single f-string expression with the literals bound as constants
+# a Python level join over the segments measured several times slower than the hand-written f-strings this replaced
+class CompiledTemplate:
+
+    __slots__ = ("segments", "render")
+
+    def __init__(self, source:str) -> None:
+        self.segments:list[tuple[bool, str]] = [] # (is_field, literal text or field name)
+        for literal_text, field_name, _, _ in Formatter().parse(source):
+            if literal_text:
+                self.segments.append((False, literal_text))
+            if field_name is not None:
+                self.segments.append((True, field_name))
+        literals:dict[str, str] = {f"_{i}": text for i, (is_field, text) in enumerate(self.segments) if not is_field}
+        if not all(text.isidentifier() for is_field, text in self.segments if is_field):
+            raise ValueError(f"Template fields must be DraftCharge field names: {source}")
+        expression:str = "".join(f"{{vital_information.{text}}}" if is_field else f"{{_{i}}}" for i, (is_field, text) in enumerate(self.segments))
+        namespace:dict = {}
+        exec(f"def render(vital_information):\n    return f{expression!r}\n", literals, namespace)
+        self.render = namespace["render"] # render(vital_information:DraftCharge) -> str
+
+# ---
+
+compiled_templates:dict[tuple[str, str], CompiledTemplate] = {} # (output format, jurisdiction) --> compiled template, filled on first use
+
+# DONE ✅ 
+# a batch mixing jurisdictions compiles each format once per jurisdiction, every later charge reuses it
+def compile_template(output_format:str, jurisdiction:str = DEFAULT_JURISDICTION) -> CompiledTemplate:
+    compiled_template:CompiledTemplate | None = compiled_templates.get((output_format, jurisdiction))
+    if compiled_template is None:
+        compiled_template = compiled_templates[(output_format, jurisdiction)] = CompiledTemplate(TEMPLATES[output_format](jurisdictions.load(jurisdiction)))
+    return compiled_template
+
+# DONE ✅ 
+# the contents of a draft charge's output, bytes for formats written natively
+def render(output_format:str, vital_information:DraftCharge) -> str | bytes:
+    native_writer:Callable[[DraftCharge], bytes] | None = NATIVE_WRITERS.get(output_format)
+    if native_writer is not None:
+        return native_writer(vital_information)
+    return compile_template(output_format, vital_information.jurisdiction).render(vital_information)
@@ -0,0 +1,99 @@
+# Watch --> incremental recompilation of a dc file, only charge blocks whose text changed since the last build are lexed and interpreted again
+
+import io
+import hashlib
+import contextlib
+from collections.abc import Iterable
+import lexer as lx
+import interpreter as inter
+from records import DraftCharge, Token, DEFAULT_JURISDICTION
+
+# ---
+
+# DONE ✅ 
+# what is remembered about one charge block between builds, keyed by the hash of its text
+class CompiledBlock:
+
+    __slots__ = ("token_array", "vital_information", "draft_charge_count", "error_log")
+
+    def __init__(self, token_array:list[Token] | None, vital_information:DraftCharge | None, draft_charge_count:int, error_log:str) -> None:
+        self.token_array:list[Token] | None = token_array # kept only for blocks that fail interpretation, which are re-interpreted if their number changes, None if the block does not lex
+        self.vital_information:DraftCharge | None = vital_information # None if the block is invalid
+        self.draft_charge_count:int = draft_charge_count
+        self.error_log:str = error_log
+
+# ---
+
+# DONE ✅ 
+class IncrementalCompiler:
+
+    def __init__(self, file_name:str, jurisdiction:str = DEFAULT_JURISDICTION) -> None:
+        self.file_name:str = file_name
+        self.jurisdiction:str = jurisdiction
+        self.compiled_blocks:dict[str, CompiledBlock] = {} # block hash --> compiled block
+        self.written:dict[int, str] = {} # draft charge count --> hash of the block its output was last generated from
+        self.outputs:dict[int, str] = {} # draft charge count --> file name its output was last written under
+        self.removed:list[str] = [] # file names of outputs the last build no longer writes, for the writer to delete
+
+    # compiles the blocks that changed since the last build and returns the draft charges whose outputs need rewriting
+    # numbering follows event_loop, blocks that do not lex are reported and skipped without taking a number
+    # diagnostics of invalid blocks are repeated on every build until they are fixed
+    # outputs numbered beyond the blocks left in the file, or whose name changed with their output format, are listed in removed, an invalid block keeps the output it last had
+    def update(self, dc_array:Iterable[bytes]) -> list[tuple]:
+        compiled_blocks:dict[str, CompiledBlock] = {}
+        written:dict[int, str] = {}
+        outputs:dict[int, str] = {}
+        draft_charges:list[tuple] = []
+        draft_charge_count:int = 0
+        for dc in dc_array:
+            block_hash:str = hashlib.sha1(dc).hexdigest()
+            fresh:bool = False
+            if block_hash in compiled_blocks: # a repeated block compiles the same way
+                compiled_block:CompiledBlock = compiled_blocks[block_hash]
+            elif block_hash in self.compiled_blocks:
+                compiled_block = self.compiled_blocks[block_hash]
+            else:
+                compiled_block = self.lex(dc, draft_charge_count + 1)
+                fresh = True
+            compiled_blocks[block_hash] = compiled_block
+            if compiled_block.vital_information is None and compiled_block.token_array is None:
+                print(compiled_block.error_log, end="")
+                continue
+            draft_charge_count += 1
+            if compiled_block.vital_information is None:
+                if compiled_block.draft_charge_count != draft_charge_count: # renumbered, so its diagnostics are too
+                    compiled_block = compiled_blocks[block_hash] = self.interpret(compiled_block.token_array, draft_charge_count)
+                print(compiled_block.error_log, end="")
+                if draft_charge_count in self.outputs:
+                    outputs[draft_charge_count] = self.outputs[draft_charge_count]
+                continue
+            if fresh:
+                print(compiled_block.error_log, end="")
+            written[draft_charge_count] = block_hash
+            if self.written.get(draft_charge_count) != block_hash:
+                draft_charge:tuple | None = inter.generate_charge(self.file_name, draft_charge_count, compiled_block.vital_information)
+                if draft_charge is not None:
+                    draft_charges.append(draft_charge + (compiled_block.vital_information,))
+                    outputs[draft_charge_count] = draft_charge[0]
+            elif draft_charge_count in self.outputs:
+                outputs[draft_charge_count] = self.outputs[draft_charge_count]
+        self.removed = [file_name for count, file_name in self.outputs.items() if outputs.get(count) != file_name]
+        self.compiled_blocks = compiled_blocks # blocks no longer in the file are forgotten
+        self.written = written
+        self.outputs = outputs
+        return draft_charges
+
+    def lex(self, dc:bytes, draft_charge_count:int) -> CompiledBlock:
+        try:
+            token_array:list = lx.lexer(dc)
+        except ValueError as e:
+            return CompiledBlock(None, None, 0, f"Error log: {e}\n") # error logging 
+        return self.interpret(token_array, draft_charge_count)
+
+    def interpret(self, token_array:list, draft_charge_count:int) -> CompiledBlock:
+        error_log = io.StringIO()
+        with contextlib.redirect_stdout(error_log):
+            vital_information:DraftCharge | None = inter.interpret_charge((self.file_name, token_array), draft_charge_count, jurisdiction=self.jurisdiction)
+        if vital_information is None:
+            return CompiledBlock(token_array, None, draft_charge_count, error_log.getvalue())
+        return CompiledBlock(None, vital_information, draft_charge_count, error_log.getvalue())